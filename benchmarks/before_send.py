@@ -0,0 +1,83 @@
+"""Measure the per-message cost of ending sessions before a response is sent, for apps with several configs.
+
+Compares the single hook installed by :class:`OracleDatabasePlugin <litestar_oracledb.OracleDatabasePlugin>` with one
+hook per config, as Litestar would call them, for a response start and a body message of a request. The first config
+holds a connection only in the ``one connection`` case::
+
+    python -m benchmarks.before_send --configs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, cast
+
+from litestar.utils.sync import ensure_async_callable
+
+from litestar_oracledb import AsyncOracleDatabaseConfig
+from litestar_oracledb._utils import set_scope_state
+from litestar_oracledb.plugin import before_send_dispatcher
+
+if TYPE_CHECKING:
+    from litestar.types import BeforeMessageSendHookHandler, Scope
+
+MESSAGES: list[Any] = [
+    {"type": "http.response.start", "status": 200, "headers": []},
+    {"type": "http.response.body", "body": b"ok", "more_body": False},
+]
+
+
+class StubConnection:
+    _impl = object()
+
+    async def close(self) -> None:
+        pass
+
+
+def per_config_hooks(configs: list[AsyncOracleDatabaseConfig]) -> Callable[[Any, Any], Any]:
+    # __post_init__ resolves the handler names into callables
+    hooks = [
+        ensure_async_callable(cast("BeforeMessageSendHookHandler", config.before_send_handler)) for config in configs
+    ]
+
+    async def before_send(message: Any, scope: Any) -> None:
+        for hook in hooks:
+            await hook(message, scope)
+
+    return before_send
+
+
+async def measure(hook: Callable[[Any, Any], Any], key: str | None, number: int) -> float:
+    started = perf_counter()
+    for _ in range(number):
+        scope = cast("Scope", {"type": "http"})
+        if key is not None:
+            set_scope_state(scope, key, StubConnection())
+        for message in MESSAGES:
+            await hook(message, scope)
+    return (perf_counter() - started) / number / len(MESSAGES)
+
+
+async def main(configs: int, number: int) -> None:
+    database_configs = [
+        AsyncOracleDatabaseConfig(pool_app_state_key=f"pool_{i}", connection_scope_key=f"connection_{i}")
+        for i in range(configs)
+    ]
+    hooks = {
+        "per config": per_config_hooks(database_configs),
+        "dispatcher": before_send_dispatcher(database_configs),
+    }
+    for case, key in (("no connection", None), ("one connection", database_configs[0].connection_scope_key)):
+        for name, hook in hooks.items():
+            best = min([await measure(hook, key, number) for _ in range(5)])
+            print(f"{configs} configs, {case:<15} {name:<11} {best * 1e6:8.3f} us/message")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--configs", type=int, default=4, help="configs installed on the app")
+    parser.add_argument("--number", type=int, default=50_000, help="requests per measurement")
+    args = parser.parse_args()
+    asyncio.run(main(args.configs, args.number))
@@ -0,0 +1,86 @@
+"""Compare row-at-a-time inserts with :meth:`AsyncOracleDatabaseConfig.bulk_insert`.
+
+Every call to the database is simulated by a sleep of ``--round-trip`` milliseconds plus ``--per-row`` microseconds
+for each row it carries, standing in for network latency and server-side work::
+
+    python -m benchmarks.bulk --rows 10000 --batch-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Any, AsyncGenerator
+
+from litestar_oracledb import AsyncOracleDatabaseConfig
+
+SQL = "insert into events (id, payload) values (:id, :payload)"
+
+
+class SimulatedCursor:
+    rowcount = 0
+
+    def __init__(self, round_trip: float, per_row: float) -> None:
+        self.round_trip = round_trip
+        self.per_row = per_row
+        self.calls = 0
+
+    async def execute(self, sql: str, parameters: Any) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.round_trip + self.per_row)
+
+    async def executemany(self, sql: str, rows: list[Any], batcherrors: bool = False) -> None:
+        self.calls += 1
+        self.rowcount = len(rows)
+        await asyncio.sleep(self.round_trip + self.per_row * len(rows))
+
+    def getbatcherrors(self) -> list[Any]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class SimulatedConnection:
+    def __init__(self, cursor: SimulatedCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> SimulatedCursor:
+        return self._cursor
+
+
+async def events(count: int) -> AsyncGenerator[dict[str, Any], None]:
+    for i in range(count):
+        yield {"id": i, "payload": f"event {i}"}
+
+
+async def main(rows: int, batch_size: int, round_trip: float, per_row: float) -> None:
+    cursor = SimulatedCursor(round_trip, per_row)
+    started = perf_counter()
+    async for row in events(rows):
+        await cursor.execute(SQL, row)
+    single = perf_counter() - started
+    print(f"row at a time: {single:8.3f} s, {cursor.calls} round trips")
+
+    cursor = SimulatedCursor(round_trip, per_row)
+    config = AsyncOracleDatabaseConfig(pool_instance=object())  # type: ignore[arg-type]
+    started = perf_counter()
+    result = await config.bulk_insert(
+        "events",
+        events(rows),
+        connection=SimulatedConnection(cursor),  # type: ignore[arg-type]
+        batch_size=batch_size,
+    )
+    bulk = perf_counter() - started
+    print(f"bulk_insert:   {bulk:8.3f} s, {result.batches} round trips ({single / bulk:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--round-trip", type=float, default=0.5, help="simulated latency per call in milliseconds")
+    parser.add_argument("--per-row", type=float, default=2.0, help="simulated server time per row in microseconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch_size, args.round_trip / 1000, args.per_row / 1e6))
@@ -0,0 +1,54 @@
+"""Measure the overhead of statement instrumentation.
+
+Runs ``execute`` + ``fetchall`` against an in-process stub cursor, so the numbers only contain the cost added by
+:mod:`litestar_oracledb.instrumentation`, not database latency::
+
+    python -m benchmarks.instrumentation
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from litestar_oracledb.instrumentation import InstrumentedCursor, StatementRecorder
+from litestar_oracledb.metrics import PoolMetrics
+
+ROWS = [(i, f"name {i}") for i in range(100)]
+SQL = "select id, name from users where id > :id"
+
+
+class StubCursor:
+    arraysize = 100
+    description = [("ID",), ("NAME",)]
+    rowcount = 0
+    statement = SQL
+
+    def execute(self, statement: str | None, *args: Any, **kwargs: Any) -> None:
+        self.rowcount = 0
+
+    def fetchall(self) -> list[Any]:
+        self.rowcount = len(ROWS)
+        return ROWS
+
+    def close(self) -> None:
+        pass
+
+
+def run(cursor: Any) -> None:
+    cursor.execute(SQL, id=1)
+    cursor.fetchall()
+
+
+def main(number: int = 200_000) -> None:
+    raw = StubCursor()
+    instrumented = InstrumentedCursor(raw, StatementRecorder("db_pool", PoolMetrics()), "/users", None)  # type: ignore[arg-type]
+    baseline = min(timeit.repeat(lambda: run(raw), number=number, repeat=5)) / number
+    timed = min(timeit.repeat(lambda: run(instrumented), number=number, repeat=5)) / number
+    print(f"raw cursor:          {baseline * 1e6:8.3f} us/statement")
+    print(f"instrumented cursor: {timed * 1e6:8.3f} us/statement")
+    print(f"overhead:            {(timed - baseline) * 1e6:8.3f} us/statement")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare the hot-path latency of a reference-data lookup with and without :class:`QueryCache`.
+
+The query is simulated by a coroutine that sleeps for ``--round-trip`` milliseconds, standing in for one database
+round trip::
+
+    python -m benchmarks.query_cache --round-trip 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Any
+
+from litestar_oracledb.cache import QueryCache
+
+SQL = "select code, name from countries where region_id = :region_id"
+ROWS = [(f"C{i}", f"Country {i}") for i in range(250)]
+
+
+async def measure(lookup: Any, iterations: int) -> float:
+    started = perf_counter()
+    for _ in range(iterations):
+        await lookup()
+    return (perf_counter() - started) / iterations
+
+
+async def main(round_trip: float, iterations: int) -> None:
+    async def query() -> list[Any]:
+        await asyncio.sleep(round_trip)
+        return ROWS
+
+    cache = QueryCache()
+
+    async def cached() -> list[Any]:
+        return await cache.fetch(SQL, {"region_id": 1}, query)
+
+    uncached = await measure(query, iterations)
+    hot = await measure(cached, iterations)
+    print(f"uncached: {uncached * 1e6:10.1f} us/lookup")
+    print(f"cached:   {hot * 1e6:10.1f} us/lookup ({cache.hits} hits, {cache.misses} misses)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--round-trip", type=float, default=0.5, help="simulated query latency in milliseconds")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.round_trip / 1000, args.iterations))
@@ -0,0 +1,226 @@
+"""Measure the per-request cost of the plugin on the request hot path.
+
+A Litestar app is driven straight through its ASGI interface, without a server or HTTP client, against the fake
+pools of :mod:`litestar_oracledb.testing`, whose statements take no time. Each scenario therefore only measures what
+the plugin adds to a request: ``provide_connection``, the scope state helpers and the ``before_send_handler``.
+``no plugin`` is the cost of Litestar itself::
+
+    python -m benchmarks.request_path --requests 5000
+
+Besides requests per second, the peak memory allocated while serving one request and the memory blocks still held
+after serving all of them (a leak shows up as a positive count) are reported, both measured with :mod:`tracemalloc`.
+
+To catch regressions, save the results of a known good revision and compare later runs with them; the run fails if
+a scenario got slower or allocates more than ``--tolerance`` allows::
+
+    python -m benchmarks.request_path --save .benchmarks/request_path.json
+    python -m benchmarks.request_path --compare .benchmarks/request_path.json --tolerance 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+from litestar import Litestar, get
+from litestar.status_codes import HTTP_200_OK
+from oracledb import AsyncConnection, Connection  # noqa: TCH002  # Litestar resolves handler annotations at runtime
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.testing import FakeAsyncConnectionPool, FakeConnectionPool
+
+BASELINE = "no plugin"
+LEAK_SLACK = 100
+
+SCOPE: dict[str, Any] = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.3"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"benchmark")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("benchmark", 80),
+}
+
+
+@get("/bare", sync_to_thread=False)
+def bare() -> str:
+    return "ok"
+
+
+@get("/async")
+async def async_handler(db_connection: AsyncConnection) -> str:  # noqa: ARG001
+    return "ok"
+
+
+@get("/sync", sync_to_thread=False)
+def sync_handler(db_connection: Connection) -> str:  # noqa: ARG001
+    return "ok"
+
+
+@get("/multi")
+async def multi_handler(db_connection: AsyncConnection, reporting_connection: AsyncConnection) -> str:  # noqa: ARG001
+    return "ok"
+
+
+def _async_config(**kwargs: Any) -> AsyncOracleDatabaseConfig:
+    return AsyncOracleDatabaseConfig(pool_instance=FakeAsyncConnectionPool(record_calls=False).as_pool(), **kwargs)
+
+
+def _sync_config(**kwargs: Any) -> SyncOracleDatabaseConfig:
+    return SyncOracleDatabaseConfig(pool_instance=FakeConnectionPool(record_calls=False).as_pool(), **kwargs)
+
+
+SCENARIOS: dict[str, tuple[str, Callable[[], list[Any]]]] = {
+    BASELINE: ("/bare", list),
+    "async default": ("/async", lambda: [_async_config()]),
+    "async autocommit": ("/async", lambda: [_async_config(before_send_handler="autocommit")]),
+    "sync default": ("/sync", lambda: [_sync_config()]),
+    "sync autocommit": ("/sync", lambda: [_sync_config(before_send_handler="autocommit")]),
+    "two async configs": (
+        "/multi",
+        lambda: [
+            _async_config(),
+            _async_config(
+                connection_dependency_key="reporting_connection",
+                pool_dependency_key="reporting_pool",
+                pool_app_state_key="reporting_pool",
+            ),
+        ],
+    ),
+}
+
+
+@dataclass
+class Result:
+    requests_per_second: float
+    microseconds_per_request: float
+    peak_kib_per_request: float
+    retained_blocks: int
+
+
+async def _request(app: Litestar, path: str) -> None:
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app({**SCOPE, "path": path, "raw_path": path.encode(), "state": {}}, receive, send)  # type: ignore[arg-type]
+    if status != HTTP_200_OK:
+        msg = f"GET {path} returned {status}"
+        raise RuntimeError(msg)
+
+
+async def measure(path: str, configs: list[Any], requests: int, repeat: int) -> Result:
+    plugins = [OracleDatabasePlugin(config) for config in configs]
+    app = Litestar(route_handlers=[bare, async_handler, sync_handler, multi_handler], plugins=plugins)
+    async with app.lifespan():
+        for _ in range(min(requests, 200)):
+            await _request(app, path)
+        best = float("inf")
+        for _ in range(repeat):
+            started = perf_counter()
+            for _ in range(requests):
+                await _request(app, path)
+            best = min(best, perf_counter() - started)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            peak = 0
+            for _ in range(min(requests, 200)):
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                await _request(app, path)
+                peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            for _ in range(requests):
+                await _request(app, path)
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return Result(
+        requests_per_second=requests / best,
+        microseconds_per_request=best / requests * 1e6,
+        peak_kib_per_request=peak / 1024,
+        retained_blocks=retained,
+    )
+
+
+def compare(results: dict[str, Result], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    """Return the regressions of ``results`` against ``baseline``.
+
+    When both include ``no plugin``, throughput is compared relative to it, so that results saved on another machine,
+    or under a different load, remain comparable.
+    """
+    regressions = []
+    speed = 1.0
+    if BASELINE in results and BASELINE in baseline:
+        speed = results[BASELINE].requests_per_second / baseline[BASELINE]["requests_per_second"]
+    for name, result in results.items():
+        if (reference := baseline.get(name)) is None:
+            continue
+        expected = reference["requests_per_second"] * speed
+        if name != BASELINE and result.requests_per_second < expected * (1 - tolerance):
+            regressions.append(f"{name}: {result.requests_per_second:,.0f} req/s, expected {expected:,.0f}")
+        if result.peak_kib_per_request > reference["peak_kib_per_request"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: {result.peak_kib_per_request:.1f} KiB/request, was {reference['peak_kib_per_request']:.1f}"
+            )
+        # a few blocks come and go with interpreter caches, a leak retains some on every request
+        if result.retained_blocks > max(reference["retained_blocks"], 0) * (1 + tolerance) + LEAK_SLACK:
+            regressions.append(f"{name}: {result.retained_blocks} blocks retained, was {reference['retained_blocks']}")
+    return regressions
+
+
+async def main(requests: int, repeat: int, only: list[str] | None) -> dict[str, Result]:
+    results = {}
+    print(f"{'scenario':<20} {'req/s':>10} {'us/req':>9} {'peak KiB/req':>13} {'retained blocks':>16}")
+    for name, (path, configs) in SCENARIOS.items():
+        if only and name not in only:
+            continue
+        result = results[name] = await measure(path, configs(), requests, repeat)
+        print(
+            f"{name:<20} {result.requests_per_second:>10,.0f} {result.microseconds_per_request:>9.1f} "
+            f"{result.peak_kib_per_request:>13.1f} {result.retained_blocks:>16}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per scenario, the best one is kept")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="run only these scenarios")
+    parser.add_argument("--save", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="fail if slower or allocating more than these saved results")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression")
+    args = parser.parse_args()
+    results = asyncio.run(main(args.requests, args.repeat, args.scenario))
+    if args.save is not None:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({name: asdict(result) for name, result in results.items()}, indent=2))
+    if args.compare is not None:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
@@ -4,6 +4,7 @@ from litestar_oracledb import exceptions
 from litestar_oracledb.config import (
     AsyncOracleDatabaseConfig,
     AsyncOraclePoolConfig,
+    AsyncRoutingDatabaseConfig,
     SyncOracleDatabaseConfig,
     SyncOraclePoolConfig,
 )
@@ -14,6 +15,7 @@ __all__ = (
     "AsyncOracleDatabaseConfig",
     "SyncOraclePoolConfig",
     "AsyncOraclePoolConfig",
+    "AsyncRoutingDatabaseConfig",
     "OracleDatabasePlugin",
     "exceptions",
 )
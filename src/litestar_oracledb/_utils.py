@@ -7,6 +7,7 @@ if TYPE_CHECKING:
 
 __all__ = (
     "delete_scope_state",
+    "get_scope_namespace",
     "get_scope_state",
     "set_scope_state",
 )
@@ -37,6 +38,18 @@ def get_scope_state(scope: Scope, key: str, default: Any = None, pop: bool = Fal
     return namespace.pop(key, default) if pop else namespace.get(key, default)
 
 
+def get_scope_namespace(scope: Scope) -> dict[str, Any] | None:
+    """Get the internal namespace of connection scope state, without creating it.
+
+    Args:
+        scope: The connection scope.
+
+    Returns:
+        The namespace, or ``None`` if nothing was stored in the scope state.
+    """
+    return scope.get(_SCOPE_NAMESPACE)  # type: ignore[return-value]
+
+
 def set_scope_state(scope: Scope, key: str, value: Any) -> None:
     """Set an internal value in connection scope state.
 
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from litestar_oracledb.instrumentation import fingerprint
+
+if TYPE_CHECKING:
+    from oracledb.connection import AsyncConnection, Connection
+
+__all__ = (
+    "StatementCacheAdvisor",
+    "StatementCacheReport",
+    "UnboundStatement",
+)
+
+logger = logging.getLogger("litestar_oracledb")
+
+_MAX_SESSIONS = 4096
+
+
+@dataclass(frozen=True)
+class UnboundStatement:
+    """A statement run with many different literal values instead of bind variables."""
+
+    fingerprint: str
+    """The statement with its literals replaced by ``?``, see :func:`fingerprint
+    <litestar_oracledb.instrumentation.fingerprint>`."""
+    variants: int
+    """Distinct SQL texts seen for it, each one parsed and cached on its own."""
+    routes: tuple[str, ...]
+    """Routes that ran it."""
+
+
+@dataclass(frozen=True)
+class StatementCacheReport:
+    """Statement cache usage observed by a :class:`StatementCacheAdvisor`."""
+
+    executions: int
+    """Statements executed."""
+    distinct_statements: int
+    """Distinct SQL texts executed."""
+    cache_size: int
+    """The statement cache size of the connections."""
+    hits: int
+    """Executions whose SQL text was still in the statement cache of its connection."""
+    misses: int
+    """Executions that had to parse their SQL text, softly or hard, on their connection."""
+    recommended_size: int
+    """Statement cache size covering the hot working set."""
+    route_cardinality: dict[str, int]
+    """Distinct SQL texts executed per route."""
+    unbound: tuple[UnboundStatement, ...]
+    """Statements that look built by string formatting, most variants first."""
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.executions if self.executions else 0.0
+
+
+@dataclass
+class StatementCacheAdvisor:
+    """Size the statement cache of pooled connections from the SQL texts they actually run.
+
+    Every statement run on an instrumented connection is replayed against a model of the LRU statement cache of its
+    session, which gives the hit ratio ``stmtcachesize`` achieves. The recommended size is the number of distinct SQL
+    texts making up ``coverage`` of the executions, plus ``headroom``. With ``auto_apply``, connections are resized
+    to it as they are acquired.
+
+    SQL texts differing only in literal values are reported, and logged once, when a statement reaches
+    ``literal_variants`` of them: each variant is hard parsed and takes a slot of the cache.
+    """
+
+    coverage: float = 0.95
+    """Share of executions the recommended cache size must serve from the cache."""
+    headroom: float = 1.25
+    """Factor applied to the working set to absorb workload changes."""
+    min_size: int = 20
+    """Smallest recommended size, the python-oracledb default."""
+    max_size: int = 500
+    """Largest recommended size."""
+    auto_apply: bool = False
+    """Set ``stmtcachesize`` of acquired connections to the recommended size."""
+    literal_variants: int = 5
+    """Distinct SQL texts with the same fingerprint after which a statement is reported as unbound."""
+    max_statements: int = 10_000
+    """Distinct SQL texts tracked; further texts are counted as misses only."""
+    update_interval: int = 1_000
+    """Executions between two computations of the recommended size."""
+    cache_size: int = 20
+    """The statement cache size modelled, updated from the connections as they are acquired."""
+    _executions: Counter[str] = field(init=False, default_factory=Counter)
+    _untracked: int = field(init=False, default=0)
+    _variants: Counter[str] = field(init=False, default_factory=Counter)
+    _variant_routes: defaultdict[str, set[str]] = field(init=False, default_factory=lambda: defaultdict(set))
+    _routes: defaultdict[str, set[str]] = field(init=False, default_factory=lambda: defaultdict(set))
+    _sessions: OrderedDict[int, OrderedDict[str, None]] = field(init=False, default_factory=OrderedDict)
+    _hits: int = field(init=False, default=0)
+    _misses: int = field(init=False, default=0)
+    _recommended: int | None = field(init=False, default=None)
+    _since_update: int = field(init=False, default=0)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.coverage <= 1:
+            msg = f"Expected 0 < coverage <= 1, got {self.coverage}"
+            raise ValueError(msg)
+        if not 0 < self.min_size <= self.max_size:
+            msg = f"Expected 0 < min_size <= max_size, got {self.min_size} and {self.max_size}"
+            raise ValueError(msg)
+
+    def observe(self, sql: str, route: str | None = None, session: int | None = None) -> None:
+        """Record an execution of ``sql``.
+
+        Args:
+            sql: The SQL text as executed.
+            route: Route of the request that ran it.
+            session: Identifier of the database session that ran it, see :func:`session_of
+                <litestar_oracledb.instrumentation.session_of>`.
+        """
+        if not sql:
+            return
+        unbound = None
+        with self._lock:
+            self._since_update += 1
+            new = sql not in self._executions
+            tracked = not new or len(self._executions) < self.max_statements
+            if tracked:
+                self._executions[sql] += 1
+                if route is not None:
+                    self._routes[route].add(sql)
+                unbound = self._track_variant(sql, route, new)
+            else:
+                self._untracked += 1
+            self._lookup(sql, session, tracked)
+        if unbound is not None:
+            logger.warning("Statement run with %d different literal values, use bind variables instead: %s", *unbound)
+
+    def _track_variant(self, sql: str, route: str | None, new: bool) -> tuple[int, str] | None:
+        """Count ``sql`` as a variant of its fingerprint, returning the fingerprint once it reaches
+        ``literal_variants``.
+        """
+        key = fingerprint(sql)
+        if route is not None:
+            self._variant_routes[key].add(route)
+        if not new:
+            return None
+        self._variants[key] += 1
+        return (self._variants[key], key) if self._variants[key] == self.literal_variants else None
+
+    def _lookup(self, sql: str, session: int | None, tracked: bool) -> None:
+        """Look ``sql`` up in the modelled cache of ``session``, caching it on a miss."""
+        cache = self._sessions.get(session or 0)
+        if cache is None:
+            cache = self._sessions[session or 0] = OrderedDict()
+            if len(self._sessions) > _MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        if sql in cache:
+            cache.move_to_end(sql)
+            self._hits += 1
+            return
+        self._misses += 1
+        if tracked:
+            cache[sql] = None
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    def recommended_size(self) -> int:
+        """Return the statement cache size covering the hot working set.
+
+        Returns:
+            The size, ``cache_size`` until statements were observed.
+        """
+        with self._lock:
+            if self._recommended is None or self._since_update >= self.update_interval:
+                self._recommended = self._compute_size()
+                self._since_update = 0
+            return self._recommended
+
+    def _compute_size(self) -> int:
+        total = sum(self._executions.values()) + self._untracked
+        if not total:
+            return self.cache_size
+        served, working_set = 0, 0
+        for _, executions in self._executions.most_common():
+            if served >= total * self.coverage:
+                break
+            served += executions
+            working_set += 1
+        return min(max(math.ceil(working_set * self.headroom), self.min_size), self.max_size)
+
+    def attach(self, connection: Connection | AsyncConnection) -> None:
+        """Follow the statement cache size of a connection being acquired, resizing it with ``auto_apply``.
+
+        Args:
+            connection: The connection.
+        """
+        size = connection.stmtcachesize
+        if self.auto_apply and size != (recommended := self.recommended_size()):
+            connection.stmtcachesize = size = recommended
+        if isinstance(size, int) and size != self.cache_size:
+            self.cache_size = size
+
+    def report(self) -> StatementCacheReport:
+        """Return the statement cache usage observed so far."""
+        with self._lock:
+            recommended = self._compute_size()
+            unbound = sorted(
+                (
+                    UnboundStatement(key, variants, tuple(sorted(self._variant_routes[key])))
+                    for key, variants in self._variants.items()
+                    if variants >= self.literal_variants
+                ),
+                key=lambda statement: statement.variants,
+                reverse=True,
+            )
+            return StatementCacheReport(
+                executions=self._hits + self._misses,
+                distinct_statements=len(self._executions),
+                cache_size=self.cache_size,
+                hits=self._hits,
+                misses=self._misses,
+                recommended_size=recommended,
+                route_cardinality={route: len(statements) for route, statements in self._routes.items()},
+                unbound=tuple(unbound),
+            )
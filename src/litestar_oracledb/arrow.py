@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Literal, cast
+
+import oracledb
+
+from litestar_oracledb.exceptions import MissingDependencyError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Generator, Sequence
+    from typing import Any
+
+    from oracledb.connection import AsyncConnection, Connection
+
+__all__ = (
+    "ARROW_MEDIA_TYPES",
+    "ArrowFormat",
+    "encode_batches",
+    "fetch_record_batches",
+    "iter_record_batches",
+)
+
+ArrowFormat = Literal["arrow", "parquet"]
+"""Serialization of streamed record batches: an Arrow IPC stream or a Parquet file."""
+
+ARROW_MEDIA_TYPES: dict[str, str] = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+_INT64_DIGITS = 18
+"""Precision of the largest ``NUMBER(p)`` that always fits in an ``int64``."""
+
+_ARROW_TYPES: dict[str, Callable[[Any], Any]] = {
+    "DB_TYPE_BINARY_INTEGER": lambda pa: pa.int64(),
+    "DB_TYPE_BINARY_FLOAT": lambda pa: pa.float32(),
+    "DB_TYPE_BINARY_DOUBLE": lambda pa: pa.float64(),
+    "DB_TYPE_BOOLEAN": lambda pa: pa.bool_(),
+    "DB_TYPE_CHAR": lambda pa: pa.string(),
+    "DB_TYPE_NCHAR": lambda pa: pa.string(),
+    "DB_TYPE_VARCHAR": lambda pa: pa.string(),
+    "DB_TYPE_NVARCHAR": lambda pa: pa.string(),
+    "DB_TYPE_LONG": lambda pa: pa.string(),
+    "DB_TYPE_ROWID": lambda pa: pa.string(),
+    "DB_TYPE_UROWID": lambda pa: pa.string(),
+    "DB_TYPE_RAW": lambda pa: pa.binary(),
+    "DB_TYPE_LONG_RAW": lambda pa: pa.binary(),
+    "DB_TYPE_DATE": lambda pa: pa.timestamp("us"),
+    "DB_TYPE_TIMESTAMP": lambda pa: pa.timestamp("us"),
+    "DB_TYPE_TIMESTAMP_LTZ": lambda pa: pa.timestamp("us"),
+    "DB_TYPE_TIMESTAMP_TZ": lambda pa: pa.timestamp("us"),
+    "DB_TYPE_INTERVAL_DS": lambda pa: pa.duration("us"),
+}
+"""Arrow types of the Oracle types whose Python values convert unambiguously, by ``DbType`` name."""
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise MissingDependencyError(package="pyarrow", install_package="arrow") from e
+    return pa
+
+
+def _to_batches(pa: Any, data_frame: Any) -> list[Any]:
+    """Convert an oracledb ``DataFrame`` to record batches through the Arrow PyCapsule interface, without copying."""
+    return pa.table(data_frame).to_batches()  # type: ignore[no-any-return]
+
+
+def _column_types(pa: Any, description: Sequence[Any]) -> list[Any]:
+    """Return the Arrow type of each column of ``description``, ``None`` where it is inferred from the first batch."""
+    types = []
+    for column in description:
+        type_code, precision, scale = column[1], column[4], column[5]
+        if type_code is oracledb.DB_TYPE_NUMBER:
+            if scale == 0 and 0 < (precision or 0) <= _INT64_DIGITS:
+                arrow_type = pa.int64()
+            else:
+                arrow_type = None if oracledb.defaults.fetch_decimals else pa.float64()
+        else:
+            factory = _ARROW_TYPES.get(getattr(type_code, "name", ""))
+            arrow_type = factory(pa) if factory is not None else None
+        types.append(arrow_type)
+    return types
+
+
+def _build_batch(pa: Any, schema: Any, rows: Sequence[Sequence[Any]]) -> Any:
+    """Build a record batch of ``schema`` column by column from ``fetchmany`` rows."""
+    columns = list(zip(*rows)) if rows else [()] * len(schema)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema
+    )
+
+
+def _schema(pa: Any, description: Sequence[Any], rows: Sequence[Sequence[Any]]) -> Any:
+    """Return the schema of a result set from its ``description``, inferring the remaining types from its first rows."""
+    columns = list(zip(*rows)) if rows else [()] * len(description)
+    return pa.schema(
+        [
+            pa.field(column[0], arrow_type if arrow_type is not None else pa.array(values).type)
+            for column, arrow_type, values in zip(description, _column_types(pa, description), columns)
+        ]
+    )
+
+
+async def fetch_record_batches(
+    connection: AsyncConnection,
+    sql: str,
+    parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None = None,
+    *,
+    size: int = 10_000,
+) -> AsyncGenerator[Any, None]:
+    """Yield the result set of ``sql`` as ``pyarrow.RecordBatch`` objects of up to ``size`` rows.
+
+    python-oracledb 3 builds the batches natively with ``fetch_df_batches``; older versions fall back to building them
+    column by column from ``fetchmany``, with a schema taken from the cursor description, so that every batch has the
+    same schema even when a column is entirely ``NULL`` in some of them. Only one batch is held in memory at a time.
+
+    Args:
+        connection: The connection to run the query on.
+        sql: The query.
+        parameters: Bind variables of the query.
+        size: Rows per batch.
+
+    Yields:
+        Record batches.
+    """
+    pa = _import_pyarrow()
+    # checked on the type, as a lazy connection dependency must not be acquired by the lookup
+    if hasattr(type(connection), "fetch_df_batches"):
+        data_frames = cast("AsyncIterator[Any]", connection.fetch_df_batches(sql, parameters, size=size))
+        async for data_frame in data_frames:
+            for batch in _to_batches(pa, data_frame):
+                yield batch
+        return
+    cursor = connection.cursor()
+    try:
+        cursor.arraysize = size
+        cursor.prefetchrows = size
+        await cursor.execute(sql, parameters)
+        description = cursor.description or ()
+        rows = await cursor.fetchmany(size)
+        schema = _schema(pa, description, rows)
+        # an empty result set still yields an empty batch, so the stream carries its schema
+        yield _build_batch(pa, schema, rows)
+        while rows := await cursor.fetchmany(size):
+            yield _build_batch(pa, schema, rows)
+    finally:
+        cursor.close()
+
+
+def iter_record_batches(
+    connection: Connection,
+    sql: str,
+    parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None = None,
+    *,
+    size: int = 10_000,
+) -> Generator[Any, None, None]:
+    """Yield the result set of ``sql`` as ``pyarrow.RecordBatch`` objects of up to ``size`` rows.
+
+    The blocking counterpart of :func:`fetch_record_batches`.
+
+    Args:
+        connection: The connection to run the query on.
+        sql: The query.
+        parameters: Bind variables of the query.
+        size: Rows per batch.
+
+    Yields:
+        Record batches.
+    """
+    pa = _import_pyarrow()
+    if hasattr(type(connection), "fetch_df_batches"):
+        for data_frame in connection.fetch_df_batches(sql, parameters, size=size):
+            yield from _to_batches(pa, data_frame)
+        return
+    with connection.cursor() as cursor:
+        cursor.arraysize = size
+        cursor.prefetchrows = size
+        cursor.execute(sql, parameters)
+        description = cursor.description or ()
+        rows = cursor.fetchmany(size)
+        schema = _schema(pa, description, rows)
+        yield _build_batch(pa, schema, rows)
+        while rows := cursor.fetchmany(size):
+            yield _build_batch(pa, schema, rows)
+
+
+class _Sink(io.RawIOBase):
+    """Write-only file collecting what the Arrow writers emit until it is drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def encode_batches(
+    batches: AsyncIterable[Any],
+    arrow_format: ArrowFormat = "arrow",
+) -> AsyncGenerator[bytes, None]:
+    """Serialize record batches incrementally as an Arrow IPC stream or a Parquet file.
+
+    Every batch is written and yielded as soon as it arrives; Parquet writes one row group per batch and the footer
+    at the end. Without any batch, an empty stream or file is written with an empty schema, so the output is always
+    valid.
+
+    Args:
+        batches: The record batches, all of the same schema.
+        arrow_format: The output format.
+
+    Yields:
+        Chunks of the serialized stream.
+    """
+    if arrow_format not in ARROW_MEDIA_TYPES:
+        msg = f"Unsupported Arrow format {arrow_format!r}, expected one of {', '.join(ARROW_MEDIA_TYPES)}"
+        raise ValueError(msg)
+    pa = _import_pyarrow()
+    sink = _Sink()
+    writer = None
+    try:
+        async for batch in batches:
+            if writer is None:
+                writer = _writer(pa, arrow_format, pa.PythonFile(sink, mode="w"), batch.schema)
+            writer.write_batch(batch)
+            if chunk := sink.drain():
+                yield chunk
+        if writer is None:
+            writer = _writer(pa, arrow_format, pa.PythonFile(sink, mode="w"), pa.schema([]))
+    finally:
+        if writer is not None:
+            writer.close()
+    if chunk := sink.drain():
+        yield chunk
+
+
+def _writer(pa: Any, arrow_format: ArrowFormat, sink: Any, schema: Any) -> Any:
+    if arrow_format == "arrow":
+        return pa.ipc.new_stream(sink, schema)
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise MissingDependencyError(package="pyarrow", install_package="arrow") from e
+    return pq.ParquetWriter(sink, schema)
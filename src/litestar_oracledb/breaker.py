@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import math
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Literal
+
+import oracledb
+
+from litestar_oracledb.exceptions import CircuitOpenError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Generator
+    from typing import Any
+
+__all__ = (
+    "CONNECTION_ERROR_CODES",
+    "CircuitBreaker",
+    "CircuitState",
+    "is_connection_error",
+)
+
+CircuitState = Literal["closed", "open", "half_open"]
+"""State of a :class:`CircuitBreaker`."""
+
+CONNECTION_ERROR_CODES: frozenset[str] = frozenset(
+    {
+        "DPY-1001",  # not connected to database
+        "DPY-4011",  # the database or network closed the connection
+        "DPY-4024",  # call timeout exceeded
+        "DPY-4033",  # connection closed after exceeding the idle time
+        "ORA-01033",  # initialization or shutdown in progress
+        "ORA-01034",  # database not available
+        "ORA-01089",  # immediate shutdown in progress
+        "ORA-03113",  # end-of-file on communication channel
+        "ORA-03114",  # not connected to ORACLE
+        "ORA-03135",  # connection lost contact
+        "ORA-12170",  # connect timeout
+        "ORA-12514",  # service not registered with the listener
+        "ORA-12528",  # instances are blocking new connections
+        "ORA-12537",  # connection closed
+        "ORA-12541",  # no listener
+        "ORA-12543",  # destination host unreachable
+        "ORA-12545",  # target host or object does not exist
+        "ORA-12547",  # lost contact
+    }
+)
+"""Error codes meaning that the database cannot be reached, in addition to every ``DPY-6xxx`` connection error."""
+
+
+def is_connection_error(exc: BaseException, codes: Collection[str] = CONNECTION_ERROR_CODES) -> bool:
+    """Return ``True`` if ``exc`` means that the database cannot be reached, rather than that a statement is wrong.
+
+    Args:
+        exc: The exception.
+        codes: The ``DPY-`` and ``ORA-`` codes to consider, in addition to ``DPY-6xxx``.
+
+    Returns:
+        Whether the exception counts against a :class:`CircuitBreaker`.
+    """
+    if isinstance(exc, ConnectionError):
+        return True
+    if not isinstance(exc, oracledb.Error) or not exc.args:
+        return False
+    full_code = getattr(exc.args[0], "full_code", "") or ""
+    return full_code.startswith("DPY-6") or full_code in codes
+
+
+@dataclass
+class CircuitBreaker:
+    """Stop acquiring connections from a database that cannot be reached, so that requests fail immediately.
+
+    The circuit opens after ``failure_threshold`` consecutive connection errors while acquiring a connection or
+    running statements on it. While it is open, acquiring raises :class:`CircuitOpenError
+    <litestar_oracledb.exceptions.CircuitOpenError>`, a ``503 Service Unavailable``, instead of waiting for the
+    connect timeouts and retries of the driver. After ``reset_timeout`` seconds it half-opens: up to
+    ``half_open_probes`` acquires go through as probes, the first one to succeed closes the circuit and a failed one
+    opens it again.
+    """
+
+    failure_threshold: int = 5
+    """Consecutive connection errors opening the circuit."""
+    reset_timeout: float = 30.0
+    """Seconds the circuit stays open before probing the database."""
+    half_open_probes: int = 1
+    """Concurrent acquires let through while the circuit is half-open."""
+    is_failure: Callable[[BaseException], bool] = is_connection_error
+    """Tell the errors counting against the circuit from the others, such as constraint violations."""
+    listeners: list[Callable[[CircuitState, CircuitState], Any]] = field(default_factory=list)
+    """Called with the previous and the new state on every transition, e.g. to emit an application event."""
+    _state: CircuitState = field(init=False, default="closed")
+    _failures: int = field(init=False, default=0)
+    _opened_at: float = field(init=False, default=0.0)
+    _probes: int = field(init=False, default=0)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1 or self.half_open_probes < 1:
+            msg = "'failure_threshold' and 'half_open_probes' must be at least 1"
+            raise ValueError(msg)
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, ``"open"`` until a probe is let through after ``reset_timeout``."""
+        return self._state
+
+    def retry_after(self) -> int:
+        """Return the seconds until the circuit half-opens, rounded up."""
+        return max(math.ceil(self._opened_at + self.reset_timeout - monotonic()), 1)
+
+    def allow(self) -> None:
+        """Let an acquire go through, or reject it while the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe in flight.
+        """
+        with self._lock:
+            previous = self._state
+            if previous == "open" and monotonic() - self._opened_at >= self.reset_timeout:
+                self._state, self._probes = "half_open", 0
+            rejected = self._state == "open" or (self._state == "half_open" and self._probes >= self.half_open_probes)
+            if self._state == "half_open" and not rejected:
+                self._probes += 1
+            current = self._state
+        self._notify(previous, current)
+        if rejected:
+            raise CircuitOpenError(
+                detail="The database is unavailable",
+                headers={"Retry-After": str(self.retry_after())},
+            )
+
+    def record_success(self) -> None:
+        """Record a successful acquire, closing a half-open circuit."""
+        with self._lock:
+            previous = self._state
+            self._failures = 0
+            if previous == "half_open":
+                self._state = "closed"
+            current = self._state
+        self._notify(previous, current)
+
+    def record_failure(self, exc: BaseException) -> bool:
+        """Record an error raised while running a statement on a connection.
+
+        Args:
+            exc: The error. Only errors accepted by ``is_failure`` count.
+
+        Returns:
+            Whether the error counted against the circuit.
+        """
+        return self._record_failure(exc, probe=False)
+
+    def _record_failure(self, exc: BaseException, probe: bool) -> bool:
+        counted = self.is_failure(exc)
+        with self._lock:
+            previous = self._state
+            if probe and previous == "half_open":
+                self._probes = max(self._probes - 1, 0)
+            if counted:
+                self._failures += 1
+                if previous == "half_open" or (previous == "closed" and self._failures >= self.failure_threshold):
+                    self._state, self._opened_at = "open", monotonic()
+            current = self._state
+        self._notify(previous, current)
+        return counted
+
+    @contextmanager
+    def guard(self) -> Generator[None, None, None]:
+        """Gate the acquire of a connection run in the context, recording its outcome.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        self.allow()
+        try:
+            yield
+        except BaseException as exc:
+            self._record_failure(exc, probe=True)
+            raise
+        self.record_success()
+
+    def _notify(self, previous: CircuitState, current: CircuitState) -> None:
+        if previous != current:
+            for listener in self.listeners:
+                listener(previous, current)
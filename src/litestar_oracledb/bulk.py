@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterable, Iterable, Mapping, Sequence, Union, cast
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from oracledb import Cursor
+
+__all__ = (
+    "BatchRowError",
+    "BulkRow",
+    "BulkWriteResult",
+    "bulk_statement",
+    "execute_batch",
+    "insert_statement",
+    "iter_batches",
+    "merge_statement",
+)
+
+BulkRow = Union[Mapping[str, Any], Sequence[Any]]
+"""A row to write: a mapping of column names to values, bound by name, or a sequence of values, bound by position."""
+
+_IDENTIFIER = re.compile(r'^(?:[A-Za-z][\w$#]*|"[^"]+")(?:\.(?:[A-Za-z][\w$#]*|"[^"]+"))?$')
+
+
+@dataclass
+class BatchRowError:
+    """A row rejected by the database while its batch was written with ``batcherrors``."""
+
+    offset: int
+    """Position of the row in the input."""
+    row: BulkRow
+    """The rejected row."""
+    code: int
+    """The Oracle error code, e.g. ``1`` for ``ORA-00001``."""
+    message: str
+    """The error message."""
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of a bulk write."""
+
+    submitted: int = 0
+    """Rows sent to the database."""
+    affected: int = 0
+    """Rows inserted or merged, as reported by the database."""
+    batches: int = 0
+    """``executemany`` calls, i.e. round trips."""
+    errors: list[BatchRowError] = field(default_factory=list)
+    """Rows rejected with ``batcherrors``."""
+
+    def record_batch(self, batch: Sequence[BulkRow], affected: int, errors: Iterable[Any] = ()) -> None:
+        """Add the outcome of one ``executemany`` call.
+
+        Args:
+            batch: The rows of the batch.
+            affected: The row count of the cursor after the call.
+            errors: The errors returned by ``cursor.getbatcherrors()``.
+        """
+        self.errors.extend(
+            BatchRowError(
+                offset=self.submitted + error.offset,
+                row=batch[error.offset],
+                code=error.code,
+                message=error.message,
+            )
+            for error in errors
+        )
+        self.submitted += len(batch)
+        self.affected += affected
+        self.batches += 1
+
+
+def _identifier(name: str) -> str:
+    if not _IDENTIFIER.match(name):
+        msg = f"Invalid identifier {name!r}"
+        raise ValueError(msg)
+    return name
+
+
+def _binds(columns: Sequence[str], by_name: bool) -> list[str]:
+    return [f":{column}" if by_name else f":{position}" for position, column in enumerate(columns, 1)]
+
+
+def insert_statement(table: str, columns: Sequence[str], by_name: bool = True) -> str:
+    """Return an ``INSERT`` statement for ``executemany``.
+
+    Args:
+        table: The target table.
+        columns: The columns to insert, in the order of the values of sequence rows.
+        by_name: Bind rows by column name (mapping rows) instead of by position (sequence rows).
+
+    Returns:
+        The statement.
+    """
+    names = ", ".join(_identifier(column) for column in columns)
+    # Identifiers are checked by _identifier and values are bound, so nothing from the rows reaches the SQL text.
+    return f"insert into {_identifier(table)} ({names}) values ({', '.join(_binds(columns, by_name))})"  # noqa: S608
+
+
+def merge_statement(table: str, columns: Sequence[str], keys: Sequence[str], by_name: bool = True) -> str:
+    """Return a ``MERGE`` statement that inserts rows, or updates them if a row with the same ``keys`` exists.
+
+    Args:
+        table: The target table.
+        columns: The columns to write, in the order of the values of sequence rows.
+        keys: The columns identifying a row. They must be part of ``columns``.
+        by_name: Bind rows by column name (mapping rows) instead of by position (sequence rows).
+
+    Returns:
+        The statement.
+    """
+    missing = set(keys) - set(columns)
+    if not keys or missing:
+        msg = f"Upsert keys must be a non-empty subset of the columns, got {', '.join(keys) or 'none'}"
+        raise ValueError(msg)
+    # Identifiers are checked by _identifier (keys are a subset of the columns) and values are bound.
+    columns = [_identifier(column) for column in columns]
+    source = ", ".join(f"{bind} as {column}" for bind, column in zip(_binds(columns, by_name), columns))
+    on = " and ".join(f"t.{key} = s.{key}" for key in keys)
+    statement = f"merge into {_identifier(table)} t using (select {source} from dual) s on ({on})"  # noqa: S608
+    if updates := [column for column in columns if column not in keys]:
+        statement += f" when matched then update set {', '.join(f't.{column} = s.{column}' for column in updates)}"
+    values = ", ".join(f"s.{column}" for column in columns)
+    return f"{statement} when not matched then insert ({', '.join(columns)}) values ({values})"  # noqa: S608
+
+
+def _row_size(row: BulkRow) -> int:
+    values = row.values() if isinstance(row, Mapping) else row
+    return sum(len(value) if isinstance(value, (str, bytes)) else 8 for value in values)
+
+
+async def _iterate(rows: Iterable[BulkRow] | AsyncIterable[BulkRow]) -> AsyncGenerator[BulkRow, None]:
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def iter_batches(
+    rows: Iterable[BulkRow] | AsyncIterable[BulkRow],
+    batch_size: int = 1000,
+    max_batch_bytes: int | None = None,
+) -> AsyncGenerator[list[BulkRow], None]:
+    """Group ``rows`` into batches, consuming the input one batch at a time.
+
+    Args:
+        rows: The rows, from a sync or an async iterable.
+        batch_size: Maximum rows per batch.
+        max_batch_bytes: Maximum estimated size of the values of a batch. A single larger row forms its own batch.
+
+    Yields:
+        Lists of rows.
+    """
+    batch: list[BulkRow] = []
+    size = 0
+    async for row in _iterate(rows):
+        if max_batch_bytes is not None:
+            row_size = _row_size(row)
+            if batch and size + row_size > max_batch_bytes:
+                yield batch
+                batch, size = [], 0
+            size += row_size
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def bulk_statement(
+    table: str,
+    row: BulkRow,
+    columns: Sequence[str] | None = None,
+    upsert_keys: Sequence[str] | None = None,
+) -> str:
+    """Return the ``INSERT`` or ``MERGE`` statement writing rows shaped like ``row`` to ``table``.
+
+    Args:
+        table: The target table.
+        row: A sample row. Mapping rows are bound by name, sequence rows by position.
+        columns: The columns to write. Defaults to the keys of a mapping row.
+        upsert_keys: Generate a ``MERGE`` on these columns instead of an ``INSERT``.
+
+    Returns:
+        The statement.
+    """
+    by_name = isinstance(row, Mapping)
+    if columns is None:
+        if not by_name:
+            msg = "'columns' is required for sequence rows"
+            raise ValueError(msg)
+        columns = list(cast("Mapping[str, Any]", row))
+    if upsert_keys:
+        return merge_statement(table, columns, upsert_keys, by_name)
+    return insert_statement(table, columns, by_name)
+
+
+def execute_batch(cursor: Cursor, sql: str, batch: list[BulkRow], batcherrors: bool = False) -> tuple[int, list[Any]]:
+    """Write ``batch`` with one ``executemany`` call on a sync cursor.
+
+    Args:
+        cursor: The cursor.
+        sql: The ``INSERT`` or ``MERGE`` statement.
+        batch: The rows.
+        batcherrors: Collect rejected rows instead of failing the batch.
+
+    Returns:
+        The row count and the batch errors.
+    """
+    cursor.executemany(sql, batch, batcherrors=batcherrors)
+    return cursor.rowcount, cursor.getbatcherrors() if batcherrors else []
@@ -0,0 +1,741 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import pickle
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from math import ceil
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from oracledb.connection import AsyncConnection, Connection
+from oracledb.cursor import AsyncCursor, Cursor
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection, Hashable, Iterable, Iterator
+
+    from litestar.stores.base import Store
+    from typing_extensions import Self
+
+    from litestar_oracledb.metrics import PoolMetrics
+
+__all__ = (
+    "CacheBackend",
+    "CachingAsyncConnection",
+    "CachingAsyncCursor",
+    "CachingConnection",
+    "CachingCursor",
+    "MemoryCacheBackend",
+    "QueryCache",
+    "RequestCache",
+    "StoreCacheBackend",
+    "is_cacheable_query",
+    "is_query",
+    "referenced_tables",
+)
+
+_QUERY = re.compile(r"^(?:\s+|--[^\n]*|/\*.*?\*/)*(?:select|with)\b", re.IGNORECASE | re.DOTALL)
+_FOR_UPDATE = re.compile(r"\bfor\s+update\b", re.IGNORECASE)
+_TABLES = re.compile(r"\b(?:from|join)\s+((?:\"[^\"]+\"|[\w$#]+)(?:\.(?:\"[^\"]+\"|[\w$#]+))*)", re.IGNORECASE)
+
+
+def is_query(sql: str | None) -> bool:
+    """Return ``True`` if ``sql`` is a ``SELECT`` or ``WITH`` query, ignoring leading comments.
+
+    Args:
+        sql: The SQL text.
+
+    Returns:
+        Whether ``sql`` returns rows.
+    """
+    return sql is not None and _QUERY.match(sql) is not None
+
+
+def is_cacheable_query(sql: str | None) -> bool:
+    """Return ``True`` if ``sql`` is a query whose result can be cached.
+
+    ``SELECT ... FOR UPDATE`` is not cacheable, since it is run for the row locks rather than for its result.
+
+    Args:
+        sql: The SQL text.
+
+    Returns:
+        Whether the result of ``sql`` can be cached.
+    """
+    return sql is not None and is_query(sql) and _FOR_UPDATE.search(sql) is None
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    hash(value)
+    return value  # type: ignore[no-any-return]
+
+
+def _cache_key(*parts: Any) -> Hashable | None:
+    """Return a key for ``parts``, or ``None`` if a bind value is not hashable."""
+    try:
+        return _freeze(parts)
+    except TypeError:
+        return None
+
+
+class RequestCache:
+    """Results of the queries run on the connection of a single request.
+
+    Entries are dropped as soon as the connection runs anything that is not a query, so a request always sees its own
+    writes. The cache lives in the request scope and is discarded with it; it never serves data across requests.
+    """
+
+    __slots__ = ("_entries", "hits", "metrics", "misses", "pool")
+
+    def __init__(self, pool: str = "db_pool", metrics: PoolMetrics | None = None) -> None:
+        """Initialize ``RequestCache``.
+
+        Args:
+            pool: Name of the pool, reported to ``metrics``.
+            metrics: Optional recorder for cache hits and misses.
+        """
+        self._entries: dict[Hashable, tuple[Any, list[Any]]] = {}
+        self.pool = pool
+        self.metrics = metrics
+        self.hits = 0
+        """Queries answered from the cache."""
+        self.misses = 0
+        """Cacheable queries sent to the database."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> tuple[Any, list[Any]] | None:
+        """Return the description and rows cached under ``key``, counting the lookup as a hit or a miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached ``(description, rows)``, or ``None``.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            if self.metrics is not None:
+                self.metrics.record_cache_miss(self.pool)
+        else:
+            self.hits += 1
+            if self.metrics is not None:
+                self.metrics.record_cache_hit(self.pool)
+        return entry
+
+    def set(self, key: Hashable, description: Any, rows: list[Any]) -> None:
+        self._entries[key] = (description, rows)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _CachingProxy:
+    __slots__ = ("_cache", "_target")
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._target, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target, name, value)
+
+
+class _CachingCursorBase(_CachingProxy):
+    """State shared by the sync and async caching cursors.
+
+    After a cache hit, ``_replay`` holds the cached rows and ``_position`` the next row to return. After a miss, the
+    fetched rows are collected in ``_capture`` and cached once the result set is exhausted.
+    """
+
+    __slots__ = ("_capture", "_description", "_position", "_replay")
+
+    def __init__(self, cursor: Any, cache: RequestCache) -> None:
+        object.__setattr__(self, "_target", cursor)
+        object.__setattr__(self, "_cache", cache)
+        object.__setattr__(self, "_replay", None)
+        object.__setattr__(self, "_position", 0)
+        object.__setattr__(self, "_capture", None)
+        object.__setattr__(self, "_description", None)
+
+    @property
+    def description(self) -> Any:
+        return self._description if self._replay is not None else self._target.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._position if self._replay is not None else self._target.rowcount  # type: ignore[no-any-return]
+
+    def _lookup(self, statement: str | None, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+        """Prepare the cursor for ``statement`` and return ``True`` if its rows are served from the cache."""
+        object.__setattr__(self, "_replay", None)
+        object.__setattr__(self, "_capture", None)
+        if not is_cacheable_query(statement):
+            self._cache.clear()
+            return False
+        key = _cache_key(statement, args, kwargs, self._target.rowfactory)
+        if key is None:
+            return False
+        entry = self._cache.get(key)
+        if entry is None:
+            object.__setattr__(self, "_capture", (key, []))
+            return False
+        object.__setattr__(self, "_description", entry[0])
+        object.__setattr__(self, "_replay", entry[1])
+        object.__setattr__(self, "_position", 0)
+        return True
+
+    def _invalidate(self) -> None:
+        object.__setattr__(self, "_replay", None)
+        object.__setattr__(self, "_capture", None)
+        self._cache.clear()
+
+    def _replayed(self, size: int | None) -> list[Any]:
+        rows = self._replay[self._position :] if size is None else self._replay[self._position : self._position + size]
+        object.__setattr__(self, "_position", self._position + len(rows))
+        return rows  # type: ignore[no-any-return]
+
+    def _captured(self, rows: list[Any], exhausted: bool) -> None:
+        if self._capture is not None:
+            self._capture[1].extend(rows)
+            if exhausted:
+                key, captured = self._capture
+                self._cache.set(key, self._target.description, captured)
+                object.__setattr__(self, "_capture", None)
+
+
+class CachingCursor(_CachingCursorBase):
+    """Serve repeated queries of a :class:`Cursor <oracledb.Cursor>` from a :class:`RequestCache`.
+
+    A query result is cached once all of its rows have been fetched.
+    """
+
+    __slots__ = ()
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Cursor]:  # type: ignore[override]
+        return Cursor
+
+    def execute(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        if self._lookup(statement, args, kwargs):
+            return self
+        result = self._target.execute(statement, *args, **kwargs)
+        return self if result is self._target else result
+
+    def executemany(self, *args: Any, **kwargs: Any) -> Any:
+        self._invalidate()
+        return self._target.executemany(*args, **kwargs)
+
+    def callproc(self, *args: Any, **kwargs: Any) -> Any:
+        self._invalidate()
+        return self._target.callproc(*args, **kwargs)
+
+    def callfunc(self, *args: Any, **kwargs: Any) -> Any:
+        self._invalidate()
+        return self._target.callfunc(*args, **kwargs)
+
+    def fetchone(self) -> Any:
+        if self._replay is not None:
+            rows = self._replayed(1)
+            return rows[0] if rows else None
+        row = self._target.fetchone()
+        self._captured([] if row is None else [row], row is None)
+        return row
+
+    def fetchmany(self, size: int | None = None, *args: Any, **kwargs: Any) -> list[Any]:
+        size = size or self._target.arraysize
+        if self._replay is not None:
+            return self._replayed(size)
+        rows = self._target.fetchmany(size, *args, **kwargs)
+        self._captured(rows, len(rows) < size)
+        return rows  # type: ignore[no-any-return]
+
+    def fetchall(self) -> list[Any]:
+        if self._replay is not None:
+            return self._replayed(None)
+        rows = self._target.fetchall()
+        self._captured(rows, True)
+        return rows  # type: ignore[no-any-return]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._target.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        while (row := self.fetchone()) is not None:
+            yield row
+
+
+class CachingAsyncCursor(_CachingCursorBase):
+    """Serve repeated queries of an :class:`AsyncCursor <oracledb.AsyncCursor>` from a :class:`RequestCache`.
+
+    A query result is cached once all of its rows have been fetched.
+    """
+
+    __slots__ = ()
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncCursor]:  # type: ignore[override]
+        return AsyncCursor
+
+    async def execute(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        if self._lookup(statement, args, kwargs):
+            return self
+        result = await self._target.execute(statement, *args, **kwargs)
+        return self if result is self._target else result
+
+    async def executemany(self, *args: Any, **kwargs: Any) -> Any:
+        self._invalidate()
+        return await self._target.executemany(*args, **kwargs)
+
+    async def callproc(self, *args: Any, **kwargs: Any) -> Any:
+        self._invalidate()
+        return await self._target.callproc(*args, **kwargs)
+
+    async def callfunc(self, *args: Any, **kwargs: Any) -> Any:
+        self._invalidate()
+        return await self._target.callfunc(*args, **kwargs)
+
+    async def fetchone(self) -> Any:
+        if self._replay is not None:
+            rows = self._replayed(1)
+            return rows[0] if rows else None
+        row = await self._target.fetchone()
+        self._captured([] if row is None else [row], row is None)
+        return row
+
+    async def fetchmany(self, size: int | None = None, *args: Any, **kwargs: Any) -> list[Any]:
+        size = size or self._target.arraysize
+        if self._replay is not None:
+            return self._replayed(size)
+        rows = await self._target.fetchmany(size, *args, **kwargs)
+        self._captured(rows, len(rows) < size)
+        return rows  # type: ignore[no-any-return]
+
+    async def fetchall(self) -> list[Any]:
+        if self._replay is not None:
+            return self._replayed(None)
+        rows = await self._target.fetchall()
+        self._captured(rows, True)
+        return rows  # type: ignore[no-any-return]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._target.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._target.close()
+
+    async def __aiter__(self) -> Any:
+        while (row := await self.fetchone()) is not None:
+            yield row
+
+
+class CachingConnection(_CachingProxy):
+    """Proxy for a :class:`Connection <oracledb.Connection>` whose cursors share a :class:`RequestCache`."""
+
+    __slots__ = ()
+
+    def __init__(self, connection: Connection, cache: RequestCache) -> None:
+        object.__setattr__(self, "_target", connection)
+        object.__setattr__(self, "_cache", cache)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Connection]:  # type: ignore[override]
+        return Connection
+
+    def cursor(self, *args: Any, **kwargs: Any) -> CachingCursor:
+        return CachingCursor(self._target.cursor(*args, **kwargs), self._cache)
+
+    def rollback(self) -> None:
+        self._cache.clear()
+        self._target.rollback()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._target.__exit__(*exc_info)
+
+
+class CachingAsyncConnection(_CachingProxy):
+    """Proxy for an :class:`AsyncConnection <oracledb.AsyncConnection>` whose cursors share a :class:`RequestCache`.
+
+    The ``fetchone``, ``fetchmany`` and ``fetchall`` shortcuts of the connection are cached as well.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, connection: AsyncConnection, cache: RequestCache) -> None:
+        object.__setattr__(self, "_target", connection)
+        object.__setattr__(self, "_cache", cache)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncConnection]:  # type: ignore[override]
+        return AsyncConnection
+
+    def cursor(self, *args: Any, **kwargs: Any) -> CachingAsyncCursor:
+        return CachingAsyncCursor(self._target.cursor(*args, **kwargs), self._cache)
+
+    async def _fetch(self, operation: str, statement: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        if not is_cacheable_query(statement):
+            self._cache.clear()
+            return await getattr(self._target, operation)(statement, *args, **kwargs)
+        key = _cache_key(operation, statement, args, kwargs)
+        entry = self._cache.get(key) if key is not None else None
+        if entry is not None:
+            return list(entry[1]) if isinstance(entry[1], list) else entry[1]
+        result = await getattr(self._target, operation)(statement, *args, **kwargs)
+        if key is not None:
+            self._cache.set(key, None, result)
+        return result
+
+    async def fetchone(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._fetch("fetchone", statement, args, kwargs)
+
+    async def fetchmany(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._fetch("fetchmany", statement, args, kwargs)
+
+    async def fetchall(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._fetch("fetchall", statement, args, kwargs)
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        self._cache.clear()
+        return await self._target.execute(*args, **kwargs)
+
+    async def executemany(self, *args: Any, **kwargs: Any) -> Any:
+        self._cache.clear()
+        return await self._target.executemany(*args, **kwargs)
+
+    async def callproc(self, *args: Any, **kwargs: Any) -> Any:
+        self._cache.clear()
+        return await self._target.callproc(*args, **kwargs)
+
+    async def callfunc(self, *args: Any, **kwargs: Any) -> Any:
+        self._cache.clear()
+        return await self._target.callfunc(*args, **kwargs)
+
+    async def run_pipeline(self, pipeline: Any, *args: Any, **kwargs: Any) -> Any:
+        if not all(is_cacheable_query(operation.statement) for operation in pipeline.operations):
+            self._cache.clear()
+        return await self._target.run_pipeline(pipeline, *args, **kwargs)
+
+    async def rollback(self) -> None:
+        self._cache.clear()
+        await self._target.rollback()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._target.__aexit__(*exc_info)
+
+
+def _table_name(name: str) -> str:
+    """Return the unqualified, upper case name of a table."""
+    return name.rsplit(".", 1)[-1].strip('"').upper()
+
+
+def referenced_tables(sql: str) -> frozenset[str]:
+    """Return the names of the tables a query selects from.
+
+    A best-effort scan of the ``FROM`` and ``JOIN`` clauses; names are unqualified and upper case.
+
+    Args:
+        sql: The query.
+
+    Returns:
+        The table names.
+    """
+    return frozenset(_table_name(match) for match in _TABLES.findall(sql))
+
+
+class CacheBackend(ABC):
+    """Storage of a :class:`QueryCache`.
+
+    Values are opaque bytes; ``ttl`` is in seconds, ``None`` meaning no expiry.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the value stored under ``key``, or ``None`` if it is missing or expired.
+
+        Args:
+            key: The cache key.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float | None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: The cache key.
+            value: The value.
+            ttl: Seconds until the value expires.
+        """
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None:
+        """Delete ``keys``, ignoring missing ones.
+
+        Args:
+            keys: The cache keys.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Delete every value."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache bounded by the total size of its values."""
+
+    __slots__ = ("_entries", "max_bytes", "on_evict", "size")
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initialize ``MemoryCacheBackend``.
+
+        Args:
+            max_bytes: Size budget of the stored values. The least recently used values are evicted to stay within it.
+        """
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self.max_bytes = max_bytes
+        self.size = 0
+        """Total size of the stored values, in bytes."""
+        self.on_evict: Callable[[str], Any] | None = None
+        """Called with the key of each value evicted to stay within ``max_bytes`` or once expired."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= monotonic():
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float | None) -> None:
+        self._pop(key)
+        if len(value) > self.max_bytes:
+            return
+        self._entries[key] = (value, monotonic() + ttl if ttl is not None else None)
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            self._evict(next(iter(self._entries)))
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._pop(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+    def _evict(self, key: str) -> None:
+        self._pop(key)
+        if self.on_evict is not None:
+            self.on_evict(key)
+
+
+class StoreCacheBackend(CacheBackend):
+    """Keep cached results in a Litestar :class:`Store <litestar.stores.base.Store>`, e.g. a Redis store shared by
+    several workers.
+    """
+
+    __slots__ = ("store",)
+
+    def __init__(self, store: Store) -> None:
+        """Initialize ``StoreCacheBackend``.
+
+        Args:
+            store: The store. Use a namespaced store (``store.with_namespace(...)``) so that :meth:`clear` does not
+                delete unrelated values.
+        """
+        self.store = store
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.store.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float | None) -> None:
+        await self.store.set(key, value, expires_in=ceil(ttl) if ttl is not None else None)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            await self.store.delete(key)
+
+    async def clear(self) -> None:
+        await self.store.delete_all()
+
+
+class QueryCache:
+    """Application-wide cache of query results, keyed by SQL text and bind values.
+
+    Entries expire after ``ttl`` seconds and are evicted early by :meth:`invalidate` when one of the tables they were
+    read from changes, which the sync database config does automatically with Continuous Query Notification.
+    Only cache reference data that tolerates being up to ``ttl`` seconds stale.
+
+    The cache indexes its keys by table to evict them on invalidation. The index forgets the keys the backend no longer
+    holds: expired ones, and those a :class:`MemoryCacheBackend` evicts. A result loaded while one of its tables is
+    invalidated is returned but not cached, as it may predate the change.
+    """
+
+    __slots__ = ("_deadlines", "_generations", "_keys", "_tables", "backend", "hits", "misses", "ttl")
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: float | None = 300.0) -> None:
+        """Initialize ``QueryCache``.
+
+        Args:
+            backend: Where results are stored. Defaults to a :class:`MemoryCacheBackend`.
+            ttl: Default lifetime of an entry in seconds, ``None`` to only rely on invalidation.
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._tables: dict[str, set[str]] = {}
+        self._keys: dict[str, tuple[frozenset[str], float | None]] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        self._generations: dict[str, int] = {}
+        if isinstance(self.backend, MemoryCacheBackend):
+            self.backend.on_evict = self._forget
+
+    @staticmethod
+    def key(sql: str, parameters: Any = None) -> str:
+        """Return the cache key of ``sql`` run with ``parameters``.
+
+        Args:
+            sql: The query.
+            parameters: Its bind values.
+
+        Returns:
+            The cache key.
+
+        Raises:
+            TypeError: If a bind value is not hashable.
+        """
+        return hashlib.sha256(repr((sql, _freeze(parameters))).encode()).hexdigest()
+
+    async def fetch(
+        self,
+        sql: str,
+        parameters: Any,
+        load: Callable[[], Awaitable[list[Any]]],
+        tables: Collection[str] | None = None,
+        ttl: float | None = None,
+    ) -> list[Any]:
+        """Return the cached rows of ``sql``, calling ``load`` to run the query on a miss.
+
+        Queries with a bind value that is not hashable, such as a ``bytearray`` or an oracledb ``Var``, bypass the cache.
+
+        Args:
+            sql: The query.
+            parameters: Its bind values.
+            load: Runs the query and returns its rows.
+            tables: Tables whose changes invalidate the entry. Defaults to the tables found in ``sql``.
+            ttl: Lifetime of the entry, overriding the cache default.
+
+        Returns:
+            The rows.
+        """
+        try:
+            key = self.key(sql, parameters)
+        except TypeError:
+            return await load()
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return pickle.loads(value)  # type: ignore[no-any-return]  # noqa: S301
+        self.misses += 1
+        names = frozenset(_table_name(table) for table in (tables if tables is not None else referenced_tables(sql)))
+        ttl = ttl if ttl is not None else self.ttl
+        # registered before loading, so that an invalidation while the query runs evicts the entry, and versioned, so
+        # that the rows read before that invalidation are not cached
+        self._track(key, names, ttl)
+        generations = self._generations_of(names)
+        rows = await load()
+        if self._generations_of(names) != generations:
+            return rows
+        await self.backend.set(key, pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL), ttl)
+        if self._generations_of(names) != generations:
+            await self.backend.delete([key])
+        return rows
+
+    async def invalidate(self, tables: Iterable[str]) -> None:
+        """Evict the entries read from any of ``tables``.
+
+        Args:
+            tables: Table names, qualified or not.
+        """
+        keys: set[str] = set()
+        for table in tables:
+            name = _table_name(table)
+            self._generations[name] = self._generations.get(name, 0) + 1
+            keys |= self._tables.get(name, set())
+        for key in keys:
+            self._forget(key)
+        if keys:
+            await self.backend.delete(keys)
+
+    async def clear(self) -> None:
+        """Evict every entry."""
+        for name in self._generations.keys() | self._tables.keys():
+            self._generations[name] = self._generations.get(name, 0) + 1
+        self._tables.clear()
+        self._keys.clear()
+        self._deadlines.clear()
+        await self.backend.clear()
+
+    def _generations_of(self, names: Collection[str]) -> list[int]:
+        return [self._generations.get(name, 0) for name in names]
+
+    def _track(self, key: str, names: frozenset[str], ttl: float | None) -> None:
+        """Index ``key`` under the tables ``names``, forgetting the keys whose entries have expired."""
+        now = monotonic()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            expires_at, expired = heapq.heappop(self._deadlines)
+            if (entry := self._keys.get(expired)) is not None and entry[1] == expires_at:
+                self._forget(expired)
+        self._forget(key)
+        deadline = now + ttl if ttl is not None else None
+        self._keys[key] = (names, deadline)
+        for name in names:
+            self._tables.setdefault(name, set()).add(key)
+        if deadline is not None:
+            heapq.heappush(self._deadlines, (deadline, key))
+
+    def _forget(self, key: str) -> None:
+        entry = self._keys.pop(key, None)
+        if entry is None:
+            return
+        for name in entry[0]:
+            keys = self._tables.get(name)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tables[name]
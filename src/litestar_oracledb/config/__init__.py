@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from litestar_oracledb.config._asyncio import AsyncOracleDatabaseConfig, AsyncOraclePoolConfig
+from litestar_oracledb.config._asyncio import (
+    AsyncOracleDatabaseConfig,
+    AsyncOraclePoolConfig,
+    LazyAsyncConnection,
+    LazyAsyncCursor,
+)
 from litestar_oracledb.config._common import GenericOracleDatabaseConfig, GenericOraclePoolConfig
-from litestar_oracledb.config._sync import SyncOracleDatabaseConfig, SyncOraclePoolConfig
+from litestar_oracledb.config._routing import AsyncRoutingDatabaseConfig
+from litestar_oracledb.config._sync import LazyConnection, SyncOracleDatabaseConfig, SyncOraclePoolConfig
 
 __all__ = (
     "SyncOracleDatabaseConfig",
     "SyncOraclePoolConfig",
     "AsyncOracleDatabaseConfig",
     "AsyncOraclePoolConfig",
+    "AsyncRoutingDatabaseConfig",
     "GenericOracleDatabaseConfig",
     "GenericOraclePoolConfig",
+    "LazyAsyncConnection",
+    "LazyAsyncCursor",
+    "LazyConnection",
 )
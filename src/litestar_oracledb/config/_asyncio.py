@@ -1,40 +1,90 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, cast
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from functools import partial
+from inspect import isawaitable, iscoroutinefunction
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal, Optional, cast
 
 from litestar.constants import HTTP_RESPONSE_START
 from litestar.di import Provide
 from litestar.exceptions import ImproperlyConfiguredException
+from litestar.response import Stream
 from litestar.utils.dataclass import simple_asdict
+from oracledb import Error as OracleError
 from oracledb import create_pool_async as oracledb_create_pool
 from oracledb.connection import AsyncConnection
+from oracledb.cursor import AsyncCursor
 from oracledb.pool import AsyncConnectionPool
 
 from litestar_oracledb._utils import delete_scope_state, get_scope_state, set_scope_state
+from litestar_oracledb.arrow import ARROW_MEDIA_TYPES, encode_batches, fetch_record_batches
+from litestar_oracledb.cache import CachingAsyncConnection
 from litestar_oracledb.config._common import (
     CONNECTION_SCOPE_KEY,
     SESSION_TERMINUS_ASGI_EVENTS,
     GenericOracleDatabaseConfig,
     GenericOraclePoolConfig,
+    logger,
 )
+from litestar_oracledb.exceptions import ConnectionNotAcquiredError
+from litestar_oracledb.instrumentation import InstrumentedAsyncConnection, route_of
+from litestar_oracledb.metrics import end_checkout, start_checkout
+from litestar_oracledb.pipeline import (
+    only_queries,
+    run_fanned_out,
+    run_pipelined,
+    run_serially,
+    supports_pipelining,
+)
+from litestar_oracledb.retry import RetryingAsyncConnection
+from litestar_oracledb.streaming import MEDIA_TYPES, stream_rows
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Callable, Coroutine
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Sequence
     from typing import Any
 
     from litestar import Litestar
     from litestar.datastructures.state import State
     from litestar.types import Message, Scope
+    from typing_extensions import Self
+
+    from litestar_oracledb.arrow import ArrowFormat
+    from litestar_oracledb.bulk import BulkRow
+    from litestar_oracledb.config._common import BatchExecutor
+    from litestar_oracledb.limits import ConnectionLimiter
+    from litestar_oracledb.metrics import PoolMetrics
+    from litestar_oracledb.pipeline import Statement, StatementResult
+    from litestar_oracledb.streaming import StreamFormat
+    from litestar_oracledb.tenancy import TenantRouting
+
+
+def _resolve_connection(value: AsyncConnection | LazyAsyncConnection | None) -> AsyncConnection | None:
+    """Return the connection to act on for a value stored in scope state.
+
+    Args:
+        value: The connection or lazy connection proxy stored in the scope.
+
+    Returns:
+        The pooled connection, or ``None`` if no connection was checked out for the scope.
+    """
+    if isinstance(value, LazyAsyncConnection):
+        return value.connection
+    return value
 
 
 def default_handler_maker(
     connection_scope_key: str = CONNECTION_SCOPE_KEY,
+    metrics: PoolMetrics | None = None,
+    pool_name: str = "db_pool",
 ) -> Callable[[Message, Scope], Coroutine[Any, Any, None]]:
     """Set up the handler to issue a transaction commit or rollback based on specified status codes
     Args:
         connection_scope_key: The key to use within the application state
+        metrics: Optional recorder for the connection checkout duration
+        pool_name: The pool name reported to ``metrics``
 
     Returns:
         The handler callable
@@ -50,12 +100,14 @@ def default_handler_maker(
         Returns:
             None
         """
-        connection = cast("AsyncConnection | None", get_scope_state(scope, connection_scope_key))
+        connection = _resolve_connection(get_scope_state(scope, connection_scope_key))
         if connection is not None and message["type"] in SESSION_TERMINUS_ASGI_EVENTS and connection._impl is not None:  # noqa: SLF001
             # checks to to see if connected without raising an exception: https://github.com/oracle/python-oracledb/blob/main/src/oracledb/connection.py#L80
             if connection._impl is not None:  # noqa: SLF001
                 await connection.close()
             delete_scope_state(scope, connection_scope_key)
+            if metrics is not None:
+                end_checkout(scope, connection_scope_key, metrics, pool_name)
 
     return handler
 
@@ -65,6 +117,8 @@ def autocommit_handler_maker(
     extra_commit_statuses: set[int] | None = None,
     extra_rollback_statuses: set[int] | None = None,
     connection_scope_key: str = CONNECTION_SCOPE_KEY,
+    metrics: PoolMetrics | None = None,
+    pool_name: str = "db_pool",
 ) -> Callable[[Message, Scope], Coroutine[Any, Any, None]]:
     """Set up the handler to issue a transaction commit or rollback based on specified status codes
     Args:
@@ -72,6 +126,8 @@ def autocommit_handler_maker(
         extra_commit_statuses: A set of additional status codes that trigger a commit
         extra_rollback_statuses: A set of additional status codes that trigger a rollback
         connection_scope_key: The key to use within the application state
+        metrics: Optional recorder for commits, rollbacks and the connection checkout duration
+        pool_name: The pool name reported to ``metrics``
 
     Returns:
         The handler callable
@@ -98,15 +154,19 @@ def autocommit_handler_maker(
         Returns:
             None
         """
-        connection = cast("AsyncConnection | None", get_scope_state(scope, connection_scope_key))
+        connection = _resolve_connection(get_scope_state(scope, connection_scope_key))
         try:
             if connection is not None and message["type"] == HTTP_RESPONSE_START and connection._impl is not None:  # noqa: SLF001
                 if (message["status"] in commit_range or message["status"] in extra_commit_statuses) and message[
                     "status"
                 ] not in extra_rollback_statuses:
                     await connection.commit()
+                    if metrics is not None:
+                        metrics.record_commit(pool_name)
                 else:
                     await connection.rollback()
+                    if metrics is not None:
+                        metrics.record_rollback(pool_name)
         finally:
             # checks to to see if connected without raising an exception: https://github.com/oracle/python-oracledb/blob/main/src/oracledb/connection.py#L80
             if (
@@ -116,10 +176,180 @@ def autocommit_handler_maker(
             ):
                 await connection.close()
                 delete_scope_state(scope, connection_scope_key)
+                if metrics is not None:
+                    end_checkout(scope, connection_scope_key, metrics, pool_name)
 
     return handler
 
 
+class LazyAsyncConnection:
+    """Proxy for an :class:`AsyncConnection <oracledb.AsyncConnection>` that is acquired from the pool on first use.
+
+    Coroutine methods of the connection (``execute``, ``fetchall``, ``callproc``, ...) check out a pooled connection
+    before running. ``commit``, ``rollback`` and ``close`` are no-ops until a connection has been acquired, as there is
+    no transaction to end. Any other attribute requires an acquired connection; use :meth:`acquire` to check one out
+    explicitly.
+    """
+
+    __slots__ = ("_acquire", "_connection")
+
+    def __init__(self, acquire: Callable[[], Awaitable[AsyncConnection]]) -> None:
+        """Initialize ``LazyAsyncConnection``.
+
+        Args:
+            acquire: Coroutine function that checks out a connection, such as ``pool.acquire``.
+        """
+        object.__setattr__(self, "_acquire", acquire)
+        object.__setattr__(self, "_connection", None)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncConnection]:  # type: ignore[override]
+        # report the proxied type so that ``db_connection: AsyncConnection`` annotations validate
+        return AsyncConnection
+
+    @property
+    def connection(self) -> AsyncConnection | None:
+        """Return the pooled connection, or ``None`` if it has not been acquired yet."""
+        return cast("Optional[AsyncConnection]", self._connection)
+
+    async def acquire(self) -> AsyncConnection:
+        """Check out a connection from the pool if none has been acquired yet.
+
+        Returns:
+            The pooled connection.
+        """
+        if self._connection is None:
+            object.__setattr__(self, "_connection", await self._acquire())
+        return cast("AsyncConnection", self._connection)
+
+    def cursor(self, scrollable: bool = False) -> AsyncCursor | LazyAsyncCursor:
+        """Return a cursor, deferring the acquire to its first statement if no connection is checked out yet.
+
+        Args:
+            scrollable: Whether the cursor is scrollable.
+
+        Returns:
+            A cursor instance.
+        """
+        if self._connection is not None:
+            return cast("AsyncConnection", self._connection).cursor(scrollable)
+        return LazyAsyncCursor(self, scrollable)
+
+    async def commit(self) -> None:
+        if self._connection is not None:
+            await self._connection.commit()
+
+    async def rollback(self) -> None:
+        if self._connection is not None:
+            await self._connection.rollback()
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            if self._connection._impl is not None:  # noqa: SLF001
+                await self._connection.close()
+            object.__setattr__(self, "_connection", None)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self._connection is not None:
+            return getattr(self._connection, name)
+        if iscoroutinefunction(getattr(AsyncConnection, name)):
+
+            async def acquire_and_call(*args: Any, **kwargs: Any) -> Any:
+                connection = await self.acquire()
+                return await getattr(connection, name)(*args, **kwargs)
+
+            return acquire_and_call
+        msg = f"'{name}' requires an acquired connection. Await 'acquire()' before using it."
+        raise ConnectionNotAcquiredError(detail=msg)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._connection is None:
+            msg = f"'{name}' requires an acquired connection. Await 'acquire()' before setting it."
+            raise ConnectionNotAcquiredError(detail=msg)
+        setattr(self._connection, name, value)
+
+
+class LazyAsyncCursor:
+    """Cursor returned by :meth:`LazyAsyncConnection.cursor` before a connection has been acquired.
+
+    The pooled connection and the real cursor are opened by the first statement. Attributes assigned before that
+    (``arraysize``, ``prefetchrows``, ...) are applied to the real cursor once it is opened.
+    """
+
+    __slots__ = ("_connection", "_cursor", "_pending", "_scrollable")
+
+    def __init__(self, connection: LazyAsyncConnection, scrollable: bool = False) -> None:
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "_scrollable", scrollable)
+        object.__setattr__(self, "_cursor", None)
+        object.__setattr__(self, "_pending", {})
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncCursor]:  # type: ignore[override]
+        return AsyncCursor
+
+    async def open(self) -> AsyncCursor:
+        """Acquire the connection and open the real cursor if needed.
+
+        Returns:
+            The real cursor.
+        """
+        if self._cursor is None:
+            connection = await self._connection.acquire()
+            cursor = connection.cursor(self._scrollable)
+            for name, value in self._pending.items():
+                setattr(cursor, name, value)
+            object.__setattr__(self, "_cursor", cursor)
+        return cast("AsyncCursor", self._cursor)
+
+    def close(self) -> None:
+        if self._cursor is not None:
+            self._cursor.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if self._cursor is not None:
+            return getattr(self._cursor, name)
+        if name in self._pending:
+            return self._pending[name]
+        if iscoroutinefunction(getattr(AsyncCursor, name)):
+
+            async def open_and_call(*args: Any, **kwargs: Any) -> Any:
+                cursor = await self.open()
+                return await getattr(cursor, name)(*args, **kwargs)
+
+            return open_and_call
+        msg = f"'{name}' is not available before the cursor has executed a statement."
+        raise ConnectionNotAcquiredError(detail=msg)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._cursor is not None:
+            setattr(self._cursor, name, value)
+        else:
+            self._pending[name] = value
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __aiter__(self) -> Any:
+        if self._cursor is None:
+            msg = "The cursor must execute a statement before it can be iterated."
+            raise ConnectionNotAcquiredError(detail=msg)
+        return self._cursor.__aiter__()
+
+
 @dataclass
 class AsyncOraclePoolConfig(GenericOraclePoolConfig[AsyncConnectionPool, AsyncConnection]):
     """Async Oracle Pool Config"""
@@ -131,17 +361,37 @@ class AsyncOracleDatabaseConfig(GenericOracleDatabaseConfig[AsyncConnectionPool,
 
     pool_config: AsyncOraclePoolConfig | None = None
     """Oracle Pool configuration"""
+    _pipelining: bool | None = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         super().__post_init__()
+        if self.query_cache_tables:
+            msg = (
+                "'query_cache_tables' requires Continuous Query Notification, which python-oracledb only supports in "
+                "Thick mode and not with asyncio. Rely on the 'query_cache' ttl or call 'query_cache.invalidate()'."
+            )
+            raise ImproperlyConfiguredException(msg)
+        if self.pool_sizer is not None:
+            msg = "'pool_sizer' requires 'ConnectionPool.reconfigure()', which python-oracledb lacks for async pools."
+            raise ImproperlyConfiguredException(msg)
         if self.before_send_handler is None:
-            self.before_send_handler = default_handler_maker(connection_scope_key=self.connection_scope_key)
+            self.before_send_handler = default_handler_maker(
+                connection_scope_key=self.connection_scope_key,
+                metrics=self.metrics,
+                pool_name=self.pool_app_state_key,
+            )
         if self.before_send_handler == "autocommit":
-            self.before_send_handler = autocommit_handler_maker(connection_scope_key=self.connection_scope_key)
+            self.before_send_handler = autocommit_handler_maker(
+                connection_scope_key=self.connection_scope_key,
+                metrics=self.metrics,
+                pool_name=self.pool_app_state_key,
+            )
         if self.before_send_handler == "autocommit_include_redirects":
             self.before_send_handler = autocommit_handler_maker(
                 connection_scope_key=self.connection_scope_key,
                 commit_on_redirect=True,
+                metrics=self.metrics,
+                pool_name=self.pool_app_state_key,
             )
 
     @property
@@ -195,6 +445,8 @@ class AsyncOracleDatabaseConfig(GenericOracleDatabaseConfig[AsyncConnectionPool,
             raise ImproperlyConfiguredException(msg)
 
         pool_config = self.pool_config_dict
+        if self.session_callback is not None:
+            pool_config["session_callback"] = self._run_session_callback
         self.pool_instance = oracledb_create_pool(**pool_config)
         if self.pool_instance is None:
             msg = "Could not configure the 'pool_instance'. Please check your configuration."
@@ -209,10 +461,58 @@ class AsyncOracleDatabaseConfig(GenericOracleDatabaseConfig[AsyncConnectionPool,
         db_pool = await self.create_pool()
         app.state.update({self.pool_app_state_key: db_pool})
         try:
-            yield
+            async with self._warm_up_pool(db_pool), self._sample_pool_usage(db_pool):
+                yield
         finally:
             await db_pool.close(force=True)
 
+    async def _open_connection(self, pool: AsyncConnectionPool) -> AsyncConnection:
+        connection = cast("AsyncConnection", await pool.acquire(**self._acquire_kwargs()))
+        if self.warmup_statement is None:
+            return connection
+        try:
+            cursor = connection.cursor()
+            try:
+                await cursor.execute(self.warmup_statement)
+            finally:
+                cursor.close()
+        except Exception:
+            await pool.release(connection)
+            raise
+        return connection
+
+    async def _close_connection(self, pool: AsyncConnectionPool, connection: AsyncConnection) -> None:
+        await pool.release(connection)
+
+    async def _fetch_rows(
+        self,
+        sql: str,
+        parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None,
+        connection: AsyncConnection | None,
+    ) -> list[Any]:
+        if connection is not None:
+            return await connection.fetchall(sql, parameters)
+        async with self.get_connection() as pooled:
+            return await pooled.fetchall(sql, parameters)
+
+    @asynccontextmanager
+    async def _bulk_executor(self, connection: AsyncConnection | None) -> AsyncGenerator[BatchExecutor, None]:
+        if connection is None:
+            async with self.get_connection() as pooled, self._bulk_executor(pooled) as execute:
+                yield execute
+                await pooled.commit()
+            return
+        cursor = connection.cursor()
+
+        async def execute_batch(sql: str, batch: list[BulkRow], batcherrors: bool) -> tuple[int, list[Any]]:
+            await cursor.executemany(sql, batch, batcherrors=batcherrors)
+            return cursor.rowcount, cursor.getbatcherrors() if batcherrors else []
+
+        try:
+            yield execute_batch
+        finally:
+            cursor.close()
+
     async def provide_connection(
         self,
         state: State,
@@ -233,12 +533,329 @@ class AsyncOracleDatabaseConfig(GenericOracleDatabaseConfig[AsyncConnectionPool,
         )
         if connection is not None:
             yield connection
-        else:
+            return
+
+        release_slot = await self._enter_connection_limit(scope)
+        try:
             pool = cast("AsyncConnectionPool", state.get(self.pool_app_state_key))
+            connection = (
+                cast("AsyncConnection", LazyAsyncConnection(partial(self._acquire, pool, scope)))
+                if self.lazy_connection
+                else await self._acquire(pool, scope)
+            )
+            set_scope_state(scope, self.connection_scope_key, connection)
+            if self.release_mode == "response":
+                # the ``before_send_handler`` ends the transaction and releases the connection
+                try:
+                    yield connection
+                except Exception as exc:
+                    self._record_circuit_failure(exc)
+                    raise
+                return
+            try:
+                yield connection
+            except Exception as exc:
+                self._record_circuit_failure(exc)
+                await self.release_connection(scope, commit=False)
+                raise
+            await self.release_connection(scope)
+        finally:
+            if release_slot is not None:
+                release_slot()
+
+    async def _acquire(self, pool: AsyncConnectionPool, scope: Scope, detached: bool = False) -> AsyncConnection:
+        """Check out a connection for ``scope``, recording the wait to ``metrics``.
+
+        Args:
+            pool: The pool to acquire from.
+            scope: The current connection's scope.
+            detached: Acquire a connection other than the connection of the request, whose checkout is not tracked in
+                ``scope`` and which does not share the request cache.
+
+        Returns:
+            A connection instance.
+        """
+        started = perf_counter()
+        limiter = self.connection_limiter
+        try:
+            with self._circuit_guard():
+                connection = cast(
+                    "AsyncConnection",
+                    await asyncio.wait_for(
+                        pool.acquire(**self._acquire_kwargs(scope)), limiter.max_wait if limiter is not None else None
+                    ),
+                )
+        except asyncio.TimeoutError:
+            limiter = cast("ConnectionLimiter", limiter)
+            route = limiter.route_key(scope)
+            if self.metrics is not None:
+                self.metrics.record_rejection(self.pool_app_state_key, route)
+            raise limiter.unavailable(route) from None
+        if self.metrics is not None:
+            self.metrics.record_acquire(self.pool_app_state_key, perf_counter() - started)
+            if not detached:
+                start_checkout(scope, self.connection_scope_key)
+        if self.drcp is not None:
+            self.drcp.observe(pool)
+        if self.tenancy is not None:
+            await self._prepare_tenant(pool, connection, scope)
+        if self.statement_cache_advisor is not None:
+            self.statement_cache_advisor.attach(connection)
+        if self.retry_policy is not None:
+            connection = cast(
+                "AsyncConnection",
+                RetryingAsyncConnection(connection, self.retry_policy, partial(self._replace_connection, pool, scope)),
+            )
+        if self.statement_recorder is not None:
+            connection = cast(
+                "AsyncConnection",
+                InstrumentedAsyncConnection(connection, self.statement_recorder, route_of(scope)),
+            )
+        if self.request_cache and not detached:
+            connection = cast("AsyncConnection", CachingAsyncConnection(connection, self._new_request_cache(scope)))
+        return connection
+
+    async def _replace_connection(
+        self, pool: AsyncConnectionPool, scope: Scope, lost: AsyncConnection
+    ) -> AsyncConnection:
+        """Drop ``lost`` from ``pool`` and acquire a connection to replay its statements on."""
+        logger.info("Replacing a lost connection of %s", self.pool_app_state_key)
+        with suppress(OracleError):
+            await pool.drop(lost)  # type: ignore[arg-type]
+        with self._circuit_guard():
+            connection = cast("AsyncConnection", await pool.acquire(**self._acquire_kwargs(scope)))
+        if self.tenancy is not None:
+            await self._prepare_tenant(pool, connection, scope)
+        return connection
+
+    async def _prepare_tenant(self, pool: AsyncConnectionPool, connection: AsyncConnection, scope: Scope) -> None:
+        """Set up ``connection`` for the tenant of ``scope``, dropping it from ``pool`` if that fails."""
+        try:
+            result = cast("TenantRouting", self.tenancy).prepare(connection, scope)
+            if isawaitable(result):
+                await result
+        except BaseException:
+            with suppress(OracleError):
+                await pool.drop(connection)  # type: ignore[arg-type]
+            raise
+
+    async def release_connection(self, scope: Scope, commit: bool = True) -> None:
+        """End the transaction of the connection held by ``scope`` and return it to the pool.
+
+        Streaming generators can call this once they are done with the database, so the connection is not held while
+        the response body is sent. The ``before_send_handler`` skips scopes whose connection has been released.
+
+        Args:
+            scope: The current connection's scope.
+            commit: Commit the transaction if ``True``, otherwise roll it back.
+        """
+        connection = _resolve_connection(get_scope_state(scope, self.connection_scope_key, pop=True))
+        if connection is None or connection._impl is None:  # noqa: SLF001
+            return
+        try:
+            if commit:
+                await connection.commit()
+            else:
+                await connection.rollback()
+        finally:
+            await connection.close()
+            if self.metrics is not None:
+                end_checkout(scope, self.connection_scope_key, self.metrics, self.pool_app_state_key)
+        if self.metrics is not None:
+            if commit:
+                self.metrics.record_commit(self.pool_app_state_key)
+            else:
+                self.metrics.record_rollback(self.pool_app_state_key)
+
+    async def _call_lob(self, method: Callable[..., Any], *args: Any) -> Any:
+        return await method(*args)
+
+    def _detach_connection(self, scope: Scope) -> AsyncConnection | None:
+        return _resolve_connection(get_scope_state(scope, self.connection_scope_key, pop=True))
+
+    async def _close_detached(self, scope: Scope, connection: AsyncConnection) -> None:
+        try:
+            await connection.close()
+        finally:
+            if self.metrics is not None:
+                end_checkout(scope, self.connection_scope_key, self.metrics, self.pool_app_state_key)
+
+    async def run_statements(
+        self,
+        statements: Sequence[Statement],
+        *,
+        connection: AsyncConnection | None = None,
+        scope: Scope | None = None,
+        mode: Literal["auto", "pipeline", "fan-out"] = "auto",
+        max_concurrency: int = 4,
+        commit_each: bool = False,
+    ) -> list[StatementResult]:
+        """Run independent statements in one round trip, or concurrently when the database cannot pipeline them.
+
+        In ``pipeline`` mode the statements are sent as a single pipeline on ``connection`` (defaulting to a pooled
+        connection that is committed afterwards) and join its transaction. In ``fan-out`` mode each statement runs on a
+        pooled connection of its own, at most ``max_concurrency`` at a time; statements other than queries are only
+        allowed with ``commit_each``, as each of them is committed on its connection. ``auto`` keeps the semantics of
+        ``pipeline`` whatever the database: it pipelines if the driver and the database support it, and otherwise runs
+        the statements one after another on ``connection``, so that queries see its uncommitted changes. Only batches of
+        queries without a ``connection`` are fanned out, as they have no transaction to join.
+
+        The fanned out connections of a request given as ``scope`` come on top of the connection of the request: each
+        takes a slot of the ``connection_limiter`` and of the tenant quota, so the limits of routes that fan out must
+        leave room for ``max_concurrency`` more connections, and they are recorded to ``metrics``.
+
+        Args:
+            statements: The statements, as SQL text or ``(sql, parameters)`` tuples.
+            connection: Connection to run the statements on, e.g. the connection of the request.
+            scope: The current connection's scope, whose limits and tenant apply to the pooled connections.
+            mode: How to run the statements.
+            max_concurrency: Connections used at a time by ``fan-out``.
+            commit_each: Allow ``fan-out`` to run and commit statements other than queries.
 
-            async with pool.acquire() as connection:
-                set_scope_state(scope, self.connection_scope_key, connection)
+        Raises:
+            ValueError: If ``fan-out`` is given statements other than queries without ``commit_each``.
+
+        Returns:
+            The result of each statement, in order. A failed statement carries its error instead of failing the batch.
+        """
+        if isinstance(lazy := cast("Any", connection), LazyAsyncConnection):
+            connection = await lazy.acquire()
+        if mode == "auto" and self._pipelining is None and connection is not None:
+            self._pipelining = supports_pipelining(connection)
+        if mode == "auto" and self._pipelining is None:
+            async with self._pooled_connection(scope) as pooled:
+                self._pipelining = supports_pipelining(pooled)
+                if self._pipelining or not only_queries(statements):
+                    run = run_pipelined if self._pipelining else run_serially
+                    return await self._run_committed(run, pooled, statements)
+        if mode == "fan-out" or (
+            mode == "auto" and not self._pipelining and connection is None and only_queries(statements)
+        ):
+            return await run_fanned_out(
+                partial(self._pooled_connection, scope), statements, max_concurrency, commit_each
+            )
+        run = run_pipelined if mode == "pipeline" or self._pipelining else run_serially
+        if connection is not None:
+            return await run(connection, statements)
+        async with self._pooled_connection(scope) as pooled:
+            return await self._run_committed(run, pooled, statements)
+
+    @staticmethod
+    async def _run_committed(
+        run: Callable[[AsyncConnection, Sequence[Statement]], Awaitable[list[StatementResult]]],
+        connection: AsyncConnection,
+        statements: Sequence[Statement],
+    ) -> list[StatementResult]:
+        results = await run(connection, statements)
+        await connection.commit()
+        return results
+
+    @asynccontextmanager
+    async def _pooled_connection(self, scope: Scope | None) -> AsyncGenerator[AsyncConnection, None]:
+        """Check out a connection of its own for :meth:`run_statements`, within the limits of ``scope`` if given."""
+        if scope is None:
+            async with self.get_connection() as connection:
+                yield connection
+            return
+        release_slot = await self._enter_connection_limit(scope)
+        try:
+            connection = await self._acquire(await self.create_pool(), scope, detached=True)
+            checked_out = perf_counter()
+            try:
                 yield connection
+            except Exception as exc:
+                self._record_circuit_failure(exc)
+                raise
+            finally:
+                await connection.close()
+                if self.metrics is not None:
+                    self.metrics.record_checkout(self.pool_app_state_key, perf_counter() - checked_out)
+        finally:
+            if release_slot is not None:
+                release_slot()
+
+    def stream_query(
+        self,
+        sql: str,
+        parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None = None,
+        *,
+        stream_format: StreamFormat = "ndjson",
+        arraysize: int = 1000,
+        filename: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Stream:
+        """Return a response that streams the result set of ``sql``.
+
+        The query runs on a connection of its own, acquired when the response body starts and released as soon as the
+        last row is sent or the client disconnects. The ``before_send_handler`` never sees this connection, so it cannot
+        close it while rows are still being sent. Rows are fetched ``arraysize`` at a time, keeping memory use
+        constant regardless of the size of the result set.
+
+        Args:
+            sql: The query.
+            parameters: Bind variables of the query.
+            stream_format: ``ndjson``, ``csv`` or ``json`` (a JSON array).
+            arraysize: Rows fetched per round trip and serialized per chunk.
+            filename: Send the response as an attachment with this file name.
+            headers: Additional response headers.
+
+        Returns:
+            A :class:`Stream <litestar.response.Stream>` response.
+        """
+        if stream_format not in MEDIA_TYPES:
+            msg = f"Unsupported stream format {stream_format!r}, expected one of {', '.join(MEDIA_TYPES)}"
+            raise ValueError(msg)
+
+        async def content() -> AsyncGenerator[bytes, None]:
+            async with self.get_connection() as connection:
+                async for chunk in stream_rows(connection, sql, parameters, stream_format, arraysize):
+                    yield chunk
+
+        headers = dict(headers or {})
+        if filename is not None:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return Stream(content, media_type=MEDIA_TYPES[stream_format], headers=headers)
+
+    def stream_arrow(
+        self,
+        sql: str,
+        parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None = None,
+        *,
+        arrow_format: ArrowFormat = "arrow",
+        batch_size: int = 10_000,
+        filename: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Stream:
+        """Return a response that streams the result set of ``sql`` as Arrow record batches.
+
+        Like :meth:`stream_query`, the query runs on a connection of its own that is released once the last batch is
+        sent. Requires ``pyarrow``.
+
+        Args:
+            sql: The query.
+            parameters: Bind variables of the query.
+            arrow_format: ``arrow`` (an Arrow IPC stream) or ``parquet``.
+            batch_size: Rows per record batch.
+            filename: Send the response as an attachment with this file name.
+            headers: Additional response headers.
+
+        Returns:
+            A :class:`Stream <litestar.response.Stream>` response.
+        """
+        if arrow_format not in ARROW_MEDIA_TYPES:
+            msg = f"Unsupported Arrow format {arrow_format!r}, expected one of {', '.join(ARROW_MEDIA_TYPES)}"
+            raise ValueError(msg)
+
+        async def content() -> AsyncGenerator[bytes, None]:
+            async with self.get_connection() as connection:
+                batches = fetch_record_batches(connection, sql, parameters, size=batch_size)
+                async for chunk in encode_batches(batches, arrow_format):
+                    yield chunk
+
+        headers = dict(headers or {})
+        if filename is not None:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return Stream(content, media_type=ARROW_MEDIA_TYPES[arrow_format], headers=headers)
 
     @asynccontextmanager
     async def get_connection(
@@ -250,5 +867,14 @@ class AsyncOracleDatabaseConfig(GenericOracleDatabaseConfig[AsyncConnectionPool,
             A connection instance.
         """
         pool = await self.create_pool()
-        async with pool.acquire() as connection:
-            yield connection
+        async with AsyncExitStack() as stack:
+            with self._circuit_guard():
+                connection = await stack.enter_async_context(pool.acquire(**self._acquire_kwargs()))
+            try:
+                if self.statement_recorder is not None:
+                    yield cast("AsyncConnection", InstrumentedAsyncConnection(connection, self.statement_recorder))
+                else:
+                    yield connection
+            except Exception as exc:
+                self._record_circuit_failure(exc)
+                raise
@@ -1,27 +1,59 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, nullcontext, suppress
 from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
 from typing import TYPE_CHECKING, ClassVar, Generic, Literal, TypeVar, cast
 
+from litestar.background_tasks import BackgroundTask
 from litestar.constants import HTTP_DISCONNECT, HTTP_RESPONSE_START, WEBSOCKET_CLOSE, WEBSOCKET_DISCONNECT
+from litestar.datastructures import Headers
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.response import Stream
+from litestar.status_codes import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT
 from litestar.types import Empty
-from oracledb import ConnectionPool
+from oracledb import DB_TYPE_BLOB, ConnectionPool
+
+from litestar_oracledb._utils import get_scope_state, set_scope_state
+from litestar_oracledb.bulk import BulkWriteResult, bulk_statement, iter_batches
+from litestar_oracledb.cache import QueryCache, RequestCache
+from litestar_oracledb.instrumentation import StatementRecorder
+from litestar_oracledb.lob import parse_range, read_chunks, write_chunks
 
 if TYPE_CHECKING:
     import ssl
-    from collections.abc import Callable
+    from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Collection, Iterable, Sequence
+    from contextlib import AbstractAsyncContextManager, AbstractContextManager
     from typing import Any
 
     from litestar.datastructures.state import State
-    from litestar.types import BeforeMessageSendHookHandler, EmptyType
-    from oracledb import AuthMode, ConnectParams, Purity
+    from litestar.types import BeforeMessageSendHookHandler, EmptyType, Scope
+    from oracledb import LOB, AsyncLOB, AuthMode, ConnectParams, PoolGetMode, Purity
     from oracledb.connection import AsyncConnection, Connection
     from oracledb.pool import AsyncConnectionPool, ConnectionPool
 
+    from litestar_oracledb.advisor import StatementCacheAdvisor
+    from litestar_oracledb.breaker import CircuitBreaker, CircuitState
+    from litestar_oracledb.bulk import BulkRow
+    from litestar_oracledb.drcp import DRCP
+    from litestar_oracledb.limits import ConnectionLimiter
+    from litestar_oracledb.metrics import PoolMetrics
+    from litestar_oracledb.retry import RetryPolicy
+    from litestar_oracledb.sizing import PoolSizer
+    from litestar_oracledb.tenancy import TenantRouting
+
+    BatchExecutor = Callable[[str, list[BulkRow], bool], Awaitable[tuple[int, list[Any]]]]
+
 CONNECTION_SCOPE_KEY = "_oracledb_db_connection"
 SESSION_TERMINUS_ASGI_EVENTS = {HTTP_RESPONSE_START, HTTP_DISCONNECT, WEBSOCKET_DISCONNECT, WEBSOCKET_CLOSE}
 T = TypeVar("T")
 
+logger = logging.getLogger("litestar_oracledb")
+
 """Path to the Alembic templates."""
 ConnectionT = TypeVar("ConnectionT", bound="Connection | AsyncConnection")
 PoolT = TypeVar("PoolT", bound="ConnectionPool | AsyncConnectionPool")
@@ -33,6 +65,19 @@ class GenericOraclePoolConfig(Generic[PoolT, ConnectionT]):
     dsn: str | EmptyType = Empty
     pool: PoolT | EmptyType = Empty
     params: ConnectParams | EmptyType = Empty
+    min: int | EmptyType = Empty
+    max: int | EmptyType = Empty
+    increment: int | EmptyType = Empty
+    getmode: PoolGetMode | EmptyType = Empty
+    homogeneous: bool | EmptyType = Empty
+    timeout: int | EmptyType = Empty
+    wait_timeout: int | EmptyType = Empty
+    max_lifetime_session: int | EmptyType = Empty
+    session_callback: Callable | EmptyType = Empty
+    max_sessions_per_shard: int | EmptyType = Empty
+    soda_metadata_cache: bool | EmptyType = Empty
+    ping_interval: int | EmptyType = Empty
+    ping_timeout: int | EmptyType = Empty
     user: str | EmptyType = Empty
     proxy_user: str | EmptyType = Empty
     password: str | EmptyType = Empty
@@ -79,7 +124,7 @@ class GenericOraclePoolConfig(Generic[PoolT, ConnectionT]):
 
 
 @dataclass
-class GenericOracleDatabaseConfig(Generic[PoolT, ConnectionT]):
+class GenericOracleDatabaseConfig(ABC, Generic[PoolT, ConnectionT]):
     """Oracle database Configuration."""
 
     pool_app_state_key: str = "db_pool"
@@ -105,6 +150,152 @@ class GenericOracleDatabaseConfig(Generic[PoolT, ConnectionT]):
     The handler should handle closing the session stored in the ASGI scope, if it's still open, and committing and
     uncommitted data.
     """
+    lazy_connection: bool = False
+    """Defer checking out a connection from the pool until it is first used.
+
+    When enabled, the connection dependency is a proxy that acquires a pooled connection on the first ``cursor()``,
+    ``execute()`` (or any other statement) call. Handlers that never run SQL never occupy a pool slot, and the
+    ``before_send_handler`` skips commit, rollback and close for them. The sync config acquires on the thread that first
+    uses the connection, the event loop for async handlers, so it rejects ``lazy_connection`` with ``use_executor``, a
+    ``connection_limiter`` or a tenant quota.
+    """
+    release_mode: Literal["response", "handler"] = "response"
+    """When the connection stored under ``connection_scope_key`` is returned to the pool.
+
+    ``"response"`` leaves it to the ``before_send_handler``, which ends the transaction and releases the connection when
+    the response starts. ``"handler"`` commits (or rolls back if the handler raised) and releases the connection as soon
+    as the handler returns, before the response is sent. Use it for streaming responses and slow clients so that the
+    pool is not drained by requests that are done with the database.
+    """
+    metrics: PoolMetrics | None = None
+    """Optional :class:`PoolMetrics <litestar_oracledb.metrics.PoolMetrics>` recorder.
+
+    Records acquire wait times, how long connections stay checked out per request, commits and rollbacks issued by the
+    plugin, and pool usage sampled every ``metrics_sample_interval`` seconds.
+    """
+    metrics_sample_interval: float = 10.0
+    """Seconds between two pool usage samples recorded to ``metrics``."""
+    instrument_statements: bool = False
+    """Time every statement run on the connections handed out by the plugin.
+
+    Per-statement latency, rows, round trips and the normalized SQL are recorded to ``metrics`` as
+    :class:`StatementStatistics <litestar_oracledb.instrumentation.StatementStatistics>`. Rows are never wrapped one by
+    one, so the overhead is a few microseconds per statement.
+    """
+    slow_query_threshold: float | None = None
+    """Log statements taking this many seconds or more to the ``litestar_oracledb.slow_query`` logger, with the route
+    of the request that ran them. Setting it enables ``instrument_statements``.
+    """
+    statement_cache_advisor: StatementCacheAdvisor | None = None
+    """Model the statement cache of the connections from the statements they run, to size ``stmtcachesize``.
+
+    The :class:`StatementCacheAdvisor <litestar_oracledb.advisor.StatementCacheAdvisor>` reports the hit ratio, the
+    recommended size and the SQL cardinality of every route, flags statements built without bind variables, and
+    resizes acquired connections when ``auto_apply`` is set. Setting it enables ``instrument_statements``.
+    """
+    request_cache: bool = False
+    """Cache the results of queries repeated on the connection of a request.
+
+    Queries are keyed by their SQL text and bind values; anything else run on the connection (DML, PL/SQL, rollback)
+    empties the cache, so a request always sees its own writes. The cache is discarded with the request and never serves
+    data across requests. See :meth:`get_request_cache` for its hit and miss counts.
+    """
+    query_cache: QueryCache | None = None
+    """Application-wide :class:`QueryCache <litestar_oracledb.cache.QueryCache>` used by :meth:`cached_fetchall`."""
+    query_cache_tables: Sequence[str] = ()
+    """Tables watched with Continuous Query Notification while the application runs.
+
+    A change to one of them evicts the ``query_cache`` entries read from it. Requires python-oracledb Thick mode, so
+    only the sync config supports it; the pool is created with ``events=True``.
+    """
+    warmup: bool = False
+    """Open connections while the application starts, so the first requests do not pay for connection establishment.
+
+    ``warmup_connections`` connections are acquired in parallel, ``warmup_statement`` is run on each of them and they
+    are released back to the pool. The time it took is logged to the ``litestar_oracledb`` logger.
+    """
+    warmup_connections: int | None = None
+    """Number of connections opened by ``warmup``. Defaults to the ``min`` size of the pool."""
+    warmup_statement: str | None = None
+    """Statement run on every connection opened by ``warmup``, e.g. ``select 1 from dual``."""
+    warmup_blocking: bool = True
+    """Hold application startup until ``warmup`` is done.
+
+    When disabled, the warm-up runs in the background and :attr:`pool_ready` tells a readiness probe when it is done.
+    """
+    session_callback: Callable[[ConnectionT, str | None], Any] | None = None
+    """Set up the session state (``ALTER SESSION``, NLS settings, ``DBMS_APPLICATION_INFO``...) of a pooled connection.
+
+    Installed as the ``session_callback`` of the pool, so python-oracledb only calls it when a connection is used for
+    the first time or its tag differs from the requested ``session_tag``, instead of on every request. It receives the
+    connection and the requested tag; the connection is retagged afterwards so that the next acquire with the same tag
+    skips it. python-oracledb ignores tags in Thin mode, where the callback runs once per new connection.
+    """
+    session_tag: str | Callable[[Scope], str | None] | None = None
+    """Tag requested when acquiring a connection, e.g. ``"NLS_DATE_FORMAT=ISO"``.
+
+    Either a fixed tag, or a callable returning the tag of a request from its scope, to tag connections per route or
+    per tenant.
+    """
+    session_matchanytag: bool = False
+    """Accept a connection with a different tag when none with the requested ``session_tag`` is free."""
+    connection_limiter: ConnectionLimiter | None = None
+    """Limit the requests holding or waiting for a connection per route, rejecting the excess with ``503``.
+
+    See :class:`ConnectionLimiter <litestar_oracledb.limits.ConnectionLimiter>`. A slot is taken before the connection is
+    acquired and given back once the response of the handler has been built.
+    """
+    circuit_breaker: CircuitBreaker | None = None
+    """Fail requests with ``503`` right away while the database cannot be reached.
+
+    The :class:`CircuitBreaker <litestar_oracledb.breaker.CircuitBreaker>` gates every connection acquired by
+    ``provide_connection`` and ``get_connection`` and counts the connection errors raised while acquiring or using them.
+    Transitions are logged to the ``litestar_oracledb`` logger and recorded to ``metrics``.
+    """
+    retry_policy: RetryPolicy | None = None
+    """Replay idempotent statements of the injected connection on a new connection after a transient failure.
+
+    See :class:`RetryPolicy <litestar_oracledb.retry.RetryPolicy>`. The lost connection is dropped from the pool and
+    its replacement is acquired with the same ``session_tag``, so ``session_callback`` restores the session state.
+    Application Continuity, when enabled on the service, replays calls in the driver first; the policy only handles
+    the errors that reach the application.
+    """
+    pool_sizer: PoolSizer | None = None
+    """Resize the pool while the application runs from observed acquire waits, busy ratio and acquire errors.
+
+    The :class:`PoolSizer <litestar_oracledb.sizing.PoolSizer>` decides every ``interval`` seconds within its bounds;
+    resizes are logged to the ``litestar_oracledb`` logger and recorded to ``metrics``. python-oracledb can only
+    reconfigure sync pools, so only the sync config supports it.
+    """
+    drcp: DRCP | None = None
+    """Connect through Database Resident Connection Pooling.
+
+    See :class:`DRCP <litestar_oracledb.drcp.DRCP>`. The DSN of the pool must request a pooled server; its connection
+    class, purity and pool boundary are set from it unless ``pool_config`` sets them. Connections are acquired with the
+    connection class of their route, and the sessions saved are reported by :meth:`DRCP.report
+    <litestar_oracledb.drcp.DRCP.report>`.
+    """
+    tenancy: TenantRouting | None = None
+    """Route connections by tenant, reusing the sessions already set up for the tenant of a request.
+
+    See :class:`TenantRouting <litestar_oracledb.tenancy.TenantRouting>`. Connections are acquired with the tag of the
+    tenant, or as its proxy user, and set up with its context only when the session was not yet; per-tenant quotas
+    reject the requests of a tenant holding too many connections with ``503``. Replaces ``session_tag``.
+    """
+    pool_ready: bool = field(init=False, default=False)
+    """``True`` once the pool has been created and, if ``warmup`` is enabled, warmed up."""
+    statement_recorder: StatementRecorder | None = field(init=False, default=None)
+    """The :class:`StatementRecorder <litestar_oracledb.instrumentation.StatementRecorder>` used when statements are
+    instrumented.
+    """
+    before_send_scope_keys: frozenset[str] | None = field(init=False, default=None)
+    """Scope state keys the ``before_send_handler`` acts on, or ``None`` for a custom handler.
+
+    The handlers built by the config only act on messages ending a session of a scope holding one of these keys, so the
+    plugin skips them for every other message.
+    """
+    _commit_streamed: bool = field(init=False, default=False, repr=False)
+    """Commit the connection handed over to a :meth:`stream_lob` response, as the ``autocommit`` handlers would."""
     _CONNECTION_SCOPE_KEY_REGISTRY: ClassVar[set[str]] = field(init=False, default=cast("set[str]", set()))
     """Internal counter for ensuring unique identification of session scope keys in the class."""
     _POOL_APP_STATE_KEY_REGISTRY: ClassVar[set[str]] = field(init=False, default=cast("set[str]", set()))
@@ -122,6 +313,417 @@ class GenericOracleDatabaseConfig(Generic[PoolT, ConnectionT]):
         self.pool_app_state_key = self._ensure_unique("_POOL_APP_STATE_KEY_REGISTRY", self.pool_app_state_key)
         self.__class__._CONNECTION_SCOPE_KEY_REGISTRY.add(self.connection_scope_key)  # noqa: SLF001
         self.__class__._POOL_APP_STATE_KEY_REGISTRY.add(self.pool_app_state_key)  # noqa: SLF001
+        if not callable(self.before_send_handler):
+            self.before_send_scope_keys = frozenset({self.connection_scope_key})
+            self._commit_streamed = self.before_send_handler in {"autocommit", "autocommit_include_redirects"}
+        if self.session_callback is not None and self.pool_instance is not None:
+            self.pool_instance.session_callback = self._run_session_callback
+        if self.drcp is not None:
+            if self.pool_instance is not None:
+                self.drcp.validate_dsn(getattr(self.pool_instance, "dsn", None))
+            elif (pool_config := getattr(self, "pool_config", None)) is not None:
+                self.drcp.configure(pool_config)
+        if self.tenancy is not None:
+            if self.session_tag is not None:
+                msg = "'tenancy' tags connections per tenant, it can not be combined with 'session_tag'."
+                raise ImproperlyConfiguredException(msg)
+            if (pool_config := getattr(self, "pool_config", None)) is not None:
+                self.tenancy.configure(pool_config)
+        if (
+            self.instrument_statements
+            or self.slow_query_threshold is not None
+            or self.statement_cache_advisor is not None
+        ):
+            self.statement_recorder = StatementRecorder(
+                pool=self.pool_app_state_key,
+                metrics=self.metrics,
+                slow_query_threshold=self.slow_query_threshold,
+                advisor=self.statement_cache_advisor,
+            )
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.listeners.append(self._on_circuit_change)
+
+    def _run_session_callback(self, connection: ConnectionT, requested_tag: str | None) -> Any:
+        """Run ``session_callback`` and tag ``connection`` with ``requested_tag``.
+
+        Args:
+            connection: The connection handed out by the pool.
+            requested_tag: The tag passed to ``acquire()``.
+
+        Returns:
+            The return value of ``session_callback``, so that coroutines can be awaited by the pool.
+        """
+        result = cast("Callable[[ConnectionT, str | None], Any]", self.session_callback)(connection, requested_tag)
+        if requested_tag and hasattr(connection, "tag"):
+            connection.tag = requested_tag
+        return result
+
+    async def cached_fetchall(
+        self,
+        sql: str,
+        parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None = None,
+        *,
+        connection: ConnectionT | None = None,
+        tables: Collection[str] | None = None,
+        ttl: float | None = None,
+    ) -> list[Any]:
+        """Return the rows of ``sql``, from ``query_cache`` when possible.
+
+        Args:
+            sql: The query.
+            parameters: Its bind values.
+            connection: Connection to run the query on after a cache miss. Defaults to a connection from the pool.
+            tables: Tables whose changes evict the entry. Defaults to the tables found in ``sql``.
+            ttl: Lifetime of the entry, overriding the default of the cache.
+
+        Returns:
+            The rows.
+        """
+        if self.query_cache is None:
+            msg = "'cached_fetchall' requires a 'query_cache'."
+            raise ImproperlyConfiguredException(msg)
+        return await self.query_cache.fetch(
+            sql,
+            parameters,
+            partial(self._fetch_rows, sql, parameters, connection),
+            tables=tables,
+            ttl=ttl,
+        )
+
+    @abstractmethod
+    async def _fetch_rows(
+        self, sql: str, parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None, connection: ConnectionT | None
+    ) -> list[Any]:
+        """Run ``sql`` on ``connection``, or on a connection from the pool, and return all of its rows."""
+
+    async def bulk_insert(
+        self,
+        table: str,
+        rows: Iterable[BulkRow] | AsyncIterable[BulkRow],
+        *,
+        columns: Sequence[str] | None = None,
+        upsert_keys: Sequence[str] | None = None,
+        connection: ConnectionT | None = None,
+        batch_size: int = 1000,
+        max_batch_bytes: int | None = None,
+        batcherrors: bool = False,
+    ) -> BulkWriteResult:
+        """Write ``rows`` to ``table`` with array DML, one ``executemany`` round trip per batch.
+
+        ``rows`` is consumed one batch at a time, so an (async) generator can feed arbitrarily many rows in bounded
+        memory.
+
+        Args:
+            table: The target table.
+            rows: Mappings of column names to values, or sequences of values in the order of ``columns``.
+            columns: The columns to write. Defaults to the keys of the first mapping row.
+            upsert_keys: Merge on these columns, updating existing rows, instead of inserting.
+            connection: Connection to write on, left for the caller to commit. Defaults to a connection from the pool,
+                committed once all batches are written.
+            batch_size: Maximum rows per batch.
+            max_batch_bytes: Maximum estimated size of the values of a batch.
+            batcherrors: Report rows rejected by the database in the result instead of failing their batch.
+
+        Returns:
+            The outcome of the write.
+        """
+        result = BulkWriteResult()
+        sql: str | None = None
+        async with self._bulk_executor(connection) as execute:
+            async for batch in iter_batches(rows, batch_size, max_batch_bytes):
+                if sql is None:
+                    sql = bulk_statement(table, batch[0], columns, upsert_keys)
+                result.record_batch(batch, *await execute(sql, batch, batcherrors))
+        return result
+
+    @abstractmethod
+    def _bulk_executor(self, connection: ConnectionT | None) -> AbstractAsyncContextManager[BatchExecutor]:
+        """Return a context providing a coroutine function that writes one batch on ``connection``."""
+
+    async def stream_lob(
+        self,
+        scope: Scope,
+        lob: LOB | AsyncLOB,
+        *,
+        media_type: str | None = None,
+        filename: str | None = None,
+        chunk_size: int = 1024 * 1024,
+        headers: dict[str, str] | None = None,
+    ) -> Stream:
+        """Return a response that streams ``lob`` one ``chunk_size`` piece at a time.
+
+        ``lob`` must have been fetched on the connection provided for ``scope``. That connection is handed over to the
+        response: with an ``autocommit`` ``before_send_handler`` its transaction is committed right away, as the
+        response is successful, otherwise it is rolled back when the connection is returned to the pool. That happens
+        once the last chunk is sent or the client disconnects, after a ``HEAD`` response, or once another response,
+        e.g. for an exception raised after the handler, has been sent instead. BLOB responses honour a single ``Range``
+        request.
+
+        Args:
+            scope: The current connection's scope.
+            lob: The BLOB or CLOB to send.
+            media_type: The response media type. Defaults to ``application/octet-stream`` for BLOBs and
+                ``text/plain`` for CLOBs.
+            filename: Send the response as an attachment with this file name.
+            chunk_size: Bytes or characters read per round trip. A multiple of ``lob.getchunksize()`` is most efficient.
+            headers: Additional response headers.
+
+        Returns:
+            A :class:`Stream <litestar.response.Stream>` response.
+        """
+        size = cast("int", await self._call_lob(lob.size))
+        binary = lob.type is DB_TYPE_BLOB
+        headers = dict(headers or {})
+        start, stop, status_code = 0, size, HTTP_200_OK
+        if binary:
+            headers["Accept-Ranges"] = "bytes"
+            if byte_range := parse_range(Headers.from_scope(scope).get("range"), size):
+                (start, stop), status_code = byte_range, HTTP_206_PARTIAL_CONTENT
+                headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+            headers["Content-Length"] = str(stop - start)
+        if filename is not None:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        connection = self._detach_connection(scope)
+        if connection is not None:
+            set_scope_state(scope, self.streamed_connection_scope_key, connection)
+            if self._commit_streamed:
+                await self._call_lob(connection.commit)
+                if self.metrics is not None:
+                    self.metrics.record_commit(self.pool_app_state_key)
+
+        async def content() -> AsyncGenerator[bytes, None]:
+            try:
+                async for chunk in read_chunks(partial(self._call_lob, lob.read), start, stop, chunk_size):
+                    yield chunk
+            finally:
+                await self.close_streamed_connection(scope)
+
+        return Stream(
+            content,
+            media_type=media_type or ("application/octet-stream" if binary else "text/plain"),
+            status_code=status_code,
+            headers=headers,
+            background=BackgroundTask(self.close_streamed_connection, scope),
+        )
+
+    @property
+    def streamed_connection_scope_key(self) -> str:
+        """Key under which the connection handed over to a :meth:`stream_lob` response is stored in the scope."""
+        return f"{self.connection_scope_key}_streamed"
+
+    async def close_streamed_connection(self, scope: Scope) -> None:
+        """Return the connection handed over to a :meth:`stream_lob` response of ``scope`` to the pool, if any.
+
+        Called when the response body has been sent, and by the plugin once any response of ``scope`` is complete.
+
+        Args:
+            scope: The current connection's scope.
+        """
+        connection = get_scope_state(scope, self.streamed_connection_scope_key, pop=True)
+        if connection is not None:
+            await self._close_detached(scope, connection)
+
+    async def write_lob(
+        self,
+        lob: LOB | AsyncLOB,
+        chunks: AsyncIterable[bytes],
+        *,
+        buffer_size: int = 1024 * 1024,
+    ) -> int:
+        """Write ``chunks``, e.g. ``request.stream()``, to ``lob`` without holding more than ``buffer_size`` bytes.
+
+        The transaction is left to the caller, or to the ``before_send_handler`` when ``lob`` belongs to the connection
+        provided for the request.
+
+        Args:
+            lob: The BLOB or CLOB to write, e.g. returned by ``insert ... returning`` an ``empty_blob()``.
+            chunks: The content. CLOB content is decoded as UTF-8.
+            buffer_size: Bytes collected before each write. A multiple of ``lob.getchunksize()`` is most efficient.
+
+        Returns:
+            The bytes (BLOB) or characters (CLOB) written.
+        """
+        return await write_chunks(
+            partial(self._call_lob, lob.write), chunks, buffer_size, text=lob.type is not DB_TYPE_BLOB
+        )
+
+    @abstractmethod
+    async def _call_lob(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call a method of a LOB, which is blocking for sync connections."""
+
+    @abstractmethod
+    def _detach_connection(self, scope: Scope) -> ConnectionT | None:
+        """Take the connection of ``scope`` away from the ``before_send_handler``."""
+
+    @abstractmethod
+    async def _close_detached(self, scope: Scope, connection: ConnectionT) -> None:
+        """Return a connection taken with :meth:`_detach_connection` to the pool."""
+
+    def get_request_cache(self, scope: Scope) -> RequestCache | None:
+        """Return the result cache of the connection of ``scope``.
+
+        Args:
+            scope: The current connection's scope.
+
+        Returns:
+            The :class:`RequestCache <litestar_oracledb.cache.RequestCache>`, or ``None`` if ``request_cache`` is
+            disabled or no connection was acquired for the request.
+        """
+        return cast("RequestCache | None", get_scope_state(scope, f"{self.connection_scope_key}_cache"))
+
+    def _new_request_cache(self, scope: Scope) -> RequestCache:
+        cache = RequestCache(pool=self.pool_app_state_key, metrics=self.metrics)
+        set_scope_state(scope, f"{self.connection_scope_key}_cache", cache)
+        return cache
+
+    async def _enter_connection_limit(self, scope: Scope) -> Callable[[], None] | None:
+        """Take a ``connection_limiter`` slot and a tenant quota slot for ``scope``, returning the callable that gives
+        them back.
+        """
+        release_route = (
+            await self.connection_limiter.acquire(scope, self.metrics, self.pool_app_state_key)
+            if self.connection_limiter is not None
+            else None
+        )
+        if self.tenancy is None or self.tenancy.quota is None:
+            return release_route
+        try:
+            release_tenant = await self.tenancy.quota.acquire(scope, self.metrics, self.pool_app_state_key)
+        except BaseException:
+            if release_route is not None:
+                release_route()
+            raise
+        if release_route is None or release_tenant is None:
+            return release_route or release_tenant
+
+        def release() -> None:
+            release_tenant()
+            release_route()
+
+        return release
+
+    def _circuit_guard(self) -> AbstractContextManager[None]:
+        """Return a context gating a connection acquire with ``circuit_breaker``."""
+        return self.circuit_breaker.guard() if self.circuit_breaker is not None else nullcontext()
+
+    def _record_circuit_failure(self, exc: BaseException) -> None:
+        """Count an error raised while using a connection against ``circuit_breaker``."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure(exc)
+
+    def _on_circuit_change(self, old_state: CircuitState, new_state: CircuitState) -> None:
+        log = logger.warning if new_state == "open" else logger.info
+        log("Circuit of %s went from %s to %s", self.pool_app_state_key, old_state, new_state)
+        if self.metrics is not None:
+            self.metrics.record_circuit_state(self.pool_app_state_key, old_state, new_state)
+
+    def _acquire_kwargs(self, scope: Scope | None = None) -> dict[str, Any]:
+        """Return the keyword arguments of ``pool.acquire()`` for a connection of ``scope``.
+
+        Args:
+            scope: The current connection's scope, if any.
+
+        Returns:
+            The tag, tenant and DRCP arguments, or an empty dict when none of ``session_tag``, ``tenancy`` and
+            ``drcp`` is configured.
+        """
+        kwargs = self.drcp.acquire_kwargs(scope) if self.drcp is not None else {}
+        if self.tenancy is not None:
+            kwargs.update(self.tenancy.acquire_kwargs(scope))
+        if callable(self.session_tag):
+            tag = self.session_tag(scope) if scope is not None else None
+        else:
+            tag = self.session_tag
+        if tag is not None:
+            kwargs.update(tag=tag, matchanytag=self.session_matchanytag)
+        return kwargs
+
+    @asynccontextmanager
+    async def _sample_pool_usage(self, pool: PoolT) -> AsyncGenerator[None, None]:
+        """Record pool usage to ``metrics`` in a background task while the context is active.
+
+        Args:
+            pool: The pool to sample.
+        """
+        if self.metrics is None:
+            yield
+            return
+        task = asyncio.create_task(self._record_pool_usage(pool, self.metrics))
+        try:
+            yield
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    @asynccontextmanager
+    async def _warm_up_pool(self, pool: PoolT) -> AsyncGenerator[None, None]:
+        """Warm up ``pool`` when ``warmup`` is enabled, and track :attr:`pool_ready` while the context is active.
+
+        Args:
+            pool: The pool to warm up.
+        """
+        task: asyncio.Task[None] | None = None
+        if not self.warmup:
+            self.pool_ready = True
+        elif self.warmup_blocking:
+            await self._warm_up(pool)
+        else:
+            task = asyncio.create_task(self._warm_up(pool))
+        try:
+            yield
+        finally:
+            self.pool_ready = False
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+    async def _warm_up(self, pool: PoolT) -> None:
+        count = self.warmup_connections if self.warmup_connections is not None else pool.min
+        started = perf_counter()
+        results = await asyncio.gather(*(self._open_connection(pool) for _ in range(count)), return_exceptions=True)
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        await asyncio.gather(*(self._close_connection(pool, connection) for connection in connections))
+        self.pool_ready = True
+        elapsed = perf_counter() - started
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            logger.warning(
+                "Warmed up %d of %d connections of %s in %.3fs, first error: %r",
+                len(connections),
+                count,
+                self.pool_app_state_key,
+                elapsed,
+                failures[0],
+            )
+        else:
+            logger.info("Warmed up %d connections of %s in %.3fs", count, self.pool_app_state_key, elapsed)
+
+    @abstractmethod
+    async def _open_connection(self, pool: PoolT) -> ConnectionT:
+        """Acquire a connection from ``pool`` and run ``warmup_statement`` on it.
+
+        Args:
+            pool: The pool to acquire from.
+
+        Returns:
+            The acquired connection.
+        """
+
+    @abstractmethod
+    async def _close_connection(self, pool: PoolT, connection: ConnectionT) -> None:
+        """Release a connection opened by :meth:`_open_connection`.
+
+        Args:
+            pool: The pool the connection belongs to.
+            connection: The connection.
+        """
+
+    async def _record_pool_usage(self, pool: PoolT, metrics: PoolMetrics) -> None:
+        while True:
+            metrics.record_pool_usage(self.pool_app_state_key, busy=pool.busy, opened=pool.opened, max_size=pool.max)
+            await asyncio.sleep(self.metrics_sample_interval)
 
     def provide_pool(self, state: State) -> PoolT:
         """Create a pool instance.
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Literal, Sequence, cast
+
+from litestar.constants import HTTP_RESPONSE_START
+from litestar.di import Provide
+from litestar.exceptions import ServiceUnavailableException
+from oracledb import Error as OracleError
+
+from litestar_oracledb._utils import get_scope_state, set_scope_state
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterator
+    from typing import Any
+
+    from litestar import Litestar
+    from litestar.datastructures.state import State
+    from litestar.types import Message, Scope
+    from oracledb.connection import AsyncConnection
+
+    from litestar_oracledb.config._asyncio import AsyncOracleDatabaseConfig
+
+__all__ = ("AsyncRoutingDatabaseConfig",)
+
+logger = logging.getLogger("litestar_oracledb")
+
+DEFAULT_LAG_QUERY = """
+select extract(day from lag) * 86400 + extract(hour from lag) * 3600 + extract(minute from lag) * 60
+    + extract(second from lag)
+from (select to_dsinterval(value) as lag from v$dataguard_stats where name = 'apply lag')
+"""
+
+
+@dataclass
+class AsyncRoutingDatabaseConfig:
+    """Route the connection dependency to a primary pool or to read-only replica pools.
+
+    Each pool is configured by its own :class:`AsyncOracleDatabaseConfig`, whose lifespan, transaction handling and
+    options apply as usual; this config only chooses which of them provides the connection of a request. Reads go to
+    the replicas in turn, writes to the primary. A replica that fails to hand out a connection, whether with a database
+    error, an open circuit breaker or a full connection limit, or that lags behind by more than ``max_replica_lag``, is
+    skipped and its requests fall back to the primary.
+    """
+
+    primary: AsyncOracleDatabaseConfig
+    """Config of the read-write pool."""
+    replicas: Sequence[AsyncOracleDatabaseConfig] = ()
+    """Configs of the read-only pools, e.g. Active Data Guard standbys."""
+    connection_dependency_key: str = "db_connection"
+    """Key under which the routed connection is injected."""
+    connection_scope_key: str = "_oracledb_routing"
+    """Key under which the name of the pool serving the request is stored in the connection scope."""
+    route_opt_key: str = "db"
+    """Key of the route handler ``opt`` that selects the pool: ``"read"`` or ``"write"``."""
+    read_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    """HTTP methods routed to the replicas when the route handler does not say otherwise."""
+    replica_retry_after: float = 30.0
+    """Seconds a replica is skipped after it failed to hand out a connection."""
+    max_replica_lag: float | None = None
+    """Skip replicas whose apply lag exceeds this many seconds. Lag is not checked if ``None``."""
+    lag_query: str = DEFAULT_LAG_QUERY
+    """Query returning the apply lag of a replica in seconds."""
+    lag_check_interval: float = 5.0
+    """Seconds between two lag checks."""
+    pool_header: str | None = None
+    """Response header reporting the pool that served the request, e.g. ``"X-Database-Pool"``."""
+    _unavailable: dict[str, float] = field(init=False, default_factory=dict)
+    _rotation: Iterator[int] = field(init=False, default_factory=itertools.count)
+
+    @property
+    def pool_app_state_key(self) -> str:
+        return self.primary.pool_app_state_key
+
+    @property
+    def configs(self) -> list[AsyncOracleDatabaseConfig]:
+        """Return the primary and replica configs."""
+        return [self.primary, *self.replicas]
+
+    @property
+    def signature_namespace(self) -> dict[str, Any]:
+        return self.primary.signature_namespace
+
+    @property
+    def dependencies(self) -> dict[str, Any]:
+        return {
+            self.primary.pool_dependency_key: Provide(self.primary.provide_pool, sync_to_thread=False),
+            self.connection_dependency_key: Provide(self.provide_connection),
+        }
+
+    @property
+    def before_send_scope_keys(self) -> frozenset[str] | None:
+        """Scope state keys the ``before_send_handler`` acts on, ``None`` if a config has a custom handler."""
+        keys = [config.before_send_scope_keys for config in self.configs]
+        if any(config_keys is None for config_keys in keys):
+            return None
+        return frozenset({self.connection_scope_key}).union(*cast("list[frozenset[str]]", keys))
+
+    @property
+    def before_send_handler(self) -> Any:
+        handlers = [config.before_send_handler for config in self.configs]
+
+        async def handler(message: Message, scope: Scope) -> None:
+            for config_handler in handlers:
+                await config_handler(message, scope)  # type: ignore[misc,operator]
+            if self.pool_header is not None and message["type"] == HTTP_RESPONSE_START:
+                served_by = self.get_served_by(scope)
+                if served_by is not None:
+                    headers = list(message.get("headers", ()))
+                    headers.append((self.pool_header.lower().encode("latin-1"), served_by.encode("latin-1")))
+                    message["headers"] = headers
+
+        return handler
+
+    @asynccontextmanager
+    async def lifespan(self, app: Litestar) -> AsyncGenerator[None, None]:
+        async with AsyncExitStack() as stack:
+            for config in self.configs:
+                await stack.enter_async_context(config.lifespan(app))
+            task = (
+                asyncio.create_task(self._monitor_lag()) if self.max_replica_lag is not None and self.replicas else None
+            )
+            try:
+                yield
+            finally:
+                if task is not None:
+                    task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await task
+
+    def get_served_by(self, scope: Scope) -> str | None:
+        """Return the ``pool_app_state_key`` of the pool that provided the connection of ``scope``.
+
+        Args:
+            scope: The current connection's scope.
+
+        Returns:
+            The pool name, or ``None`` if no connection was provided.
+        """
+        return cast("str | None", get_scope_state(scope, self.connection_scope_key))
+
+    def is_read(self, scope: Scope) -> bool:
+        """Return ``True`` if the request of ``scope`` can be served by a replica.
+
+        Args:
+            scope: The current connection's scope.
+
+        Returns:
+            Whether the request only reads.
+        """
+        route_handler = scope.get("route_handler")
+        target = route_handler.opt.get(self.route_opt_key) if route_handler is not None else None
+        if target is not None:
+            return bool(target == "read")
+        return scope.get("method", "GET") in self.read_methods
+
+    def _candidates(self, target: Literal["read", "write"]) -> list[AsyncOracleDatabaseConfig]:
+        if target == "write" or not self.replicas:
+            return [self.primary]
+        now = monotonic()
+        start = next(self._rotation) % len(self.replicas)
+        replicas = [*self.replicas[start:], *self.replicas[:start]]
+        return [
+            *(replica for replica in replicas if self._unavailable.get(replica.pool_app_state_key, 0) <= now),
+            self.primary,
+        ]
+
+    def mark_unavailable(self, config: AsyncOracleDatabaseConfig, seconds: float | None = None) -> None:
+        """Skip the replica of ``config`` for ``seconds``, defaulting to ``replica_retry_after``.
+
+        Args:
+            config: The replica config.
+            seconds: How long to skip it.
+        """
+        seconds = self.replica_retry_after if seconds is None else seconds
+        self._unavailable[config.pool_app_state_key] = monotonic() + seconds
+
+    async def provide_connection(self, state: State, scope: Scope) -> AsyncGenerator[AsyncConnection, None]:
+        """Provide a connection from the pool selected for the request.
+
+        Args:
+            state: The ``Litestar.state`` instance.
+            scope: The current connection's scope.
+
+        Returns:
+            A connection instance.
+        """
+        read = self.is_read(scope)
+        candidates = self._candidates("read" if read else "write")
+        for config in candidates:
+            provider = config.provide_connection(state, scope)
+            try:
+                connection = await provider.__anext__()
+            except (OracleError, ServiceUnavailableException):
+                if config is self.primary:
+                    raise
+                logger.warning("Replica %s unavailable, falling back", config.pool_app_state_key, exc_info=True)
+                self.mark_unavailable(config)
+                continue
+            break
+        set_scope_state(scope, self.connection_scope_key, config.pool_app_state_key)
+        if config.metrics is not None:
+            fallback = read and bool(self.replicas) and config is self.primary
+            config.metrics.record_route(config.pool_app_state_key, fallback=fallback)
+        try:
+            yield connection
+        except Exception as exc:
+            with suppress(StopAsyncIteration):
+                await provider.athrow(exc)
+            raise
+        with suppress(StopAsyncIteration):
+            await provider.__anext__()
+
+    async def _monitor_lag(self) -> None:
+        max_lag = cast("float", self.max_replica_lag)
+        while True:
+            for replica in self.replicas:
+                try:
+                    async with replica.get_connection() as connection:
+                        row = await connection.fetchone(self.lag_query)
+                except (OracleError, ServiceUnavailableException):
+                    logger.warning("Could not check lag of replica %s", replica.pool_app_state_key, exc_info=True)
+                    self.mark_unavailable(replica)
+                    continue
+                lag = row[0] if row else None
+                if lag is not None and lag > max_lag:
+                    logger.warning("Replica %s lags by %.1fs", replica.pool_app_state_key, lag)
+                    self.mark_unavailable(replica, self.lag_check_interval)
+            await asyncio.sleep(self.lag_check_interval)
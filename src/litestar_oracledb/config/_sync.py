@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager, contextmanager
-from dataclasses import dataclass
+import asyncio
+from contextlib import ExitStack, asynccontextmanager, contextmanager, suppress
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
 from typing import TYPE_CHECKING, Generator, Optional, cast
 
 from litestar.constants import HTTP_RESPONSE_START
@@ -9,17 +12,27 @@ from litestar.di import Provide
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.types import Empty
 from litestar.utils.dataclass import simple_asdict
+from oracledb import EVENT_OBJCHANGE, POOL_GETMODE_TIMEDWAIT
+from oracledb import Error as OracleError
 from oracledb import create_pool as oracledb_create_pool
 from oracledb.connection import Connection
 from oracledb.pool import ConnectionPool
 
 from litestar_oracledb._utils import delete_scope_state, get_scope_state, set_scope_state
+from litestar_oracledb.bulk import execute_batch
+from litestar_oracledb.cache import CachingConnection
 from litestar_oracledb.config._common import (
     CONNECTION_SCOPE_KEY,
     SESSION_TERMINUS_ASGI_EVENTS,
     GenericOracleDatabaseConfig,
     GenericOraclePoolConfig,
+    T,
+    logger,
 )
+from litestar_oracledb.executor import PoolExecutor
+from litestar_oracledb.instrumentation import InstrumentedConnection, route_of
+from litestar_oracledb.metrics import end_checkout, start_checkout
+from litestar_oracledb.retry import RetryingConnection
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Callable, Coroutine
@@ -27,15 +40,48 @@ if TYPE_CHECKING:
 
     from litestar import Litestar
     from litestar.datastructures.state import State
+    from litestar.exceptions import ServiceUnavailableException
     from litestar.types import EmptyType, Message, Scope
+    from oracledb.cursor import Cursor
+    from oracledb.subscr import Message as SubscriptionMessage
+    from oracledb.subscr import Subscription
+
+    from litestar_oracledb.cache import QueryCache
+    from litestar_oracledb.config._common import BatchExecutor
+    from litestar_oracledb.metrics import PoolMetrics
+    from litestar_oracledb.sizing import PoolSizer
+    from litestar_oracledb.tenancy import TenantRouting
+
+_DEFAULT_POOL_MAX = 2
+"""The ``max`` size oracledb uses for a pool when none is configured."""
+
+
+def _resolve_connection(value: Connection | LazyConnection | None) -> Connection | None:
+    """Return the connection to act on for a value stored in scope state.
+
+    Args:
+        value: The connection or lazy connection proxy stored in the scope.
+
+    Returns:
+        The pooled connection, or ``None`` if no connection was checked out for the scope.
+    """
+    if isinstance(value, LazyConnection):
+        return value.connection
+    return value
 
 
 def default_handler_maker(
     connection_scope_key: str = CONNECTION_SCOPE_KEY,
+    executor: PoolExecutor | None = None,
+    metrics: PoolMetrics | None = None,
+    pool_name: str = "db_pool",
 ) -> Callable[[Message, Scope], Coroutine[Any, Any, None]]:
     """Set up the handler to issue a transaction commit or rollback based on specified status codes
     Args:
         connection_scope_key: The key to use within the application state
+        executor: Optional executor in which to close the connection, keeping the event loop free
+        metrics: Optional recorder for the connection checkout duration
+        pool_name: The pool name reported to ``metrics``
 
     Returns:
         The handler callable
@@ -51,11 +97,16 @@ def default_handler_maker(
         Returns:
             None
         """
-        connection = cast("Connection | None", get_scope_state(scope, connection_scope_key))
+        connection = _resolve_connection(get_scope_state(scope, connection_scope_key))
         # checks to to see if connected without raising an exception: https://github.com/oracle/python-oracledb/blob/main/src/oracledb/connection.py#L80
         if connection and message["type"] in SESSION_TERMINUS_ASGI_EVENTS and connection._impl is not None:  # noqa: SLF001
-            connection.close()
+            if executor is not None:
+                await executor.run_release(connection.close)
+            else:
+                connection.close()
             delete_scope_state(scope, connection_scope_key)
+            if metrics is not None:
+                end_checkout(scope, connection_scope_key, metrics, pool_name)
 
     return handler
 
@@ -65,13 +116,19 @@ def autocommit_handler_maker(
     extra_commit_statuses: set[int] | None = None,
     extra_rollback_statuses: set[int] | None = None,
     connection_scope_key: str = CONNECTION_SCOPE_KEY,
-) -> Callable[[Message, Scope], None]:
+    executor: PoolExecutor | None = None,
+    metrics: PoolMetrics | None = None,
+    pool_name: str = "db_pool",
+) -> Callable[[Message, Scope], None | Coroutine[Any, Any, None]]:
     """Set up the handler to issue a transaction commit or rollback based on specified status codes
     Args:
         commit_on_redirect: Issue a commit when the response status is a redirect (``3XX``)
         extra_commit_statuses: A set of additional status codes that trigger a commit
         extra_rollback_statuses: A set of additional status codes that trigger a rollback
         connection_scope_key: The key to use within the application state
+        executor: Optional executor in which to commit, rollback and close the connection, keeping the event loop free
+        metrics: Optional recorder for commits, rollbacks and the connection checkout duration
+        pool_name: The pool name reported to ``metrics``
 
     Returns:
         The handler callable
@@ -98,21 +155,107 @@ def autocommit_handler_maker(
         Returns:
             None
         """
-        connection = cast("Connection | None", get_scope_state(scope, connection_scope_key))
+        connection = _resolve_connection(get_scope_state(scope, connection_scope_key))
         try:
             if connection is not None and message["type"] == HTTP_RESPONSE_START and connection._impl is not None:  # noqa: SLF001
                 if (message["status"] in commit_range or message["status"] in extra_commit_statuses) and message[
                     "status"
                 ] not in extra_rollback_statuses:
                     connection.commit()
+                    if metrics is not None:
+                        metrics.record_commit(pool_name)
                 else:
                     connection.rollback()
+                    if metrics is not None:
+                        metrics.record_rollback(pool_name)
         finally:
             if connection and message["type"] in SESSION_TERMINUS_ASGI_EVENTS and connection._impl is not None:  # noqa: SLF001
                 connection.close()
                 delete_scope_state(scope, connection_scope_key)
+                if metrics is not None:
+                    end_checkout(scope, connection_scope_key, metrics, pool_name)
 
-    return handler
+    if executor is None:
+        return handler
+
+    async def executor_handler(message: Message, scope: Scope) -> None:
+        """Run the blocking handler in ``executor`` when there is a connection to end.
+
+        Args:
+            message: ASGI-``Message``
+            scope: An ASGI-``Scope``
+
+        Returns:
+            None
+        """
+        if message["type"] in SESSION_TERMINUS_ASGI_EVENTS and get_scope_state(scope, connection_scope_key) is not None:
+            await executor.run_release(handler, message, scope)
+
+    return executor_handler
+
+
+class LazyConnection:
+    """Proxy for a :class:`Connection <oracledb.Connection>` that is acquired from the pool on first use.
+
+    ``cursor()`` and any other connection attribute check out a pooled connection before they are used. ``commit``,
+    ``rollback`` and ``close`` are no-ops until a connection has been acquired, as there is no transaction to end.
+    """
+
+    __slots__ = ("_acquire", "_connection")
+
+    def __init__(self, acquire: Callable[[], Connection]) -> None:
+        """Initialize ``LazyConnection``.
+
+        Args:
+            acquire: Callable that checks out a connection, such as ``pool.acquire``.
+        """
+        object.__setattr__(self, "_acquire", acquire)
+        object.__setattr__(self, "_connection", None)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Connection]:  # type: ignore[override]
+        # report the proxied type so that ``db_connection: Connection`` annotations validate
+        return Connection
+
+    @property
+    def connection(self) -> Connection | None:
+        """Return the pooled connection, or ``None`` if it has not been acquired yet."""
+        return cast("Optional[Connection]", self._connection)
+
+    def acquire(self) -> Connection:
+        """Check out a connection from the pool if none has been acquired yet.
+
+        Returns:
+            The pooled connection.
+        """
+        if self._connection is None:
+            object.__setattr__(self, "_connection", self._acquire())
+        return cast("Connection", self._connection)
+
+    def cursor(self, *args: Any, **kwargs: Any) -> Cursor:
+        return self.acquire().cursor(*args, **kwargs)
+
+    def commit(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+
+    def rollback(self) -> None:
+        if self._connection is not None:
+            self._connection.rollback()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            if self._connection._impl is not None:  # noqa: SLF001
+                self._connection.close()
+            object.__setattr__(self, "_connection", None)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.acquire(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.acquire(), name, value)
 
 
 @dataclass
@@ -126,19 +269,90 @@ class SyncOracleDatabaseConfig(GenericOracleDatabaseConfig[ConnectionPool, Conne
 
     pool_config: SyncOraclePoolConfig | None | EmptyType = Empty
     """Oracle Pool configuration"""
+    use_executor: bool = False
+    """Run blocking pool work in a dedicated thread pool instead of on the event loop.
+
+    Pool creation and shutdown, connection acquire and release, and the commit, rollback and close issued by the
+    ``before_send_handler`` run in :attr:`executor`, so a pool waiting for a free connection never stalls the event loop.
+    """
+    executor_max_workers: int | None = None
+    """Number of :attr:`executor` threads. Defaults to the ``max`` size of the pool."""
+    executor_wait_timeout: float = 30.0
+    """Seconds an acquire run in :attr:`executor` waits for a free connection before failing.
+
+    Set as the ``wait_timeout`` of a pool created from ``pool_config`` without a ``getmode``, with
+    ``POOL_GETMODE_TIMEDWAIT``, so that a worker thread is never blocked for good. The ``max_wait`` of
+    ``connection_limiter`` takes precedence when set. Create a ``pool_instance`` with
+    these settings as well.
+    """
+    executor: PoolExecutor | None = field(init=False, default=None)
+    """The :class:`PoolExecutor <litestar_oracledb.executor.PoolExecutor>` used when ``use_executor`` is enabled.
+
+    Its :meth:`statistics() <litestar_oracledb.executor.PoolExecutor.statistics>` expose the queue depth for sizing.
+    """
 
     def __post_init__(self) -> None:
         super().__post_init__()
+        if self.lazy_connection and (
+            self.use_executor
+            or self.connection_limiter is not None
+            or (self.tenancy is not None and self.tenancy.quota is not None)
+        ):
+            msg = (
+                "'lazy_connection' acquires on first use, on the event loop for async handlers, so it cannot be"
+                " combined with 'use_executor', a 'connection_limiter' or a tenant quota."
+            )
+            raise ImproperlyConfiguredException(msg)
+        if self.query_cache_tables:
+            if self.query_cache is None:
+                msg = "'query_cache_tables' requires a 'query_cache'."
+                raise ImproperlyConfiguredException(msg)
+            if isinstance(self.pool_config, SyncOraclePoolConfig) and self.pool_config.events is Empty:
+                self.pool_config.events = True
+        if self.connection_limiter is not None and self.connection_limiter.max_wait is not None:
+            self._bound_acquire_wait(self.connection_limiter.max_wait)
+        if self.use_executor:
+            self.executor = PoolExecutor(max_workers=self.executor_max_workers or self._pool_max_size())
+            self._bound_acquire_wait(self.executor_wait_timeout)
         if self.before_send_handler is None:
-            self.before_send_handler = default_handler_maker(connection_scope_key=self.connection_scope_key)
+            self.before_send_handler = default_handler_maker(
+                connection_scope_key=self.connection_scope_key,
+                executor=self.executor,
+                metrics=self.metrics,
+                pool_name=self.pool_app_state_key,
+            )
         if self.before_send_handler == "autocommit":
-            self.before_send_handler = autocommit_handler_maker(connection_scope_key=self.connection_scope_key)
+            self.before_send_handler = autocommit_handler_maker(
+                connection_scope_key=self.connection_scope_key,
+                executor=self.executor,
+                metrics=self.metrics,
+                pool_name=self.pool_app_state_key,
+            )
         if self.before_send_handler == "autocommit_include_redirects":
             self.before_send_handler = autocommit_handler_maker(
                 connection_scope_key=self.connection_scope_key,
                 commit_on_redirect=True,
+                executor=self.executor,
+                metrics=self.metrics,
+                pool_name=self.pool_app_state_key,
             )
 
+    def _bound_acquire_wait(self, seconds: float) -> None:
+        """Make a pool created from ``pool_config`` fail acquires after waiting ``seconds`` for a free connection."""
+        if isinstance(self.pool_config, SyncOraclePoolConfig) and self.pool_config.getmode is Empty:
+            self.pool_config.getmode = POOL_GETMODE_TIMEDWAIT
+            if self.pool_config.wait_timeout is Empty:
+                self.pool_config.wait_timeout = max(int(seconds * 1000), 1)
+
+    def _pool_max_size(self) -> int:
+        if self.pool_sizer is not None:
+            return self.pool_sizer.max_size
+        if self.pool_instance is not None:
+            return self.pool_instance.max
+        if self.pool_config is not None and self.pool_config is not Empty and self.pool_config.max is not Empty:
+            return self.pool_config.max
+        return _DEFAULT_POOL_MAX
+
     @property
     def pool_config_dict(self) -> dict[str, Any]:
         """Return the pool configuration as a dict.
@@ -173,7 +387,13 @@ class SyncOracleDatabaseConfig(GenericOracleDatabaseConfig[ConnectionPool, Conne
         """
         return {
             self.pool_dependency_key: Provide(self.provide_pool, sync_to_thread=True),
-            self.connection_dependency_key: Provide(self.provide_connection),
+            self.connection_dependency_key: Provide(
+                self.provide_executor_connection
+                if self.executor is not None
+                or self.connection_limiter is not None
+                or (self.tenancy is not None and self.tenancy.quota is not None)
+                else self.provide_connection,
+            ),
         }
 
     def create_pool(self) -> ConnectionPool:
@@ -190,6 +410,8 @@ class SyncOracleDatabaseConfig(GenericOracleDatabaseConfig[ConnectionPool, Conne
             raise ImproperlyConfiguredException(msg)
 
         pool_config = self.pool_config_dict
+        if self.session_callback is not None:
+            pool_config["session_callback"] = self._run_session_callback
         self.pool_instance = oracledb_create_pool(**pool_config)
         if self.pool_instance is None:
             msg = "Could not configure the 'pool_instance'. Please check your configuration."
@@ -201,12 +423,175 @@ class SyncOracleDatabaseConfig(GenericOracleDatabaseConfig[ConnectionPool, Conne
         self,
         app: Litestar,
     ) -> AsyncGenerator[None, None]:
-        db_pool = self.create_pool()
+        if self.executor is None:
+            db_pool = self.create_pool()
+        else:
+            db_pool = await self.executor.run(self.create_pool)
         app.state.update({self.pool_app_state_key: db_pool})
+        try:
+            async with self._warm_up_pool(db_pool), self._sample_pool_usage(db_pool), self._invalidate_on_change(
+                db_pool
+            ), self._resize_pool(db_pool):
+                yield
+        finally:
+            if self.executor is None:
+                db_pool.close(force=True)
+            else:
+                await self.executor.run(db_pool.close, force=True)
+                self.executor.shutdown(wait=False)
+
+    @asynccontextmanager
+    async def _resize_pool(self, pool: ConnectionPool) -> AsyncGenerator[None, None]:
+        """Run ``pool_sizer`` in a background task while the context is active."""
+        if self.pool_sizer is None:
+            yield
+            return
+        task = asyncio.create_task(self._run_pool_sizer(pool, self.pool_sizer))
+        try:
+            yield
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def _run_pool_sizer(self, pool: ConnectionPool, sizer: PoolSizer) -> None:
+        while True:
+            await asyncio.sleep(sizer.interval)
+            resize = sizer.decide(busy=pool.busy, size=pool.max)
+            if resize is None:
+                continue
+            try:
+                await self._run_blocking(
+                    partial(pool.reconfigure, min=min(pool.min, resize.new_size), max=resize.new_size)
+                )
+            except OracleError:
+                logger.warning("Could not resize pool %s", self.pool_app_state_key, exc_info=True)
+                continue
+            logger.info(
+                "Resized pool %s from %d to %d connections (%s)",
+                self.pool_app_state_key,
+                resize.old_size,
+                resize.new_size,
+                resize.reason,
+            )
+            if self.metrics is not None:
+                self.metrics.record_pool_resize(self.pool_app_state_key, *resize)
+
+    @asynccontextmanager
+    async def _invalidate_on_change(self, pool: ConnectionPool) -> AsyncGenerator[None, None]:
+        """Subscribe to changes of ``query_cache_tables`` while the context is active.
+
+        Args:
+            pool: The pool the subscription connection is acquired from.
+        """
+        if self.query_cache is None or not self.query_cache_tables:
+            yield
+            return
+        callback = partial(self._on_change, self.query_cache, asyncio.get_running_loop())
+        connection, subscription = await self._run_blocking(self._subscribe, pool, callback)
         try:
             yield
         finally:
-            db_pool.close(force=True)
+            await self._run_blocking(self._unsubscribe, pool, connection, subscription)
+
+    def _subscribe(
+        self, pool: ConnectionPool, callback: Callable[[SubscriptionMessage], None]
+    ) -> tuple[Connection, Subscription]:
+        connection = pool.acquire()
+        try:
+            subscription = connection.subscribe(callback=callback)
+            for table in self.query_cache_tables:
+                subscription.registerquery(f"select * from {table}")  # noqa: S608
+        except Exception:
+            pool.release(connection)
+            raise
+        return connection, subscription
+
+    @staticmethod
+    def _unsubscribe(pool: ConnectionPool, connection: Connection, subscription: Subscription) -> None:
+        try:
+            connection.unsubscribe(subscription)
+        finally:
+            pool.release(connection)
+
+    @staticmethod
+    def _on_change(query_cache: QueryCache, loop: asyncio.AbstractEventLoop, message: SubscriptionMessage) -> None:
+        """Evict the entries of the changed tables; called by python-oracledb on its notification thread."""
+        if message.type == EVENT_OBJCHANGE:
+            coroutine = query_cache.invalidate([table.name for table in message.tables if table.name])
+        else:
+            coroutine = query_cache.clear()
+        asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    async def _run_blocking(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn`` in :attr:`executor`, or in the default executor of the event loop if there is none."""
+        if self.executor is not None:
+            return await self.executor.run(fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(None, partial(fn, *args))
+
+    async def _run_release(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn``, which gives a connection back to the pool, in the release lane of :attr:`executor`."""
+        if self.executor is not None:
+            return await self.executor.run_release(fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(None, partial(fn, *args))
+
+    async def _open_connection(self, pool: ConnectionPool) -> Connection:
+        return await self._run_blocking(self._open_connection_sync, pool)
+
+    def _open_connection_sync(self, pool: ConnectionPool) -> Connection:
+        connection = pool.acquire(**self._acquire_kwargs())
+        if self.warmup_statement is None:
+            return connection
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(self.warmup_statement)
+        except Exception:
+            pool.release(connection)
+            raise
+        return connection
+
+    async def _close_connection(self, pool: ConnectionPool, connection: Connection) -> None:
+        await self._run_release(pool.release, connection)
+
+    async def _fetch_rows(
+        self,
+        sql: str,
+        parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None,
+        connection: Connection | None,
+    ) -> list[Any]:
+        return await self._run_blocking(self._fetch_rows_sync, sql, parameters, connection)
+
+    def _fetch_rows_sync(
+        self,
+        sql: str,
+        parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None,
+        connection: Connection | None,
+    ) -> list[Any]:
+        if connection is None:
+            with self.get_connection() as pooled:
+                return self._fetch_rows_sync(sql, parameters, pooled)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, parameters)
+            return cast("list[Any]", cursor.fetchall())
+
+    @asynccontextmanager
+    async def _bulk_executor(self, connection: Connection | None) -> AsyncGenerator[BatchExecutor, None]:
+        if connection is None:
+            pool = self.create_pool()
+            with self._circuit_guard():
+                pooled = await self._run_blocking(partial(pool.acquire, **self._acquire_kwargs()))
+            try:
+                async with self._bulk_executor(pooled) as execute:
+                    yield execute
+                await self._run_release(pooled.commit)
+            finally:
+                await self._run_release(pool.release, pooled)
+            return
+        cursor = connection.cursor()
+        try:
+            yield partial(self._run_blocking, execute_batch, cursor)
+        finally:
+            cursor.close()
 
     def provide_connection(
         self,
@@ -228,12 +613,194 @@ class SyncOracleDatabaseConfig(GenericOracleDatabaseConfig[ConnectionPool, Conne
         )
         if connection is not None:
             yield connection
-        else:
-            pool = cast("ConnectionPool", state.get(self.pool_app_state_key))
+            return
+
+        pool = cast("ConnectionPool", state.get(self.pool_app_state_key))
+        connection = (
+            cast("Connection", LazyConnection(partial(self._acquire, pool, scope)))
+            if self.lazy_connection
+            else self._acquire(pool, scope)
+        )
+        set_scope_state(scope, self.connection_scope_key, connection)
+        if self.release_mode == "response":
+            # the ``before_send_handler`` ends the transaction and releases the connection
+            try:
+                yield connection
+            except Exception as exc:
+                self._record_circuit_failure(exc)
+                raise
+            return
+        try:
+            yield connection
+        except Exception as exc:
+            self._record_circuit_failure(exc)
+            self.release_connection(scope, commit=False)
+            raise
+        self.release_connection(scope)
+
+    async def provide_executor_connection(
+        self,
+        state: State,
+        scope: Scope,
+    ) -> AsyncGenerator[Connection, None]:
+        """Create a connection instance, acquiring and releasing it in :attr:`executor` or the default executor.
+
+        Args:
+            state: The ``Litestar.state`` instance.
+            scope: The current connection's scope.
+
+        Returns:
+            A connection instance.
+        """
+        connection = cast(
+            "Optional[Connection]",
+            get_scope_state(scope, self.connection_scope_key),
+        )
+        if connection is not None:
+            yield connection
+            return
 
-            with pool.acquire() as connection:
-                set_scope_state(scope, self.connection_scope_key, connection)
+        release_slot = await self._enter_connection_limit(scope)
+        try:
+            pool = cast("ConnectionPool", state.get(self.pool_app_state_key))
+            connection = await self._run_blocking(self._acquire, pool, scope)
+            set_scope_state(scope, self.connection_scope_key, connection)
+            if self.release_mode == "response":
+                # the ``before_send_handler`` ends the transaction and releases the connection
+                try:
+                    yield connection
+                except Exception as exc:
+                    self._record_circuit_failure(exc)
+                    raise
+                return
+            try:
                 yield connection
+            except Exception as exc:
+                self._record_circuit_failure(exc)
+                await self._run_release(partial(self.release_connection, scope, commit=False))
+                raise
+            await self._run_release(self.release_connection, scope)
+        finally:
+            if release_slot is not None:
+                release_slot()
+
+    def _acquire(self, pool: ConnectionPool, scope: Scope) -> Connection:
+        """Check out a connection for ``scope``, recording the wait to ``metrics``.
+
+        Args:
+            pool: The pool to acquire from.
+            scope: The current connection's scope.
+
+        Returns:
+            A connection instance.
+        """
+        started = perf_counter()
+        try:
+            with self._circuit_guard():
+                connection = pool.acquire(**self._acquire_kwargs(scope))
+        except OracleError as exc:
+            if self.pool_sizer is not None:
+                self.pool_sizer.observe_error()
+            if (unavailable := self._reject_acquire_timeout(exc, scope)) is not None:
+                raise unavailable from None
+            raise
+        waited = perf_counter() - started
+        if self.pool_sizer is not None:
+            self.pool_sizer.observe_acquire(waited)
+        if self.metrics is not None:
+            self.metrics.record_acquire(self.pool_app_state_key, waited)
+            start_checkout(scope, self.connection_scope_key)
+        if self.drcp is not None:
+            self.drcp.observe(pool)
+        if self.tenancy is not None:
+            self._prepare_tenant(pool, connection, scope)
+        if self.statement_cache_advisor is not None:
+            self.statement_cache_advisor.attach(connection)
+        if self.retry_policy is not None:
+            connection = cast(
+                "Connection",
+                RetryingConnection(connection, self.retry_policy, partial(self._replace_connection, pool, scope)),
+            )
+        if self.statement_recorder is not None:
+            connection = cast(
+                "Connection", InstrumentedConnection(connection, self.statement_recorder, route_of(scope))
+            )
+        if self.request_cache:
+            connection = cast("Connection", CachingConnection(connection, self._new_request_cache(scope)))
+        return connection
+
+    def _reject_acquire_timeout(self, exc: OracleError, scope: Scope) -> ServiceUnavailableException | None:
+        """Return the ``503`` of a request whose acquire timed out waiting for a free connection of the pool, recording
+        the rejection to ``metrics``, or ``None`` for other errors or without a ``connection_limiter``.
+        """
+        limiter = self.connection_limiter
+        if limiter is None or not exc.args or getattr(exc.args[0], "full_code", None) != "DPY-4005":
+            return None
+        route = limiter.route_key(scope)
+        if self.metrics is not None:
+            self.metrics.record_rejection(self.pool_app_state_key, route)
+        return limiter.unavailable(route)
+
+    def _replace_connection(self, pool: ConnectionPool, scope: Scope, lost: Connection) -> Connection:
+        """Drop ``lost`` from ``pool`` and acquire a connection to replay its statements on."""
+        logger.info("Replacing a lost connection of %s", self.pool_app_state_key)
+        with suppress(OracleError):
+            pool.drop(lost)
+        with self._circuit_guard():
+            connection = pool.acquire(**self._acquire_kwargs(scope))
+        if self.tenancy is not None:
+            self._prepare_tenant(pool, connection, scope)
+        return connection
+
+    def _prepare_tenant(self, pool: ConnectionPool, connection: Connection, scope: Scope) -> None:
+        """Set up ``connection`` for the tenant of ``scope``, dropping it from ``pool`` if that fails."""
+        try:
+            cast("TenantRouting", self.tenancy).prepare(connection, scope)
+        except BaseException:
+            with suppress(OracleError):
+                pool.drop(connection)
+            raise
+
+    def release_connection(self, scope: Scope, commit: bool = True) -> None:
+        """End the transaction of the connection held by ``scope`` and return it to the pool.
+
+        Streaming generators can call this once they are done with the database, so the connection is not held while
+        the response body is sent. The ``before_send_handler`` skips scopes whose connection has been released.
+
+        Args:
+            scope: The current connection's scope.
+            commit: Commit the transaction if ``True``, otherwise roll it back.
+        """
+        connection = _resolve_connection(get_scope_state(scope, self.connection_scope_key, pop=True))
+        if connection is None or connection._impl is None:  # noqa: SLF001
+            return
+        try:
+            if commit:
+                connection.commit()
+            else:
+                connection.rollback()
+        finally:
+            connection.close()
+            if self.metrics is not None:
+                end_checkout(scope, self.connection_scope_key, self.metrics, self.pool_app_state_key)
+        if self.metrics is not None:
+            if commit:
+                self.metrics.record_commit(self.pool_app_state_key)
+            else:
+                self.metrics.record_rollback(self.pool_app_state_key)
+
+    async def _call_lob(self, method: Callable[..., Any], *args: Any) -> Any:
+        return await self._run_blocking(method, *args)
+
+    def _detach_connection(self, scope: Scope) -> Connection | None:
+        return _resolve_connection(get_scope_state(scope, self.connection_scope_key, pop=True))
+
+    async def _close_detached(self, scope: Scope, connection: Connection) -> None:
+        try:
+            await self._run_release(connection.close)
+        finally:
+            if self.metrics is not None:
+                end_checkout(scope, self.connection_scope_key, self.metrics, self.pool_app_state_key)
 
     @contextmanager
     def get_connection(
@@ -245,5 +812,14 @@ class SyncOracleDatabaseConfig(GenericOracleDatabaseConfig[ConnectionPool, Conne
             A connection instance.
         """
         pool = self.create_pool()
-        with pool.acquire() as connection:
-            yield connection
+        with ExitStack() as stack:
+            with self._circuit_guard():
+                connection = stack.enter_context(pool.acquire(**self._acquire_kwargs()))
+            try:
+                if self.statement_recorder is not None:
+                    yield cast("Connection", InstrumentedConnection(connection, self.statement_recorder))
+                else:
+                    yield connection
+            except Exception as exc:
+                self._record_circuit_failure(exc)
+                raise
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, Mapping
+
+import oracledb
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.types import Empty
+
+from litestar_oracledb.instrumentation import route_of
+
+if TYPE_CHECKING:
+    from litestar.types import Scope
+    from oracledb import AsyncConnectionPool, ConnectionPool, Purity
+
+    from litestar_oracledb.config._common import GenericOraclePoolConfig
+
+__all__ = (
+    "DRCP",
+    "DRCPReport",
+    "is_pooled_dsn",
+)
+
+logger = logging.getLogger("litestar_oracledb")
+
+
+def is_pooled_dsn(dsn: str) -> bool | None:
+    """Return whether ``dsn`` connects to a DRCP pooled server.
+
+    Args:
+        dsn: An Easy Connect string, such as ``dbhost/orclpdb:pooled``, or a connect descriptor with ``(SERVER=POOLED)``.
+
+    Returns:
+        Whether the server type is ``pooled``, or ``None`` if ``dsn`` cannot be parsed, e.g. a ``tnsnames.ora`` alias.
+    """
+    params = oracledb.ConnectParams()
+    try:
+        params.parse_connect_string(dsn)
+    except oracledb.Error:
+        return None
+    return (params.server_type or "").lower() == "pooled"
+
+
+@dataclass(frozen=True)
+class DRCPReport:
+    """Database sessions used by a pool in DRCP mode, see :meth:`DRCP.report`."""
+
+    acquires: int
+    """Connections acquired."""
+    client_sessions: int
+    """Connections open in the pool, each of which would hold a dedicated server without DRCP."""
+    server_sessions: int
+    """Connections checked out, each holding a DRCP pooled server until it is released."""
+    peak_client_sessions: int
+    """Most connections open in the pool at once."""
+    peak_server_sessions: int
+    """Most connections checked out at once."""
+
+    @property
+    def sessions_saved(self) -> int:
+        """Database sessions DRCP saved at peak: the dedicated servers the pool would have held, less the pooled
+        servers it held.
+        """
+        return max(self.peak_client_sessions - self.peak_server_sessions, 0)
+
+
+@dataclass
+class DRCP:
+    """Connect through Database Resident Connection Pooling, sharing database sessions across processes.
+
+    Each connection of the pool only holds a pooled server of the database while it is checked out: from the acquire
+    in ``provide_connection`` until the ``before_send_handler`` releases it when the response starts, or until the
+    handler returns with ``release_mode="handler"``. Replicas of an application using the same ``cclass`` share the
+    pooled servers, so the sessions on the database follow the requests in flight rather than the size of each pool.
+
+    The DSN must request a pooled server, with ``:pooled`` in Easy Connect strings or ``(SERVER=POOLED)`` in connect
+    descriptors. When the pool is configured with ``host`` and ``service_name`` instead, ``server_type`` is set to
+    ``pooled``.
+    """
+
+    cclass: str
+    """Connection class of the application. Pooled servers are only reused by connections of the same class."""
+    route_cclasses: Mapping[str, str] = field(default_factory=dict)
+    """Connection classes of specific routes, keyed by path template, e.g. ``{"/reports/{report_id}": "REPORTS"}``."""
+    opt_key: str = "db_cclass"
+    """Key of the route handler ``opt`` overriding the connection class of a route."""
+    purity: Purity = oracledb.PURITY_SELF
+    """``PURITY_SELF`` reuses the session state left by the previous user of a pooled server, ``PURITY_NEW`` always
+    starts from a fresh session."""
+    pool_boundary: Literal["statement", "transaction"] | None = None
+    """Release the pooled server within a request too, once a transaction ends or after each statement that leaves no
+    transaction or cursor open (implicit connection pooling). Requires Oracle Database 23ai."""
+    _acquires: int = field(init=False, default=0)
+    _client_sessions: int = field(init=False, default=0)
+    _server_sessions: int = field(init=False, default=0)
+    _peak_client_sessions: int = field(init=False, default=0)
+    _peak_server_sessions: int = field(init=False, default=0)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
+
+    def configure(self, pool_config: GenericOraclePoolConfig[Any, Any]) -> None:
+        """Validate the DSN of ``pool_config`` and set its DRCP parameters that are not set yet.
+
+        Args:
+            pool_config: The pool configuration.
+
+        Raises:
+            ImproperlyConfiguredException: If the pool does not connect to a pooled server.
+        """
+        if isinstance(pool_config.dsn, str):
+            self.validate_dsn(pool_config.dsn)
+        elif pool_config.params is not Empty:
+            if (pool_config.params.server_type or "").lower() != "pooled":
+                msg = "DRCP requires 'server_type=\"pooled\"' in the 'params' of the pool."
+                raise ImproperlyConfiguredException(msg)
+        elif pool_config.server_type is Empty:
+            pool_config.server_type = "pooled"
+        elif str(pool_config.server_type).lower() != "pooled":
+            msg = f"DRCP requires 'server_type=\"pooled\"', got {pool_config.server_type!r}."
+            raise ImproperlyConfiguredException(msg)
+        if pool_config.cclass is Empty:
+            pool_config.cclass = self.cclass
+        if pool_config.purity is Empty:
+            pool_config.purity = self.purity
+        if pool_config.pool_boundary is Empty and self.pool_boundary is not None:
+            pool_config.pool_boundary = self.pool_boundary
+
+    def validate_dsn(self, dsn: str | None) -> None:
+        """Check that ``dsn`` requests a pooled server.
+
+        Args:
+            dsn: The DSN of the pool. ``tnsnames.ora`` aliases cannot be resolved here and are only logged.
+
+        Raises:
+            ImproperlyConfiguredException: If ``dsn`` connects to a dedicated server.
+        """
+        if not dsn:
+            return
+        pooled = is_pooled_dsn(dsn)
+        if pooled is None:
+            logger.warning("Cannot verify that %r connects to a DRCP pooled server", dsn)
+        elif not pooled:
+            msg = f"DRCP requires a pooled server: append ':pooled' to {dsn!r}, or add '(SERVER=POOLED)' to its CONNECT_DATA."
+            raise ImproperlyConfiguredException(msg)
+
+    def cclass_of(self, scope: Scope | None) -> str:
+        """Return the connection class of the route of ``scope``.
+
+        Args:
+            scope: The current connection's scope, if any.
+
+        Returns:
+            The ``opt_key`` entry of the route handler, the ``route_cclasses`` entry of the route, or ``cclass``.
+        """
+        if scope is None:
+            return self.cclass
+        route_handler = scope.get("route_handler")
+        if route_handler is not None and self.opt_key in route_handler.opt:
+            return str(route_handler.opt[self.opt_key])
+        route = route_of(scope)
+        return self.route_cclasses.get(route, self.cclass) if route is not None else self.cclass
+
+    def acquire_kwargs(self, scope: Scope | None) -> dict[str, Any]:
+        """Return the keyword arguments of ``pool.acquire()`` for a connection of ``scope``."""
+        return {"cclass": self.cclass_of(scope), "purity": self.purity}
+
+    def observe(self, pool: ConnectionPool | AsyncConnectionPool) -> None:
+        """Record the sessions of ``pool`` after a connection was acquired from it.
+
+        Args:
+            pool: The pool.
+        """
+        with self._lock:
+            self._acquires += 1
+            self._client_sessions, self._server_sessions = pool.opened, pool.busy
+            self._peak_client_sessions = max(self._peak_client_sessions, pool.opened)
+            self._peak_server_sessions = max(self._peak_server_sessions, pool.busy)
+
+    def report(self) -> DRCPReport:
+        """Return the sessions used so far, as last observed on acquire."""
+        with self._lock:
+            return DRCPReport(
+                acquires=self._acquires,
+                client_sessions=self._client_sessions,
+                server_sessions=self._server_sessions,
+                peak_client_sessions=self._peak_client_sessions,
+                peak_server_sessions=self._peak_server_sessions,
+            )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from litestar.exceptions import LitestarException
+from litestar.exceptions import LitestarException, ServiceUnavailableException
 
 
 class LitestarOracleException(LitestarException):
@@ -40,3 +40,30 @@ class ImproperConfigurationError(LitestarOracleException):
 
     This exception is raised only when a module depends on a dependency that has not been installed.
     """
+
+
+class MissingDependencyError(LitestarOracleException, ImportError):
+    """Missing optional dependency.
+
+    This exception is raised only when a module depends on a dependency that has not been installed.
+    """
+
+    def __init__(self, package: str, install_package: str | None = None) -> None:
+        super().__init__(
+            detail=f"Package {package!r} is not installed but required. You can install it by running "
+            f"'pip install litestar-oracledb[{install_package or package}]' to install litestar-oracledb with the "
+            f"required extra or 'pip install {install_package or package}' to install the package separately",
+        )
+
+
+class ConnectionNotAcquiredError(LitestarOracleException):
+    """Raised when a lazy connection proxy is used in a way that requires a connection that has not been acquired yet."""
+
+
+class CircuitOpenError(ServiceUnavailableException):
+    """Raised instead of acquiring a connection while a :class:`CircuitBreaker
+    <litestar_oracledb.breaker.CircuitBreaker>` is open.
+
+    Being a :class:`ServiceUnavailableException <litestar.exceptions.ServiceUnavailableException>`, it fails requests
+    with ``503`` and a ``Retry-After`` header.
+    """
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+__all__ = (
+    "ExecutorStatistics",
+    "PoolExecutor",
+)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ExecutorStatistics:
+    """Point-in-time snapshot of a :class:`PoolExecutor`."""
+
+    max_workers: int
+    """Number of worker threads."""
+    active: int
+    """Calls currently running on a worker thread."""
+    queue_depth: int
+    """Calls submitted and waiting for a free worker thread."""
+    peak_queue_depth: int
+    """Highest ``queue_depth`` observed since the executor was created."""
+    completed: int
+    """Calls that have finished running."""
+
+
+class PoolExecutor:
+    """Bounded thread pool that runs blocking ``oracledb`` pool and connection calls off the event loop.
+
+    Calls that give connections back to the pool (commit, rollback, close) run on a separate lane of
+    ``release_workers`` threads with :meth:`run_release`. Otherwise, once every worker is blocked in ``pool.acquire()``
+    waiting for a free connection, the releases that would free one would queue behind them forever.
+
+    The worker threads are started on first use and stopped by :meth:`shutdown`; the executor can be used again
+    afterwards, which makes it safe to share across application restarts.
+    """
+
+    __slots__ = (
+        "_active",
+        "_completed",
+        "_executor",
+        "_lock",
+        "_max_workers",
+        "_peak_queue_depth",
+        "_queued",
+        "_release_executor",
+        "_release_workers",
+    )
+
+    def __init__(self, max_workers: int, release_workers: int | None = None) -> None:
+        """Initialize ``PoolExecutor``.
+
+        Args:
+            max_workers: Number of worker threads. Size it to the ``max`` of the pool so that every connection can be
+                acquired concurrently.
+            release_workers: Number of worker threads of the release lane. Defaults to ``max_workers``, so that every
+                connection can be released concurrently.
+        """
+        self._max_workers = max_workers
+        self._release_workers = release_workers or max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._release_executor: ThreadPoolExecutor | None = None
+        self._lock = Lock()
+        self._active = 0
+        self._queued = 0
+        self._peak_queue_depth = 0
+        self._completed = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def release_workers(self) -> int:
+        return self._release_workers
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    def statistics(self) -> ExecutorStatistics:
+        """Return the current executor statistics.
+
+        Returns:
+            An :class:`ExecutorStatistics` snapshot.
+        """
+        with self._lock:
+            return ExecutorStatistics(
+                max_workers=self._max_workers,
+                active=self._active,
+                queue_depth=self._queued,
+                peak_queue_depth=self._peak_queue_depth,
+                completed=self._completed,
+            )
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn`` on a worker thread and wait for its result.
+
+        Args:
+            fn: The blocking callable.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            The return value of ``fn``.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="oracledb")
+        return await self._submit(self._executor, partial(fn, *args, **kwargs))
+
+    async def run_release(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn``, which gives a connection back to the pool, on a worker thread of the release lane.
+
+        Args:
+            fn: The blocking callable, e.g. ``connection.close``.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            The return value of ``fn``.
+        """
+        if self._release_executor is None:
+            self._release_executor = ThreadPoolExecutor(
+                max_workers=self._release_workers, thread_name_prefix="oracledb-release"
+            )
+        return await self._submit(self._release_executor, partial(fn, *args, **kwargs))
+
+    async def _submit(self, executor: ThreadPoolExecutor, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._queued += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queued)
+        future = executor.submit(self._call, fn)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def _call(self, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads.
+
+        Args:
+            wait: Block until running calls have finished.
+        """
+        for executor in (self._executor, self._release_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait)
+        self._executor = self._release_executor = None
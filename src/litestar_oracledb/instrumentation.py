@@ -0,0 +1,542 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from oracledb.connection import AsyncConnection, Connection
+from oracledb.cursor import AsyncCursor, Cursor
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from litestar.types import Scope
+    from typing_extensions import Self
+
+    from litestar_oracledb.advisor import StatementCacheAdvisor
+    from litestar_oracledb.metrics import PoolMetrics
+
+__all__ = (
+    "InstrumentedAsyncConnection",
+    "InstrumentedAsyncCursor",
+    "InstrumentedConnection",
+    "InstrumentedCursor",
+    "StatementRecorder",
+    "StatementStatistics",
+    "fingerprint",
+    "session_of",
+)
+
+slow_query_logger = logging.getLogger("litestar_oracledb.slow_query")
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|(?<![\w:$#])\d+(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_WHITESPACE = re.compile(r"\s+")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql: str) -> str:
+    """Normalize ``sql`` so that statements differing only in literal values share one fingerprint.
+
+    Comments are removed, string and numeric literals become ``?``, literal lists become ``(?+)`` and whitespace is
+    collapsed. Bind variables are kept as they are.
+
+    Args:
+        sql: The SQL text.
+
+    Returns:
+        The normalized SQL text.
+    """
+    normalized = _LITERALS.sub("?", _COMMENTS.sub(" ", sql))
+    normalized = _LISTS.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip().lower()
+
+
+def route_of(scope: Scope | None) -> str | None:
+    """Return the route template of ``scope``, falling back to its path.
+
+    Args:
+        scope: The connection scope, if any.
+
+    Returns:
+        The route, or ``None`` outside of a request.
+    """
+    if scope is None:
+        return None
+    return scope.get("path_template") or scope.get("path")
+
+
+@dataclass(frozen=True)
+class StatementStatistics:
+    """Measurements of a single statement."""
+
+    sql: str
+    """The SQL text as executed."""
+    fingerprint: str
+    """The normalized SQL, see :func:`fingerprint`."""
+    operation: str
+    """The method that ran the statement (``execute``, ``executemany``, ``callproc``, ``fetchall``, ...)."""
+    elapsed: float
+    """Seconds spent executing the statement and fetching its rows."""
+    rows: int
+    """Rows fetched or affected."""
+    round_trips: int | None
+    """Round trips to the database, or ``None`` when the driver cannot report them."""
+    route: str | None
+    """Route of the request that ran the statement."""
+
+
+class StatementRecorder:
+    """Forward statement measurements to :class:`PoolMetrics <litestar_oracledb.metrics.PoolMetrics>` and the slow
+    query log.
+
+    Statements that take ``slow_query_threshold`` seconds or more are logged as warnings to the
+    ``litestar_oracledb.slow_query`` logger. Every statement is also passed to the ``advisor``, if any.
+    """
+
+    __slots__ = ("advisor", "metrics", "pool", "slow_query_threshold")
+
+    def __init__(
+        self,
+        pool: str,
+        metrics: PoolMetrics | None = None,
+        slow_query_threshold: float | None = None,
+        advisor: StatementCacheAdvisor | None = None,
+    ) -> None:
+        self.pool = pool
+        self.metrics = metrics
+        self.slow_query_threshold = slow_query_threshold
+        self.advisor = advisor
+
+    def record(
+        self,
+        sql: str,
+        operation: str,
+        elapsed: float,
+        rows: int,
+        round_trips: int | None,
+        route: str | None,
+        session: int | None = None,
+    ) -> None:
+        if self.advisor is not None:
+            self.advisor.observe(sql, route, session)
+        slow = self.slow_query_threshold is not None and elapsed >= self.slow_query_threshold
+        if self.metrics is None and not slow:
+            return
+        statistics = StatementStatistics(
+            sql=sql,
+            fingerprint=fingerprint(sql),
+            operation=operation,
+            elapsed=elapsed,
+            rows=rows,
+            round_trips=round_trips,
+            route=route,
+        )
+        if self.metrics is not None:
+            self.metrics.record_statement(self.pool, statistics)
+        if slow:
+            slow_query_logger.warning(
+                "Slow statement (%.3fs, %d rows) on %s: %s",
+                elapsed,
+                rows,
+                route or "<no route>",
+                statistics.fingerprint,
+                extra={"statement": statistics},
+            )
+
+
+class _RoundTripCounter:
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: Any) -> None:
+        self.count += 1
+
+
+def _round_trip_counter(connection: Connection | AsyncConnection) -> _RoundTripCounter | None:
+    """Return the round trip counter installed on ``connection``, installing one if possible.
+
+    Requires a Thin mode connection of a python-oracledb version that supports ``round_trip_callback``. A callback set
+    by the application is left alone.
+    """
+    if not hasattr(type(connection), "round_trip_callback") or not connection.thin:
+        return None
+    callback = connection.round_trip_callback  # pyright: ignore[reportAttributeAccessIssue]
+    if isinstance(callback, _RoundTripCounter):
+        return callback
+    if callback is not None:
+        return None
+    counter = _RoundTripCounter()
+    connection.round_trip_callback = counter  # pyright: ignore[reportAttributeAccessIssue]
+    return counter
+
+
+def session_of(connection: Connection | AsyncConnection) -> int:
+    """Return an identifier of the database session of ``connection``, shared by every checkout of a pooled session."""
+    return id(getattr(connection, "_impl", None) or connection)
+
+
+class _InstrumentedProxy:
+    __slots__ = ("_counter", "_recorder", "_route", "_session", "_target")
+
+    def _round_trips(self) -> int:
+        return self._counter.count if self._counter is not None else 0
+
+    def _record(self, sql: str | None, operation: str, elapsed: float, rows: int, round_trips: int) -> None:
+        self._recorder.record(
+            sql or "",
+            operation,
+            elapsed,
+            rows,
+            self._round_trips() - round_trips if self._counter is not None else None,
+            self._route,
+            self._session,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._target, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target, name, value)
+
+
+class InstrumentedCursor(_InstrumentedProxy):
+    """Time the statements run on a :class:`Cursor <oracledb.Cursor>`.
+
+    A query is recorded once its rows have been fetched, or when the cursor executes another statement or is closed.
+    Fetch calls are timed, but iterating over the cursor is not wrapped row by row.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(
+        self,
+        cursor: Cursor,
+        recorder: StatementRecorder,
+        route: str | None,
+        counter: _RoundTripCounter | None,
+        session: int | None = None,
+    ) -> None:
+        object.__setattr__(self, "_target", cursor)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_route", route)
+        object.__setattr__(self, "_counter", counter)
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_pending", None)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Cursor]:  # type: ignore[override]
+        return Cursor
+
+    def _finish(self) -> None:
+        if self._pending is not None:
+            sql, operation, elapsed, round_trips = self._pending
+            object.__setattr__(self, "_pending", None)
+            self._record(sql, operation, elapsed, self._target.rowcount, round_trips)
+
+    def _fetched(self, elapsed: float, exhausted: bool) -> None:
+        if self._pending is not None:
+            self._pending[2] += elapsed
+            if exhausted:
+                self._finish()
+
+    def _run(self, operation: str, statement: str | None, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self._finish()
+        round_trips = self._round_trips()
+        started = perf_counter()
+        try:
+            result = fn(statement, *args, **kwargs)
+        except Exception:
+            self._record(statement, operation, perf_counter() - started, 0, round_trips)
+            raise
+        elapsed = perf_counter() - started
+        sql = statement if statement is not None else self._target.statement
+        if operation == "execute" and self._target.description is not None:
+            object.__setattr__(self, "_pending", [sql, operation, elapsed, round_trips])
+        else:
+            self._record(sql, operation, elapsed, max(self._target.rowcount, 0), round_trips)
+        return result
+
+    def execute(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        return self._run("execute", statement, self._target.execute, *args, **kwargs)
+
+    def executemany(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        return self._run("executemany", statement, self._target.executemany, *args, **kwargs)
+
+    def callproc(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return self._run("callproc", name, self._target.callproc, *args, **kwargs)
+
+    def callfunc(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return self._run("callfunc", name, self._target.callfunc, *args, **kwargs)
+
+    def fetchone(self) -> Any:
+        started = perf_counter()
+        row = self._target.fetchone()
+        self._fetched(perf_counter() - started, row is None)
+        return row
+
+    def fetchmany(self, size: int | None = None, *args: Any, **kwargs: Any) -> list[Any]:
+        started = perf_counter()
+        rows = self._target.fetchmany(size, *args, **kwargs)
+        self._fetched(perf_counter() - started, len(rows) < (size or self._target.arraysize))
+        return rows  # type: ignore[no-any-return]
+
+    def fetchall(self) -> list[Any]:
+        started = perf_counter()
+        rows = self._target.fetchall()
+        self._fetched(perf_counter() - started, True)
+        return rows  # type: ignore[no-any-return]
+
+    def close(self) -> None:
+        self._finish()
+        self._target.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._target)
+
+
+class InstrumentedAsyncCursor(_InstrumentedProxy):
+    """Time the statements run on an :class:`AsyncCursor <oracledb.AsyncCursor>`.
+
+    A query is recorded once its rows have been fetched, or when the cursor executes another statement or is closed.
+    Fetch calls are timed, but iterating over the cursor is not wrapped row by row.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(
+        self,
+        cursor: AsyncCursor,
+        recorder: StatementRecorder,
+        route: str | None,
+        counter: _RoundTripCounter | None,
+        session: int | None = None,
+    ) -> None:
+        object.__setattr__(self, "_target", cursor)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_route", route)
+        object.__setattr__(self, "_counter", counter)
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_pending", None)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncCursor]:  # type: ignore[override]
+        return AsyncCursor
+
+    def _finish(self) -> None:
+        if self._pending is not None:
+            sql, operation, elapsed, round_trips = self._pending
+            object.__setattr__(self, "_pending", None)
+            self._record(sql, operation, elapsed, self._target.rowcount, round_trips)
+
+    def _fetched(self, elapsed: float, exhausted: bool) -> None:
+        if self._pending is not None:
+            self._pending[2] += elapsed
+            if exhausted:
+                self._finish()
+
+    async def _run(
+        self,
+        operation: str,
+        statement: str | None,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        self._finish()
+        round_trips = self._round_trips()
+        started = perf_counter()
+        try:
+            result = await fn(statement, *args, **kwargs)
+        except Exception:
+            self._record(statement, operation, perf_counter() - started, 0, round_trips)
+            raise
+        elapsed = perf_counter() - started
+        sql = statement if statement is not None else self._target.statement
+        if operation == "execute" and self._target.description is not None:
+            object.__setattr__(self, "_pending", [sql, operation, elapsed, round_trips])
+        else:
+            self._record(sql, operation, elapsed, max(self._target.rowcount, 0), round_trips)
+        return result
+
+    async def execute(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("execute", statement, self._target.execute, *args, **kwargs)
+
+    async def executemany(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("executemany", statement, self._target.executemany, *args, **kwargs)
+
+    async def callproc(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("callproc", name, self._target.callproc, *args, **kwargs)
+
+    async def callfunc(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("callfunc", name, self._target.callfunc, *args, **kwargs)
+
+    async def fetchone(self) -> Any:
+        started = perf_counter()
+        row = await self._target.fetchone()
+        self._fetched(perf_counter() - started, row is None)
+        return row
+
+    async def fetchmany(self, size: int | None = None, *args: Any, **kwargs: Any) -> list[Any]:
+        started = perf_counter()
+        rows = await self._target.fetchmany(size, *args, **kwargs)
+        self._fetched(perf_counter() - started, len(rows) < (size or self._target.arraysize))
+        return rows  # type: ignore[no-any-return]
+
+    async def fetchall(self) -> list[Any]:
+        started = perf_counter()
+        rows = await self._target.fetchall()
+        self._fetched(perf_counter() - started, True)
+        return rows  # type: ignore[no-any-return]
+
+    def close(self) -> None:
+        self._finish()
+        self._target.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __aiter__(self) -> Any:
+        return self._target.__aiter__()
+
+
+class InstrumentedConnection(_InstrumentedProxy):
+    """Proxy for a :class:`Connection <oracledb.Connection>` whose cursors record every statement."""
+
+    __slots__ = ()
+
+    def __init__(self, connection: Connection, recorder: StatementRecorder, route: str | None = None) -> None:
+        object.__setattr__(self, "_target", connection)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_route", route)
+        object.__setattr__(self, "_counter", _round_trip_counter(connection))
+        object.__setattr__(self, "_session", session_of(connection))
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Connection]:  # type: ignore[override]
+        return Connection
+
+    def cursor(self, *args: Any, **kwargs: Any) -> InstrumentedCursor:
+        return InstrumentedCursor(
+            self._target.cursor(*args, **kwargs), self._recorder, self._route, self._counter, self._session
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._target.__exit__(*exc_info)
+
+
+class InstrumentedAsyncConnection(_InstrumentedProxy):
+    """Proxy for an :class:`AsyncConnection <oracledb.AsyncConnection>` whose cursors record every statement.
+
+    The statement shortcuts of the connection (``execute``, ``fetchall``, ``callproc``, ...) are recorded as well.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, connection: AsyncConnection, recorder: StatementRecorder, route: str | None = None) -> None:
+        object.__setattr__(self, "_target", connection)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_route", route)
+        object.__setattr__(self, "_counter", _round_trip_counter(connection))
+        object.__setattr__(self, "_session", session_of(connection))
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncConnection]:  # type: ignore[override]
+        return AsyncConnection
+
+    def cursor(self, *args: Any, **kwargs: Any) -> InstrumentedAsyncCursor:
+        return InstrumentedAsyncCursor(
+            self._target.cursor(*args, **kwargs), self._recorder, self._route, self._counter, self._session
+        )
+
+    async def _run(self, operation: str, statement: str, *args: Any, **kwargs: Any) -> Any:
+        round_trips = self._round_trips()
+        started = perf_counter()
+        try:
+            result = await getattr(self._target, operation)(statement, *args, **kwargs)
+        except Exception:
+            self._record(statement, operation, perf_counter() - started, 0, round_trips)
+            raise
+        if operation == "fetchone":
+            rows = int(result is not None)
+        elif isinstance(result, list) and operation != "callproc":
+            rows = len(result)
+        else:
+            rows = 0
+        self._record(statement, operation, perf_counter() - started, rows, round_trips)
+        return result
+
+    async def execute(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("execute", statement, *args, **kwargs)
+
+    async def executemany(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("executemany", statement, *args, **kwargs)
+
+    async def fetchone(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchone", statement, *args, **kwargs)
+
+    async def fetchmany(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchmany", statement, *args, **kwargs)
+
+    async def fetchall(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchall", statement, *args, **kwargs)
+
+    async def callproc(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("callproc", name, *args, **kwargs)
+
+    async def callfunc(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("callfunc", name, *args, **kwargs)
+
+    async def run_pipeline(self, pipeline: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run ``pipeline``, recording each of its statements with an equal share of its elapsed time.
+
+        The round trips of the pipeline are attributed to its first statement.
+        """
+        round_trips = self._round_trips()
+        started = perf_counter()
+        results: list[Any] = []
+        try:
+            results = await self._target.run_pipeline(pipeline, *args, **kwargs)
+        finally:
+            elapsed = (perf_counter() - started) / max(len(pipeline.operations), 1)
+            for index, operation in enumerate(pipeline.operations):
+                if operation.statement is None:
+                    continue
+                rows = getattr(results[index], "rows", None) if index < len(results) else None
+                self._record(
+                    operation.statement, "pipeline", elapsed, len(rows) if isinstance(rows, list) else 0, round_trips
+                )
+                round_trips = self._round_trips()
+        return results
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._target.__aexit__(*exc_info)
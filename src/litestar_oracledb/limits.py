@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, Mapping
+
+from litestar.exceptions import ServiceUnavailableException
+
+from litestar_oracledb.instrumentation import route_of
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from litestar.types import Scope
+
+    from litestar_oracledb.metrics import PoolMetrics
+
+__all__ = ("ConnectionLimiter",)
+
+
+@dataclass
+class ConnectionLimiter:
+    """Cap the requests that hold or wait for a connection, and shed the excess with ``503 Service Unavailable``.
+
+    Each route gets a semaphore of ``max_connections`` slots, overridden by the ``route_limits`` entry of its path or by
+    the ``opt_key`` entry of its handler ``opt``. With ``key="dependency"`` all routes share a single semaphore. A request
+    that cannot get a slot, or a connection, within ``max_wait`` seconds fails fast with a ``Retry-After`` header instead
+    of piling up. Sync pools bound the wait for a connection themselves: ``max_wait`` is set as the ``wait_timeout`` of a
+    pool created from ``pool_config`` without a ``getmode``, with ``POOL_GETMODE_TIMEDWAIT``; create a
+    ``pool_instance`` with these settings as well.
+    """
+
+    max_connections: int | None = None
+    """Slots per route. Routes without a limit are not limited."""
+    route_limits: Mapping[str, int] = field(default_factory=dict)
+    """Slots of specific routes, keyed by path template, e.g. ``{"/reports/{report_id:int}": 2}``."""
+    opt_key: str = "db_max_connections"
+    """Key of the route handler ``opt`` overriding the slots of a route."""
+    key: Literal["route", "dependency"] = "route"
+    """Whether routes get a semaphore each or share the semaphore of the dependency."""
+    max_wait: float | None = None
+    """Seconds to wait for a slot, and for a connection. Waits forever if ``None``."""
+    retry_after: int = 1
+    """Value of the ``Retry-After`` header of rejected requests, in seconds."""
+    _semaphores: dict[str, asyncio.Semaphore] = field(init=False, default_factory=dict)
+    _waiting: Counter[str] = field(init=False, default_factory=Counter)
+
+    def limit_of(self, scope: Scope) -> int | None:
+        """Return the slots of the route of ``scope``, ``None`` if it is not limited.
+
+        Args:
+            scope: The current connection's scope.
+
+        Returns:
+            The number of slots.
+        """
+        route_handler = scope.get("route_handler")
+        if route_handler is not None and self.opt_key in route_handler.opt:
+            return int(route_handler.opt[self.opt_key])
+        route = route_of(scope)
+        return self.route_limits.get(route, self.max_connections) if route is not None else self.max_connections
+
+    def route_key(self, scope: Scope) -> str:
+        """Return the name of the semaphore of ``scope``: its path template, or ``"*"`` with ``key="dependency"``."""
+        if self.key == "dependency":
+            return "*"
+        return route_of(scope) or scope.get("path", "*")
+
+    def queue_depth(self, route: str) -> int:
+        """Return the number of requests waiting for a slot of ``route``, or of ``"*"`` with ``key="dependency"``."""
+        return self._waiting[route]
+
+    def unavailable(self, route: str) -> ServiceUnavailableException:
+        """Return the exception rejecting a request to ``route``."""
+        return ServiceUnavailableException(
+            detail=f"Too many requests waiting for a database connection on {route}",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    async def acquire(
+        self, scope: Scope, metrics: PoolMetrics | None = None, pool: str = ""
+    ) -> Callable[[], None] | None:
+        """Wait for a slot of the route of ``scope``.
+
+        Args:
+            scope: The current connection's scope.
+            metrics: Recorder of the wait queue depth and of rejected requests.
+            pool: Name of the pool reported to ``metrics``.
+
+        Raises:
+            ServiceUnavailableException: If no slot was free within ``max_wait``.
+
+        Returns:
+            A callable releasing the slot, or ``None`` if the route is not limited.
+        """
+        limit = self.limit_of(scope)
+        if limit is None:
+            return None
+        route = self.route_key(scope)
+        if (semaphore := self._semaphores.get(route)) is None:
+            semaphore = self._semaphores[route] = asyncio.Semaphore(limit)
+        if not semaphore.locked():
+            await semaphore.acquire()
+            return semaphore.release
+        self._waiting[route] += 1
+        if metrics is not None:
+            metrics.record_wait_queue(pool, route, self._waiting[route])
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.max_wait)
+        except asyncio.TimeoutError:
+            if metrics is not None:
+                metrics.record_rejection(pool, route)
+            raise self.unavailable(route) from None
+        finally:
+            self._waiting[route] -= 1
+            if metrics is not None:
+                metrics.record_wait_queue(pool, route, self._waiting[route])
+        return semaphore.release
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import codecs
+from typing import TYPE_CHECKING
+
+from litestar.exceptions import HTTPException
+from litestar.status_codes import HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
+    from typing import Any
+
+__all__ = (
+    "parse_range",
+    "read_chunks",
+    "write_chunks",
+)
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Return the ``[start, stop)`` byte range requested by a ``Range`` header.
+
+    Only single ``bytes`` ranges are honoured; anything else, including multiple ranges, is ignored so the whole
+    content is sent, as RFC 9110 allows.
+
+    Args:
+        header: The value of the ``Range`` header.
+        size: The size of the content in bytes.
+
+    Raises:
+        HTTPException: With status ``416`` if the range lies outside of the content.
+
+    Returns:
+        The range, or ``None`` to send the whole content.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    first, sep, last = spec.strip().partition("-")
+    if unit.strip().lower() != "bytes" or "," in spec or not sep:
+        return None
+    try:
+        if first:
+            start, stop = int(first), int(last) + 1 if last else size
+        else:
+            suffix = int(last)
+            start, stop = (max(size - suffix, 0), size) if suffix else (size, size)
+    except ValueError:
+        return None
+    stop = min(stop, size)
+    if start >= stop:
+        raise HTTPException(
+            status_code=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, stop
+
+
+async def read_chunks(
+    read: Callable[[int, int], Awaitable[str | bytes]],
+    start: int,
+    stop: int,
+    chunk_size: int,
+) -> AsyncGenerator[bytes, None]:
+    """Read ``[start, stop)`` of a LOB, one ``chunk_size`` piece per round trip.
+
+    Args:
+        read: The ``read(offset, amount)`` method of the LOB, with a 1-based offset.
+        start: The first byte (BLOB) or character (CLOB) to read, 0-based.
+        stop: The end of the range, exclusive.
+        chunk_size: Bytes or characters per read.
+
+    Yields:
+        The content, CLOB text encoded as UTF-8.
+    """
+    offset = start
+    while offset < stop:
+        amount = min(chunk_size, stop - offset)
+        data = await read(offset + 1, amount)
+        if not data:
+            return
+        offset += len(data)
+        yield data.encode() if isinstance(data, str) else data
+
+
+async def write_chunks(
+    write: Callable[[str | bytes, int], Awaitable[Any]],
+    chunks: AsyncIterable[bytes],
+    buffer_size: int,
+    text: bool = False,
+) -> int:
+    """Write ``chunks`` to a LOB, buffering at most ``buffer_size`` bytes between writes.
+
+    Args:
+        write: The ``write(data, offset)`` method of the LOB, with a 1-based offset.
+        chunks: The content, e.g. ``request.stream()``.
+        buffer_size: Bytes collected before each write.
+        text: Decode the content as UTF-8 for a CLOB.
+
+    Returns:
+        The bytes (BLOB) or characters (CLOB) written.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")() if text else None
+    buffer = bytearray()
+    written = 0
+
+    async def flush(final: bool = False) -> None:
+        nonlocal written
+        raw = bytes(buffer)
+        buffer.clear()
+        data = decoder.decode(raw, final) if decoder is not None else raw
+        if data:
+            await write(data, written + 1)
+            written += len(data)
+
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= buffer_size:
+            await flush()
+    await flush(final=True)
+    return written
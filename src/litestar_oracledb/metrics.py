@@ -0,0 +1,507 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from litestar_oracledb._utils import get_scope_state, set_scope_state
+from litestar_oracledb.exceptions import MissingDependencyError
+from litestar_oracledb.sizing import PoolResize
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from litestar.types import Scope
+
+    from litestar_oracledb.instrumentation import StatementStatistics
+
+__all__ = (
+    "InMemoryPoolMetrics",
+    "OpenTelemetryPoolMetrics",
+    "PoolMetrics",
+    "PoolUsageSample",
+    "PrometheusPoolMetrics",
+)
+
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+class PoolMetrics:
+    """Hook called by the database configs to record how the connection pool behaves.
+
+    Every method is a no-op, so implementations only override the measurements they are interested in. ``pool`` is the
+    ``pool_app_state_key`` of the config that recorded the measurement, which keeps multiple configs apart.
+    """
+
+    def record_acquire(self, pool: str, seconds: float) -> None:
+        """Record the time spent waiting for ``pool.acquire()``.
+
+        Args:
+            pool: Name of the pool.
+            seconds: Wait time in seconds.
+        """
+
+    def record_checkout(self, pool: str, seconds: float) -> None:
+        """Record how long a connection was checked out for a request, from acquire to release.
+
+        Args:
+            pool: Name of the pool.
+            seconds: Checkout duration in seconds.
+        """
+
+    def record_commit(self, pool: str) -> None:
+        """Record a commit issued by the plugin.
+
+        Args:
+            pool: Name of the pool.
+        """
+
+    def record_rollback(self, pool: str) -> None:
+        """Record a rollback issued by the plugin.
+
+        Args:
+            pool: Name of the pool.
+        """
+
+    def record_pool_usage(self, pool: str, busy: int, opened: int, max_size: int) -> None:
+        """Record a periodic sample of the pool size.
+
+        Args:
+            pool: Name of the pool.
+            busy: Connections currently checked out.
+            opened: Connections currently open, idle or busy.
+            max_size: Maximum number of connections of the pool.
+        """
+
+    def record_statement(self, pool: str, statistics: StatementStatistics) -> None:
+        """Record a statement run on an instrumented connection.
+
+        Only called when statement instrumentation is enabled on the config.
+
+        Args:
+            pool: Name of the pool.
+            statistics: Measurements of the statement.
+        """
+
+    def record_cache_hit(self, pool: str) -> None:
+        """Record a query answered from the request cache.
+
+        Args:
+            pool: Name of the pool.
+        """
+
+    def record_cache_miss(self, pool: str) -> None:
+        """Record a cacheable query that was sent to the database.
+
+        Args:
+            pool: Name of the pool.
+        """
+
+    def record_route(self, pool: str, fallback: bool) -> None:
+        """Record a request served by ``pool`` through an :class:`AsyncRoutingDatabaseConfig
+        <litestar_oracledb.config.AsyncRoutingDatabaseConfig>`.
+
+        Args:
+            pool: Name of the pool that served the request.
+            fallback: ``True`` if the preferred pool was skipped because it was unavailable or lagging.
+        """
+
+    def record_pool_resize(self, pool: str, old_size: int, new_size: int, reason: str) -> None:
+        """Record a change of the maximum pool size made by a :class:`PoolSizer <litestar_oracledb.sizing.PoolSizer>`.
+
+        Args:
+            pool: Name of the pool.
+            old_size: The previous maximum size.
+            new_size: The new maximum size.
+            reason: Why the pool was resized, e.g. ``"wait"`` or ``"idle"``.
+        """
+
+    def record_wait_queue(self, pool: str, route: str, depth: int) -> None:
+        """Record the number of requests waiting for a connection slot of a :class:`ConnectionLimiter
+        <litestar_oracledb.limits.ConnectionLimiter>`.
+
+        Args:
+            pool: Name of the pool.
+            route: The route, or ``"*"`` for a limit shared by all routes.
+            depth: Requests currently waiting.
+        """
+
+    def record_rejection(self, pool: str, route: str) -> None:
+        """Record a request rejected with ``503`` because no connection slot was free in time.
+
+        Args:
+            pool: Name of the pool.
+            route: The route, or ``"*"`` for a limit shared by all routes.
+        """
+
+    def record_circuit_state(self, pool: str, old_state: str, new_state: str) -> None:
+        """Record a transition of the :class:`CircuitBreaker <litestar_oracledb.breaker.CircuitBreaker>` of a pool.
+
+        Args:
+            pool: Name of the pool.
+            old_state: The previous state: ``"closed"``, ``"open"`` or ``"half_open"``.
+            new_state: The new state.
+        """
+
+
+@dataclass(frozen=True)
+class PoolUsageSample:
+    """A pool usage sample recorded by :class:`InMemoryPoolMetrics`."""
+
+    busy: int
+    opened: int
+    max_size: int
+
+
+class InMemoryPoolMetrics(PoolMetrics):
+    """Keep every measurement in memory, keyed by pool name.
+
+    Intended for tests and local tuning; measurements are never discarded.
+    """
+
+    def __init__(self) -> None:
+        self.acquire_times: defaultdict[str, list[float]] = defaultdict(list)
+        self.checkout_times: defaultdict[str, list[float]] = defaultdict(list)
+        self.commits: Counter[str] = Counter()
+        self.rollbacks: Counter[str] = Counter()
+        self.pool_usage: defaultdict[str, list[PoolUsageSample]] = defaultdict(list)
+        self.statements: defaultdict[str, list[StatementStatistics]] = defaultdict(list)
+        self.cache_hits: Counter[str] = Counter()
+        self.cache_misses: Counter[str] = Counter()
+        self.routes: Counter[str] = Counter()
+        self.fallbacks: Counter[str] = Counter()
+        self.resizes: defaultdict[str, list[PoolResize]] = defaultdict(list)
+        self.wait_queues: defaultdict[str, dict[str, int]] = defaultdict(dict)
+        self.rejections: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.circuit_states: defaultdict[str, list[str]] = defaultdict(list)
+
+    def record_acquire(self, pool: str, seconds: float) -> None:
+        self.acquire_times[pool].append(seconds)
+
+    def record_checkout(self, pool: str, seconds: float) -> None:
+        self.checkout_times[pool].append(seconds)
+
+    def record_commit(self, pool: str) -> None:
+        self.commits[pool] += 1
+
+    def record_rollback(self, pool: str) -> None:
+        self.rollbacks[pool] += 1
+
+    def record_pool_usage(self, pool: str, busy: int, opened: int, max_size: int) -> None:
+        self.pool_usage[pool].append(PoolUsageSample(busy=busy, opened=opened, max_size=max_size))
+
+    def record_statement(self, pool: str, statistics: StatementStatistics) -> None:
+        self.statements[pool].append(statistics)
+
+    def record_cache_hit(self, pool: str) -> None:
+        self.cache_hits[pool] += 1
+
+    def record_cache_miss(self, pool: str) -> None:
+        self.cache_misses[pool] += 1
+
+    def record_route(self, pool: str, fallback: bool) -> None:
+        self.routes[pool] += 1
+        if fallback:
+            self.fallbacks[pool] += 1
+
+    def record_pool_resize(self, pool: str, old_size: int, new_size: int, reason: str) -> None:
+        self.resizes[pool].append(PoolResize(old_size, new_size, reason))
+
+    def record_wait_queue(self, pool: str, route: str, depth: int) -> None:
+        self.wait_queues[pool][route] = depth
+
+    def record_rejection(self, pool: str, route: str) -> None:
+        self.rejections[pool][route] += 1
+
+    def record_circuit_state(self, pool: str, old_state: str, new_state: str) -> None:
+        self.circuit_states[pool].append(new_state)
+
+
+class PrometheusPoolMetrics(PoolMetrics):
+    """Export pool measurements as Prometheus metrics.
+
+    Requires the ``prometheus`` extra (``prometheus-client``).
+    """
+
+    def __init__(self, namespace: str = "litestar_oracledb", registry: Any = None) -> None:
+        """Initialize ``PrometheusPoolMetrics``.
+
+        Args:
+            namespace: Prefix of the metric names.
+            registry: The ``CollectorRegistry`` to register the metrics with. Defaults to the global registry.
+        """
+        try:
+            from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+        except ImportError as e:
+            raise MissingDependencyError(package="prometheus_client", install_package="prometheus") from e
+
+        registry = registry if registry is not None else REGISTRY
+        self.acquire_seconds = Histogram(
+            "pool_acquire_seconds",
+            "Time spent waiting for a pooled connection.",
+            ["pool"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.checkout_seconds = Histogram(
+            "pool_checkout_seconds",
+            "Time a pooled connection stayed checked out for a request.",
+            ["pool"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.transactions = Counter(
+            "transactions",
+            "Transactions ended by the plugin.",
+            ["pool", "outcome"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.busy = Gauge("pool_busy", "Connections checked out.", ["pool"], namespace=namespace, registry=registry)
+        self.opened = Gauge("pool_opened", "Connections open.", ["pool"], namespace=namespace, registry=registry)
+        self.max_size = Gauge("pool_max", "Maximum pool size.", ["pool"], namespace=namespace, registry=registry)
+        self.statement_seconds = Histogram(
+            "statement_seconds",
+            "Time spent executing a statement and fetching its rows.",
+            ["pool", "operation"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.statement_rows = Counter(
+            "statement_rows",
+            "Rows fetched or affected by statements.",
+            ["pool"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.statement_round_trips = Counter(
+            "statement_round_trips", "Round trips made by statements.", ["pool"], namespace=namespace, registry=registry
+        )
+        self.cache_lookups = Counter(
+            "cache_lookups",
+            "Query result cache lookups.",
+            ["pool", "result"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.routed_requests = Counter(
+            "routed_requests",
+            "Requests served by a pool of a routing config.",
+            ["pool", "fallback"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.pool_resizes = Counter(
+            "pool_resizes",
+            "Changes of the maximum pool size made by the pool sizer.",
+            ["pool", "direction", "reason"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.wait_queue = Gauge(
+            "connection_wait_queue",
+            "Requests waiting for a connection slot.",
+            ["pool", "route"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.rejections = Counter(
+            "connection_rejections",
+            "Requests rejected because no connection slot was free in time.",
+            ["pool", "route"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.circuit_state = Gauge(
+            "circuit_state",
+            "State of the circuit breaker: 0 closed, 1 half-open, 2 open.",
+            ["pool"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.circuit_transitions = Counter(
+            "circuit_transitions",
+            "Transitions of the circuit breaker, by new state.",
+            ["pool", "state"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def record_acquire(self, pool: str, seconds: float) -> None:
+        self.acquire_seconds.labels(pool).observe(seconds)
+
+    def record_checkout(self, pool: str, seconds: float) -> None:
+        self.checkout_seconds.labels(pool).observe(seconds)
+
+    def record_commit(self, pool: str) -> None:
+        self.transactions.labels(pool, "commit").inc()
+
+    def record_rollback(self, pool: str) -> None:
+        self.transactions.labels(pool, "rollback").inc()
+
+    def record_pool_usage(self, pool: str, busy: int, opened: int, max_size: int) -> None:
+        self.busy.labels(pool).set(busy)
+        self.opened.labels(pool).set(opened)
+        self.max_size.labels(pool).set(max_size)
+
+    def record_statement(self, pool: str, statistics: StatementStatistics) -> None:
+        self.statement_seconds.labels(pool, statistics.operation).observe(statistics.elapsed)
+        self.statement_rows.labels(pool).inc(statistics.rows)
+        if statistics.round_trips is not None:
+            self.statement_round_trips.labels(pool).inc(statistics.round_trips)
+
+    def record_cache_hit(self, pool: str) -> None:
+        self.cache_lookups.labels(pool, "hit").inc()
+
+    def record_cache_miss(self, pool: str) -> None:
+        self.cache_lookups.labels(pool, "miss").inc()
+
+    def record_route(self, pool: str, fallback: bool) -> None:
+        self.routed_requests.labels(pool, str(fallback).lower()).inc()
+
+    def record_pool_resize(self, pool: str, old_size: int, new_size: int, reason: str) -> None:
+        self.pool_resizes.labels(pool, "grow" if new_size > old_size else "shrink", reason).inc()
+
+    def record_wait_queue(self, pool: str, route: str, depth: int) -> None:
+        self.wait_queue.labels(pool, route).set(depth)
+
+    def record_rejection(self, pool: str, route: str) -> None:
+        self.rejections.labels(pool, route).inc()
+
+    def record_circuit_state(self, pool: str, old_state: str, new_state: str) -> None:
+        self.circuit_state.labels(pool).set(_CIRCUIT_STATE_VALUES[new_state])
+        self.circuit_transitions.labels(pool, new_state).inc()
+
+
+class OpenTelemetryPoolMetrics(PoolMetrics):
+    """Export pool measurements through the OpenTelemetry metrics API.
+
+    Requires the ``opentelemetry`` extra (``opentelemetry-api``).
+    """
+
+    def __init__(self, meter_provider: Any = None) -> None:
+        """Initialize ``OpenTelemetryPoolMetrics``.
+
+        Args:
+            meter_provider: The ``MeterProvider`` to create the instruments with. Defaults to the global provider.
+        """
+        try:
+            from opentelemetry.metrics import get_meter
+        except ImportError as e:
+            raise MissingDependencyError(package="opentelemetry", install_package="opentelemetry") from e
+
+        meter = get_meter("litestar_oracledb", meter_provider=meter_provider)
+        self.acquire_seconds = meter.create_histogram(
+            "db.client.connection.wait_time", unit="s", description="Time spent waiting for a pooled connection."
+        )
+        self.checkout_seconds = meter.create_histogram(
+            "db.client.connection.use_time", unit="s", description="Time a pooled connection stayed checked out."
+        )
+        self.transactions = meter.create_counter(
+            "db.client.transactions", description="Transactions ended by the plugin."
+        )
+        self.busy = meter.create_gauge("db.client.connection.busy", description="Connections checked out.")
+        self.opened = meter.create_gauge("db.client.connection.count", description="Connections open.")
+        self.max_size = meter.create_gauge("db.client.connection.max", description="Maximum pool size.")
+        self.statement_seconds = meter.create_histogram(
+            "db.client.operation.duration", unit="s", description="Time spent executing a statement."
+        )
+        self.statement_rows = meter.create_counter(
+            "db.client.response.returned_rows", description="Rows fetched or affected by statements."
+        )
+        self.statement_round_trips = meter.create_counter(
+            "db.client.round_trips", description="Round trips made by statements."
+        )
+        self.cache_lookups = meter.create_counter("db.client.cache.lookups", description="Query result cache lookups.")
+        self.routed_requests = meter.create_counter(
+            "db.client.routed_requests", description="Requests served by a pool of a routing config."
+        )
+        self.pool_resizes = meter.create_counter(
+            "db.client.connection.resizes", description="Changes of the maximum pool size made by the pool sizer."
+        )
+        self.wait_queue = meter.create_gauge(
+            "db.client.connection.pending_requests", description="Requests waiting for a connection slot."
+        )
+        self.rejections = meter.create_counter(
+            "db.client.connection.rejections",
+            description="Requests rejected because no connection slot was free in time.",
+        )
+        self.circuit_state = meter.create_gauge(
+            "db.client.circuit.state", description="State of the circuit breaker: 0 closed, 1 half-open, 2 open."
+        )
+        self.circuit_transitions = meter.create_counter(
+            "db.client.circuit.transitions", description="Transitions of the circuit breaker, by new state."
+        )
+
+    def record_acquire(self, pool: str, seconds: float) -> None:
+        self.acquire_seconds.record(seconds, {"pool.name": pool})
+
+    def record_checkout(self, pool: str, seconds: float) -> None:
+        self.checkout_seconds.record(seconds, {"pool.name": pool})
+
+    def record_commit(self, pool: str) -> None:
+        self.transactions.add(1, {"pool.name": pool, "outcome": "commit"})
+
+    def record_rollback(self, pool: str) -> None:
+        self.transactions.add(1, {"pool.name": pool, "outcome": "rollback"})
+
+    def record_pool_usage(self, pool: str, busy: int, opened: int, max_size: int) -> None:
+        attributes = {"pool.name": pool}
+        self.busy.set(busy, attributes)
+        self.opened.set(opened, attributes)
+        self.max_size.set(max_size, attributes)
+
+    def record_statement(self, pool: str, statistics: StatementStatistics) -> None:
+        attributes = {"pool.name": pool, "db.operation.name": statistics.operation}
+        self.statement_seconds.record(statistics.elapsed, attributes)
+        self.statement_rows.add(statistics.rows, {"pool.name": pool})
+        if statistics.round_trips is not None:
+            self.statement_round_trips.add(statistics.round_trips, {"pool.name": pool})
+
+    def record_cache_hit(self, pool: str) -> None:
+        self.cache_lookups.add(1, {"pool.name": pool, "result": "hit"})
+
+    def record_cache_miss(self, pool: str) -> None:
+        self.cache_lookups.add(1, {"pool.name": pool, "result": "miss"})
+
+    def record_route(self, pool: str, fallback: bool) -> None:
+        self.routed_requests.add(1, {"pool.name": pool, "fallback": fallback})
+
+    def record_pool_resize(self, pool: str, old_size: int, new_size: int, reason: str) -> None:
+        direction = "grow" if new_size > old_size else "shrink"
+        self.pool_resizes.add(1, {"pool.name": pool, "direction": direction, "reason": reason})
+
+    def record_wait_queue(self, pool: str, route: str, depth: int) -> None:
+        self.wait_queue.set(depth, {"pool.name": pool, "http.route": route})
+
+    def record_rejection(self, pool: str, route: str) -> None:
+        self.rejections.add(1, {"pool.name": pool, "http.route": route})
+
+    def record_circuit_state(self, pool: str, old_state: str, new_state: str) -> None:
+        self.circuit_state.set(_CIRCUIT_STATE_VALUES[new_state], {"pool.name": pool})
+        self.circuit_transitions.add(1, {"pool.name": pool, "state": new_state})
+
+
+def start_checkout(scope: Scope, connection_scope_key: str) -> None:
+    """Remember when the connection of ``scope`` was checked out.
+
+    Args:
+        scope: The connection scope.
+        connection_scope_key: The key the connection is stored under.
+    """
+    set_scope_state(scope, f"{connection_scope_key}_checkout", perf_counter())
+
+
+def end_checkout(scope: Scope, connection_scope_key: str, metrics: PoolMetrics, pool: str) -> None:
+    """Record the checkout duration of the connection of ``scope``.
+
+    Args:
+        scope: The connection scope.
+        connection_scope_key: The key the connection is stored under.
+        metrics: The metrics recorder.
+        pool: Name of the pool.
+    """
+    started = get_scope_state(scope, f"{connection_scope_key}_checkout", pop=True)
+    if started is not None:
+        metrics.record_checkout(pool, perf_counter() - started)
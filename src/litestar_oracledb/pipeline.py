@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Tuple, Union
+
+import oracledb
+
+from litestar_oracledb.cache import is_query
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from contextlib import AbstractAsyncContextManager
+
+    from oracledb.connection import AsyncConnection
+
+__all__ = (
+    "Statement",
+    "StatementResult",
+    "only_queries",
+    "run_fanned_out",
+    "run_pipelined",
+    "run_serially",
+    "supports_pipelining",
+)
+
+PIPELINING_DATABASE_VERSION = 23
+"""Major version of the first Oracle Database release that runs the statements of a pipeline in one round trip."""
+
+Statement = Union[str, Tuple[str, Any]]
+"""A statement to run: its SQL text, or a tuple of its SQL text and bind values."""
+
+
+@dataclass
+class StatementResult:
+    """Outcome of one statement of a batch."""
+
+    sql: str
+    """The statement."""
+    rows: list[Any] | None = None
+    """The rows of a query, ``None`` for other statements or if it failed."""
+    error: Exception | None = None
+    """The error the statement failed with."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> list[Any] | None:
+        """Return :attr:`rows`, raising :attr:`error` if the statement failed."""
+        if self.error is not None:
+            raise self.error
+        return self.rows
+
+
+def _split(statement: Statement) -> tuple[str, Any]:
+    return (statement, None) if isinstance(statement, str) else statement
+
+
+def only_queries(statements: Sequence[Statement]) -> bool:
+    """Return ``True`` if every statement of ``statements`` is a query."""
+    return all(is_query(_split(statement)[0]) for statement in statements)
+
+
+def supports_pipelining(connection: AsyncConnection) -> bool:
+    """Return ``True`` if the driver and the database of ``connection`` can pipeline statements.
+
+    Pipelining needs python-oracledb 2.4 and Oracle Database 23ai; older databases accept pipelines but run them one
+    round trip per statement.
+
+    Args:
+        connection: The connection.
+
+    Returns:
+        Whether statements sent in one pipeline share a round trip.
+    """
+    if not hasattr(oracledb, "create_pipeline"):
+        return False
+    try:
+        return int(connection.version.split(".", 1)[0]) >= PIPELINING_DATABASE_VERSION
+    except (AttributeError, ValueError, oracledb.Error):
+        return False
+
+
+async def run_pipelined(connection: AsyncConnection, statements: Sequence[Statement]) -> list[StatementResult]:
+    """Send ``statements`` to the database in a single pipeline on ``connection``.
+
+    Args:
+        connection: The connection. Statements join its transaction.
+        statements: The statements. Queries return their rows.
+
+    Returns:
+        The results, in the order of ``statements``.
+    """
+    pipeline = oracledb.create_pipeline()
+    for statement in statements:
+        sql, parameters = _split(statement)
+        if is_query(sql):
+            pipeline.add_fetchall(sql, parameters)
+        else:
+            pipeline.add_execute(sql, parameters)
+    results = []
+    for statement, op_result in zip(statements, await connection.run_pipeline(pipeline, continue_on_error=True)):
+        sql, _ = _split(statement)
+        if op_result.error is not None:
+            exc_type = getattr(op_result.error, "exc_type", None) or oracledb.DatabaseError
+            results.append(StatementResult(sql, error=exc_type(op_result.error)))
+        else:
+            results.append(StatementResult(sql, rows=op_result.rows if is_query(sql) else None))
+    return results
+
+
+async def run_serially(connection: AsyncConnection, statements: Sequence[Statement]) -> list[StatementResult]:
+    """Run ``statements`` one after another on ``connection``, with a round trip each.
+
+    Args:
+        connection: The connection. Statements join its transaction.
+        statements: The statements. Queries return their rows.
+
+    Returns:
+        The results, in the order of ``statements``.
+    """
+    results = []
+    for statement in statements:
+        sql, parameters = _split(statement)
+        try:
+            if is_query(sql):
+                results.append(StatementResult(sql, rows=await connection.fetchall(sql, parameters)))
+            else:
+                await connection.execute(sql, parameters)
+                results.append(StatementResult(sql))
+        except oracledb.Error as exc:
+            results.append(StatementResult(sql, error=exc))
+    return results
+
+
+async def run_fanned_out(
+    get_connection: Callable[[], AbstractAsyncContextManager[AsyncConnection]],
+    statements: Sequence[Statement],
+    max_concurrency: int = 4,
+    commit_each: bool = False,
+) -> list[StatementResult]:
+    """Run ``statements`` concurrently, each on a connection of its own.
+
+    Args:
+        get_connection: Returns a context checking out a pooled connection.
+        statements: The statements.
+        max_concurrency: Maximum connections checked out at a time.
+        commit_each: Allow statements other than queries, each committed on its connection rather than joining a
+            transaction.
+
+    Raises:
+        ValueError: If a statement is not a query and ``commit_each`` is not set.
+
+    Returns:
+        The results, in the order of ``statements``.
+    """
+    if not commit_each and not only_queries(statements):
+        msg = "Fanned out statements other than queries are committed one by one, pass 'commit_each=True' to allow it."
+        raise ValueError(msg)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(statement: Statement) -> StatementResult:
+        sql, parameters = _split(statement)
+        async with semaphore:
+            try:
+                async with get_connection() as connection:
+                    if is_query(sql):
+                        return StatementResult(sql, rows=await connection.fetchall(sql, parameters))
+                    await connection.execute(sql, parameters)
+                    await connection.commit()
+                    return StatementResult(sql)
+            except oracledb.Error as exc:
+                return StatementResult(sql, error=exc)
+
+    return list(await asyncio.gather(*(run(statement) for statement in statements)))
@@ -1,19 +1,74 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, Sequence, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, Sequence, TypeVar
 
+from litestar.constants import HTTP_RESPONSE_BODY
 from litestar.plugins import InitPluginProtocol
+from litestar.utils.sync import ensure_async_callable
 
+from litestar_oracledb._utils import get_scope_namespace
+from litestar_oracledb.config._common import SESSION_TERMINUS_ASGI_EVENTS
 from litestar_oracledb.exceptions import ImproperConfigurationError
 
 if TYPE_CHECKING:
-    from litestar.config.app import AppConfig
-    from litestar.types import BeforeMessageSendHookHandler
-
-    from litestar_oracledb.config import AsyncOracleDatabaseConfig, SyncOracleDatabaseConfig
-
+    from collections.abc import Awaitable, Callable
 
-ConfigT = TypeVar("ConfigT", bound="AsyncOracleDatabaseConfig | SyncOracleDatabaseConfig")
+    from litestar.config.app import AppConfig
+    from litestar.types import Message, Scope
+
+    from litestar_oracledb.config import (
+        AsyncOracleDatabaseConfig,
+        AsyncRoutingDatabaseConfig,
+        SyncOracleDatabaseConfig,
+    )
+
+
+ConfigT = TypeVar("ConfigT", bound="AsyncOracleDatabaseConfig | SyncOracleDatabaseConfig | AsyncRoutingDatabaseConfig")
+
+
+def before_send_dispatcher(configs: Sequence[Any]) -> Callable[[Message, Scope], Awaitable[None]]:
+    """Combine the ``before_send_handler`` of each config into a single hook.
+
+    Handlers built by the configs are called, in order, only for messages ending a session of a scope that holds one
+    of their ``before_send_scope_keys``; every other message is skipped after a single lookup of the scope state.
+    Custom handlers see every message, as they would if installed on their own. Once the last body message of a
+    response is sent, connections handed over to a ``stream_lob`` response that never streamed are given back.
+
+    Args:
+        configs: The database configs.
+
+    Returns:
+        The hook.
+    """
+    handlers = [
+        (config.before_send_scope_keys, ensure_async_callable(config.before_send_handler))
+        for config in configs
+        if config.before_send_handler is not None
+    ]
+    custom = any(keys is None for keys, _ in handlers)
+    streaming = [
+        (streaming_config.streamed_connection_scope_key, streaming_config.close_streamed_connection)
+        for config in configs
+        for streaming_config in getattr(config, "configs", [config])
+    ]
+
+    async def before_send(message: Message, scope: Scope) -> None:
+        if message["type"] == HTTP_RESPONSE_BODY and not message.get("more_body", False):
+            if namespace := get_scope_namespace(scope):
+                for key, close in streaming:
+                    if key in namespace:
+                        await close(scope)
+            if not custom:
+                return
+        ending = message["type"] in SESSION_TERMINUS_ASGI_EVENTS
+        namespace = get_scope_namespace(scope) if ending else None
+        if not namespace and not custom:
+            return
+        for keys, handler in handlers:
+            if keys is None or (namespace and not keys.isdisjoint(namespace)):
+                await handler(message, scope)
+
+    return before_send
 
 
 class SlotsBase:
@@ -61,10 +116,11 @@ class OracleDatabasePlugin(InitPluginProtocol, SlotsBase, Generic[ConfigT]):
             app_config: The :class:`AppConfig <.config.app.AppConfig>` instance.
         """
         self._validate_config()
-        for config in self._config if isinstance(self._config, Sequence) else [self._config]:
+        configs = self._config if isinstance(self._config, Sequence) else [self._config]
+        for config in configs:
             app_config.dependencies.update(config.dependencies)
-            app_config.before_send.append(cast("BeforeMessageSendHookHandler", config.before_send_handler))
             app_config.lifespan.append(config.lifespan)
             app_config.signature_namespace.update(config.signature_namespace)
+        app_config.before_send.append(before_send_dispatcher(configs))
 
         return app_config
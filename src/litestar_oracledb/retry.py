@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from oracledb.connection import AsyncConnection, Connection
+from oracledb.cursor import AsyncCursor, Cursor
+
+from litestar_oracledb.breaker import CONNECTION_ERROR_CODES, is_connection_error
+from litestar_oracledb.cache import is_cacheable_query
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from typing_extensions import Self
+
+__all__ = (
+    "TRANSIENT_ERROR_CODES",
+    "RetryPolicy",
+    "RetryingAsyncConnection",
+    "RetryingAsyncCursor",
+    "RetryingConnection",
+    "RetryingCursor",
+    "is_idempotent",
+    "is_transient_error",
+)
+
+TRANSIENT_ERROR_CODES: frozenset[str] = CONNECTION_ERROR_CODES | {
+    "ORA-00028",  # session killed, e.g. drained by a planned RAC maintenance
+    "ORA-01012",  # not logged on
+    "ORA-02396",  # exceeded maximum idle time
+    "ORA-25408",  # cannot safely replay call
+}
+"""Error codes after which a statement can succeed on another connection."""
+
+_IDEMPOTENT_MARKER = re.compile(r"/\*\s*idempotent\s*\*/", re.IGNORECASE)
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return ``True`` if ``exc`` lost the connection, so the statement may succeed on a new one.
+
+    Args:
+        exc: The exception.
+
+    Returns:
+        Whether the statement can be retried.
+    """
+    return is_connection_error(exc, TRANSIENT_ERROR_CODES)
+
+
+def is_idempotent(sql: str | None) -> bool:
+    """Return ``True`` if running ``sql`` twice has the same effect as running it once.
+
+    Queries are idempotent, except ``SELECT ... FOR UPDATE``. Other statements can be marked with an
+    ``/* idempotent */`` comment.
+
+    Args:
+        sql: The SQL text.
+
+    Returns:
+        Whether the statement can be replayed.
+    """
+    return is_cacheable_query(sql) or (sql is not None and _IDEMPOTENT_MARKER.search(sql) is not None)
+
+
+@dataclass
+class RetryPolicy:
+    """Replay idempotent statements on a new connection after a transient failure, such as a RAC failover.
+
+    A statement is replayed only while the transaction of the connection holds no changes, so no work is ever lost or
+    applied twice: once a non-idempotent statement ran, errors surface until the transaction is committed or rolled
+    back. The dead connection is dropped from the pool before a new one is acquired.
+    """
+
+    attempts: int = 3
+    """Maximum attempts per statement, the first one included."""
+    backoff: float = 0.05
+    """Seconds to wait before the first retry, doubled for every further retry."""
+    max_backoff: float = 1.0
+    """Upper bound of the wait between two attempts."""
+    deadline: float = 5.0
+    """Seconds after the first attempt past which no retry is started."""
+    is_transient: Callable[[BaseException], bool] = is_transient_error
+    """Tell the errors worth retrying from the others."""
+    is_idempotent: Callable[[str | None], bool] = is_idempotent
+    """Tell the statements that can be replayed from the others."""
+
+    def delay(self, retry: int) -> float:
+        """Return the wait before the ``retry``-th retry, with full jitter so that clients do not retry in lockstep."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (retry - 1)))  # noqa: S311
+
+    def should_retry(self, exc: BaseException, attempt: int, started: float, delay: float) -> bool:
+        """Return ``True`` if the ``attempt``-th attempt of a replayable statement, started at ``started``, is retried.
+
+        Args:
+            exc: The error of the attempt.
+            attempt: The number of the failed attempt, starting at ``1``.
+            started: :func:`time.monotonic` of the first attempt.
+            delay: The wait before the next attempt.
+
+        Returns:
+            Whether to retry.
+        """
+        return attempt < self.attempts and monotonic() - started + delay <= self.deadline and self.is_transient(exc)
+
+
+class _RetryingProxy:
+    __slots__ = ("_settings", "_target")
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._target, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # remembered to be applied again to the replacement of a lost connection or cursor
+        self._settings[name] = value
+        setattr(self._target, name, value)
+
+    def _apply_settings(self) -> None:
+        for name, value in self._settings.items():
+            setattr(self._target, name, value)
+
+
+class _RetryingConnectionBase(_RetryingProxy):
+    __slots__ = ("_dirty", "_policy", "_reconnect")
+
+    def __init__(self, connection: Any, policy: RetryPolicy, reconnect: Callable[[Any], Any]) -> None:
+        object.__setattr__(self, "_target", connection)
+        object.__setattr__(self, "_settings", {})
+        object.__setattr__(self, "_policy", policy)
+        object.__setattr__(self, "_reconnect", reconnect)
+        object.__setattr__(self, "_dirty", False)
+
+    def _replayable(self, statement: str | None) -> bool:
+        return not self._dirty and self._policy.is_idempotent(statement)
+
+    def _ran(self, statement: str | None) -> None:
+        """Mark the transaction as holding changes unless ``statement`` is a plain query."""
+        if not is_cacheable_query(statement):
+            object.__setattr__(self, "_dirty", True)
+
+
+class RetryingCursor(_RetryingProxy):
+    """Proxy for a :class:`Cursor <oracledb.Cursor>` of a :class:`RetryingConnection`.
+
+    ``execute()`` of an idempotent statement is retried, and so is the first fetch of its rows.
+    """
+
+    __slots__ = ("_args", "_connection", "_fetched", "_statement")
+
+    def __init__(self, connection: RetryingConnection, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "_args", (args, kwargs))
+        object.__setattr__(self, "_target", connection._target.cursor(*args, **kwargs))  # noqa: SLF001
+        object.__setattr__(self, "_settings", {})
+        object.__setattr__(self, "_statement", None)
+        object.__setattr__(self, "_fetched", False)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Cursor]:  # type: ignore[override]
+        return Cursor
+
+    def _reopen(self) -> None:
+        args, kwargs = self._args
+        object.__setattr__(self, "_target", self._connection._target.cursor(*args, **kwargs))  # noqa: SLF001
+        self._apply_settings()
+
+    def execute(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self, "_statement", (statement, args, kwargs))
+        object.__setattr__(self, "_fetched", False)
+        connection = self._connection
+        result = connection._call(  # noqa: SLF001
+            lambda: self._target.execute(statement, *args, **kwargs),
+            connection._replayable(statement),  # noqa: SLF001
+            self._reopen,
+        )
+        connection._ran(statement)  # noqa: SLF001
+        return self if result is not None else None
+
+    def executemany(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self._connection, "_dirty", True)
+        return self._target.executemany(statement, *args, **kwargs)
+
+    def callproc(self, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self._connection, "_dirty", True)
+        return self._target.callproc(*args, **kwargs)
+
+    def callfunc(self, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self._connection, "_dirty", True)
+        return self._target.callfunc(*args, **kwargs)
+
+    def _fetch(self, fetch: Callable[[], Any]) -> Any:
+        statement = self._statement
+        if self._fetched or statement is None:
+            return fetch()
+        sql, args, kwargs = statement
+        retried = False
+
+        def attempt() -> Any:
+            nonlocal retried
+            if retried:
+                # the cursor replacing the lost one has to run the statement again before fetching
+                self._target.execute(sql, *args, **kwargs)
+            retried = True
+            return fetch()
+
+        connection = self._connection
+        result = connection._call(attempt, connection._replayable(sql), self._reopen)  # noqa: SLF001
+        object.__setattr__(self, "_fetched", True)
+        return result
+
+    def fetchone(self) -> Any:
+        return self._fetch(lambda: self._target.fetchone())
+
+    def fetchmany(self, *args: Any, **kwargs: Any) -> list[Any]:
+        return self._fetch(lambda: self._target.fetchmany(*args, **kwargs))  # type: ignore[no-any-return]
+
+    def fetchall(self) -> list[Any]:
+        return self._fetch(lambda: self._target.fetchall())  # type: ignore[no-any-return]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._target.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        while (row := self.fetchone()) is not None:
+            yield row
+
+
+class RetryingAsyncCursor(_RetryingProxy):
+    """Proxy for an :class:`AsyncCursor <oracledb.AsyncCursor>` of a :class:`RetryingAsyncConnection`.
+
+    ``execute()`` of an idempotent statement is retried, and so is the first fetch of its rows.
+    """
+
+    __slots__ = ("_args", "_connection", "_fetched", "_statement")
+
+    def __init__(self, connection: RetryingAsyncConnection, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "_args", (args, kwargs))
+        object.__setattr__(self, "_target", connection._target.cursor(*args, **kwargs))  # noqa: SLF001
+        object.__setattr__(self, "_settings", {})
+        object.__setattr__(self, "_statement", None)
+        object.__setattr__(self, "_fetched", False)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncCursor]:  # type: ignore[override]
+        return AsyncCursor
+
+    def _reopen(self) -> None:
+        args, kwargs = self._args
+        object.__setattr__(self, "_target", self._connection._target.cursor(*args, **kwargs))  # noqa: SLF001
+        self._apply_settings()
+
+    async def execute(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self, "_statement", (statement, args, kwargs))
+        object.__setattr__(self, "_fetched", False)
+        connection = self._connection
+        result = await connection._call(  # noqa: SLF001
+            lambda: self._target.execute(statement, *args, **kwargs),
+            connection._replayable(statement),  # noqa: SLF001
+            self._reopen,
+        )
+        connection._ran(statement)  # noqa: SLF001
+        return self if result is not None else None
+
+    async def executemany(self, statement: str | None, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self._connection, "_dirty", True)
+        return await self._target.executemany(statement, *args, **kwargs)
+
+    async def callproc(self, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self._connection, "_dirty", True)
+        return await self._target.callproc(*args, **kwargs)
+
+    async def callfunc(self, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self._connection, "_dirty", True)
+        return await self._target.callfunc(*args, **kwargs)
+
+    async def _fetch(self, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        statement = self._statement
+        if self._fetched or statement is None:
+            return await fetch()
+        sql, args, kwargs = statement
+        retried = False
+
+        async def attempt() -> Any:
+            nonlocal retried
+            if retried:
+                # the cursor replacing the lost one has to run the statement again before fetching
+                await self._target.execute(sql, *args, **kwargs)
+            retried = True
+            return await fetch()
+
+        connection = self._connection
+        result = await connection._call(attempt, connection._replayable(sql), self._reopen)  # noqa: SLF001
+        object.__setattr__(self, "_fetched", True)
+        return result
+
+    async def fetchone(self) -> Any:
+        return await self._fetch(lambda: self._target.fetchone())
+
+    async def fetchmany(self, *args: Any, **kwargs: Any) -> list[Any]:
+        return await self._fetch(lambda: self._target.fetchmany(*args, **kwargs))  # type: ignore[no-any-return]
+
+    async def fetchall(self) -> list[Any]:
+        return await self._fetch(lambda: self._target.fetchall())  # type: ignore[no-any-return]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._target.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._target.close()
+
+    async def __aiter__(self) -> Any:
+        while (row := await self.fetchone()) is not None:
+            yield row
+
+
+class RetryingConnection(_RetryingConnectionBase):
+    """Proxy for a :class:`Connection <oracledb.Connection>` replaying idempotent statements after a transient failure.
+
+    ``reconnect`` receives the lost connection, drops it from the pool and returns a new one. Attributes set on the
+    proxy, such as ``call_timeout`` or ``module``, are set again on the new connection.
+    """
+
+    __slots__ = ()
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Connection]:  # type: ignore[override]
+        return Connection
+
+    def _call(self, call: Callable[[], Any], replayable: bool, reopen: Callable[[], None] | None = None) -> Any:
+        started = monotonic()
+        for attempt in count(1):
+            try:
+                return call()
+            except Exception as exc:
+                delay = self._policy.delay(attempt)
+                if not replayable or self._dirty or not self._policy.should_retry(exc, attempt, started, delay):
+                    raise
+            time.sleep(delay)
+            object.__setattr__(self, "_target", self._reconnect(self._target))
+            self._apply_settings()
+            if reopen is not None:
+                reopen()
+        return None  # pragma: no cover
+
+    def cursor(self, *args: Any, **kwargs: Any) -> RetryingCursor:
+        return RetryingCursor(self, args, kwargs)
+
+    def commit(self) -> None:
+        self._target.commit()
+        object.__setattr__(self, "_dirty", False)
+
+    def rollback(self) -> None:
+        self._target.rollback()
+        object.__setattr__(self, "_dirty", False)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._target.__exit__(*exc_info)
+
+
+class RetryingAsyncConnection(_RetryingConnectionBase):
+    """Proxy for an :class:`AsyncConnection <oracledb.AsyncConnection>` replaying idempotent statements after a
+    transient failure.
+
+    ``reconnect`` receives the lost connection, drops it from the pool and returns a new one. Attributes set on the
+    proxy are set again on the new connection. The ``fetchone``, ``fetchmany`` and ``fetchall`` shortcuts of the
+    connection are retried as well.
+    """
+
+    __slots__ = ()
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[AsyncConnection]:  # type: ignore[override]
+        return AsyncConnection
+
+    async def _call(
+        self, call: Callable[[], Awaitable[Any]], replayable: bool, reopen: Callable[[], None] | None = None
+    ) -> Any:
+        started = monotonic()
+        for attempt in count(1):
+            try:
+                return await call()
+            except Exception as exc:
+                delay = self._policy.delay(attempt)
+                if not replayable or self._dirty or not self._policy.should_retry(exc, attempt, started, delay):
+                    raise
+            await asyncio.sleep(delay)
+            object.__setattr__(self, "_target", await self._reconnect(self._target))
+            self._apply_settings()
+            if reopen is not None:
+                reopen()
+        return None  # pragma: no cover
+
+    def cursor(self, *args: Any, **kwargs: Any) -> RetryingAsyncCursor:
+        return RetryingAsyncCursor(self, args, kwargs)
+
+    async def _run(self, operation: str, statement: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        result = await self._call(
+            lambda: getattr(self._target, operation)(statement, *args, **kwargs), self._replayable(statement)
+        )
+        self._ran(statement)
+        return result
+
+    async def fetchone(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchone", statement, args, kwargs)
+
+    async def fetchmany(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchmany", statement, args, kwargs)
+
+    async def fetchall(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("fetchall", statement, args, kwargs)
+
+    async def execute(self, statement: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run("execute", statement, args, kwargs)
+
+    async def executemany(self, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self, "_dirty", True)
+        return await self._target.executemany(*args, **kwargs)
+
+    async def callproc(self, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self, "_dirty", True)
+        return await self._target.callproc(*args, **kwargs)
+
+    async def callfunc(self, *args: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self, "_dirty", True)
+        return await self._target.callfunc(*args, **kwargs)
+
+    async def commit(self) -> None:
+        await self._target.commit()
+        object.__setattr__(self, "_dirty", False)
+
+    async def rollback(self) -> None:
+        await self._target.rollback()
+        object.__setattr__(self, "_dirty", False)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._target.__aexit__(*exc_info)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+__all__ = (
+    "PoolResize",
+    "PoolSizer",
+)
+
+
+class PoolResize(NamedTuple):
+    """A decision of :class:`PoolSizer` to change the maximum size of a pool."""
+
+    old_size: int
+    new_size: int
+    reason: str
+    """``"wait"`` or ``"busy"`` when growing, ``"idle"`` when shrinking."""
+
+
+@dataclass
+class PoolSizer:
+    """Grow or shrink the maximum size of a pool from the load observed every ``interval`` seconds.
+
+    The pool grows by ``step`` when connections are slow to acquire or nearly all of them are busy, and shrinks by
+    ``step`` when few of them are busy. A signal must persist for ``stable_intervals`` intervals before the pool is
+    resized, and nothing changes for ``cooldown_intervals`` intervals after a resize. While acquire errors exceed
+    ``max_error_rate`` the size is held, as the database rather than the pool is likely at fault.
+    """
+
+    min_size: int = 2
+    """Lowest maximum size the pool is shrunk to."""
+    max_size: int = 32
+    """Highest maximum size the pool is grown to."""
+    step: int = 2
+    """Connections added or removed per resize."""
+    interval: float = 5.0
+    """Seconds between two decisions."""
+    wait_threshold: float = 0.05
+    """Grow when the 90th percentile of acquire waits exceeds this many seconds."""
+    grow_busy_ratio: float = 0.9
+    """Grow when at least this fraction of the pool is checked out."""
+    shrink_busy_ratio: float = 0.3
+    """Shrink when at most this fraction of the pool is checked out and acquiring does not wait."""
+    max_error_rate: float = 0.2
+    """Hold the size while more than this fraction of acquires fail."""
+    stable_intervals: int = 3
+    """Consecutive intervals a signal must persist before resizing."""
+    cooldown_intervals: int = 2
+    """Intervals to wait after a resize before deciding again."""
+    _waits: list[float] = field(init=False, default_factory=list)
+    _errors: int = field(init=False, default=0)
+    _trend: int = field(init=False, default=0)
+    _streak: int = field(init=False, default=0)
+    _cooldown: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.min_size <= self.max_size:
+            msg = f"Expected 0 < min_size <= max_size, got {self.min_size} and {self.max_size}"
+            raise ValueError(msg)
+        if self.shrink_busy_ratio >= self.grow_busy_ratio:
+            msg = "'shrink_busy_ratio' must be lower than 'grow_busy_ratio'"
+            raise ValueError(msg)
+
+    def observe_acquire(self, seconds: float) -> None:
+        """Record the time a request waited for a connection."""
+        self._waits.append(seconds)
+
+    def observe_error(self) -> None:
+        """Record a failed acquire."""
+        self._errors += 1
+
+    def decide(self, busy: int, size: int) -> PoolResize | None:
+        """Consume the observations of the last interval and return the resize to apply, if any.
+
+        Args:
+            busy: Connections currently checked out.
+            size: Current maximum size of the pool.
+
+        Returns:
+            The resize, or ``None`` to keep the current size.
+        """
+        waits, errors = sorted(self._waits), self._errors
+        self._waits, self._errors = [], 0
+        attempts = len(waits) + errors
+        slow = bool(waits) and waits[min(int(len(waits) * 0.9), len(waits) - 1)] > self.wait_threshold
+        busy_ratio = busy / size if size else 1.0
+        signal, reason = 0, ""
+        if attempts and errors / attempts > self.max_error_rate:
+            reason = "errors"
+        elif slow:
+            signal, reason = 1, "wait"
+        elif busy_ratio >= self.grow_busy_ratio:
+            signal, reason = 1, "busy"
+        elif busy_ratio <= self.shrink_busy_ratio:
+            signal, reason = -1, "idle"
+        self._streak = self._streak + 1 if signal == self._trend else 1
+        self._trend = signal
+        if self._cooldown:
+            self._cooldown -= 1
+            return None
+        if not signal or self._streak < self.stable_intervals:
+            return None
+        new_size = min(max(size + signal * self.step, self.min_size), self.max_size)
+        if new_size == size:
+            return None
+        self._streak = 0
+        self._cooldown = self.cooldown_intervals
+        return PoolResize(size, new_size, reason)
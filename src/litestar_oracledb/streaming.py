@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import csv
+import io
+from typing import TYPE_CHECKING, Literal
+
+from litestar.serialization import encode_json
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Sequence
+    from typing import Any
+
+    from oracledb.connection import AsyncConnection
+
+__all__ = (
+    "MEDIA_TYPES",
+    "RowEncoder",
+    "StreamFormat",
+    "stream_rows",
+)
+
+StreamFormat = Literal["ndjson", "csv", "json"]
+"""Serialization of a streamed result set: one JSON object per line, CSV with a header row, or a JSON array."""
+
+MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "json": "application/json",
+}
+
+
+class RowEncoder:
+    """Serialize batches of rows incrementally.
+
+    ``start``, every ``encode`` and ``end`` return one chunk of the response body; concatenated they form a valid
+    document of the requested format.
+    """
+
+    __slots__ = ("_columns", "_first", "_format")
+
+    def __init__(self, stream_format: StreamFormat, columns: Sequence[str]) -> None:
+        """Initialize ``RowEncoder``.
+
+        Args:
+            stream_format: The output format.
+            columns: The column names, used as JSON keys and CSV header.
+        """
+        if stream_format not in MEDIA_TYPES:
+            msg = f"Unsupported stream format {stream_format!r}, expected one of {', '.join(MEDIA_TYPES)}"
+            raise ValueError(msg)
+        self._format = stream_format
+        self._columns = tuple(columns)
+        self._first = True
+
+    def start(self) -> bytes:
+        if self._format == "json":
+            return b"["
+        if self._format == "csv":
+            return self._csv([self._columns])
+        return b""
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Serialize a batch of rows.
+
+        Args:
+            rows: The rows, as returned by ``fetchmany``.
+
+        Returns:
+            The serialized batch.
+        """
+        if not rows:
+            return b""
+        if self._format == "csv":
+            return self._csv(rows)
+        columns = self._columns
+        encoded = [encode_json(dict(zip(columns, row))) for row in rows]
+        if self._format == "ndjson":
+            return b"\n".join(encoded) + b"\n"
+        chunk = b",".join(encoded)
+        if self._first:
+            self._first = False
+            return chunk
+        return b"," + chunk
+
+    def end(self) -> bytes:
+        return b"]" if self._format == "json" else b""
+
+    @staticmethod
+    def _csv(rows: Sequence[Sequence[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode()
+
+
+async def stream_rows(
+    connection: AsyncConnection,
+    sql: str,
+    parameters: list[Any] | tuple[Any, ...] | dict[str, Any] | None = None,
+    stream_format: StreamFormat = "ndjson",
+    arraysize: int = 1000,
+) -> AsyncGenerator[bytes, None]:
+    """Execute ``sql`` and yield its result set serialized in ``arraysize`` batches.
+
+    Only one batch is held in memory at a time; the next one is fetched when the consumer asks for more, so a slow
+    client slows down the fetches instead of buffering rows.
+
+    Args:
+        connection: The connection to run the query on.
+        sql: The query.
+        parameters: Bind variables of the query.
+        stream_format: The output format.
+        arraysize: Rows fetched per round trip.
+
+    Yields:
+        Chunks of the serialized result set.
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = arraysize
+        await cursor.execute(sql, parameters)
+        columns = [column[0] for column in cursor.description or ()]
+        encoder = RowEncoder(stream_format, columns)
+        yield encoder.start()
+        while rows := await cursor.fetchmany(arraysize):
+            yield encoder.encode(rows)
+        yield encoder.end()
+    finally:
+        cursor.close()
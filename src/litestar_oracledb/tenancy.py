@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Mapping
+
+from litestar.exceptions import ImproperlyConfiguredException, ServiceUnavailableException
+from litestar.types import Empty
+
+from litestar_oracledb.limits import ConnectionLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from litestar.types import Scope
+
+    from litestar_oracledb.config._common import GenericOraclePoolConfig
+
+__all__ = ("TenantRouting",)
+
+
+@dataclass
+class _TenantLimiter(ConnectionLimiter):
+    """A :class:`ConnectionLimiter` with a semaphore per tenant instead of per route."""
+
+    routing: TenantRouting | None = None
+
+    def _tenant(self, scope: Scope) -> str | None:
+        return self.routing.tenant_of(scope) if self.routing is not None else None
+
+    def limit_of(self, scope: Scope) -> int | None:
+        if (tenant := self._tenant(scope)) is None:
+            return None
+        return self.route_limits.get(tenant, self.max_connections)
+
+    def route_key(self, scope: Scope) -> str:
+        return self._tenant(scope) or "*"
+
+    def unavailable(self, route: str) -> ServiceUnavailableException:
+        return ServiceUnavailableException(
+            detail=f"Too many requests waiting for a database connection for tenant {route}",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+
+@dataclass
+class TenantRouting:
+    """Route the connections of a multi-tenant application by tenant, reusing the sessions set up for each tenant.
+
+    The tenant of a request is resolved from ``resolver``, then the ``header``, the ``path_param`` or the
+    ``auth_attribute`` of the authenticated user. Its connection is acquired with the tag ``tag_format`` and
+    ``matchanytag``, and as ``proxy_user`` if set. A free session already set up for the tenant is reused as is;
+    otherwise ``set_context`` sets up the session handed out (application context of VPD policies,
+    ``CURRENT_SCHEMA``...) and tags it, so the next request of the tenant skips it. The config checks the tag of every
+    acquired connection rather than relying on the ``session_callback`` of the pool, as python-oracledb ignores tags in
+    Thin mode and a session must never keep the context of another tenant. Requests without a tenant get an untagged
+    connection, cleared by ``set_context`` if the session was set up for a tenant.
+
+    Each tenant holds or waits for at most ``max_connections`` connections, overridden by its ``tenant_limits`` entry,
+    so that a busy tenant cannot starve the others; requests over the quota fail after ``max_wait`` seconds with
+    ``503 Service Unavailable``.
+    """
+
+    header: str | None = None
+    """Request header carrying the tenant, e.g. ``"X-Tenant-ID"``."""
+    path_param: str | None = None
+    """Path parameter carrying the tenant, e.g. ``"tenant_id"`` for ``/tenants/{tenant_id:str}/orders``."""
+    auth_attribute: str | None = None
+    """Attribute, or key, of the authenticated ``request.user`` carrying the tenant."""
+    resolver: Callable[[Scope], str | None] | None = None
+    """Return the tenant of a request from its scope, tried before the other sources."""
+    tag_format: str = "TENANT={tenant}"
+    """Tag of the sessions set up for a tenant."""
+    proxy_user: str | None = None
+    """User the connections of a tenant are acquired as, e.g. ``"app_proxy[{tenant}]"`` for a proxy connection to the
+    schema of the tenant. Requires a heterogeneous pool; ``homogeneous`` is disabled on ``pool_config`` unless set."""
+    set_context: Callable[[Any, str | None], Any] | None = None
+    """Set up a session for a tenant, receiving the connection and the tenant, or ``None`` to clear the context.
+    Awaited with the async config. Only called when the session is not set up for the tenant yet."""
+    max_connections: int | None = None
+    """Connections a tenant holds or waits for at once. Tenants are not limited if ``None``."""
+    tenant_limits: Mapping[str, int] = field(default_factory=dict)
+    """Connections of specific tenants, keyed by tenant."""
+    max_wait: float | None = None
+    """Seconds to wait for a slot of the tenant quota. Waits forever if ``None``."""
+    retry_after: int = 1
+    """Value of the ``Retry-After`` header of rejected requests, in seconds."""
+    quota: ConnectionLimiter | None = field(init=False, default=None)
+    """The semaphores of the tenant quotas, ``None`` if no tenant is limited."""
+
+    def __post_init__(self) -> None:
+        if "{tenant}" not in self.tag_format:
+            msg = f"'tag_format' must contain '{{tenant}}', got {self.tag_format!r}."
+            raise ImproperlyConfiguredException(msg)
+        if self.max_connections is not None or self.tenant_limits:
+            self.quota = _TenantLimiter(
+                max_connections=self.max_connections,
+                route_limits=self.tenant_limits,
+                max_wait=self.max_wait,
+                retry_after=self.retry_after,
+                routing=self,
+            )
+
+    def configure(self, pool_config: GenericOraclePoolConfig[Any, Any]) -> None:
+        """Make ``pool_config`` create a heterogeneous pool when connections are acquired as ``proxy_user``.
+
+        Args:
+            pool_config: The pool configuration.
+
+        Raises:
+            ImproperlyConfiguredException: If the pool is homogeneous.
+        """
+        if self.proxy_user is None:
+            return
+        if pool_config.homogeneous is Empty:
+            pool_config.homogeneous = False
+        elif pool_config.homogeneous:
+            msg = "'proxy_user' acquires connections as another user, which requires 'homogeneous=False'."
+            raise ImproperlyConfiguredException(msg)
+
+    def tenant_of(self, scope: Scope) -> str | None:
+        """Return the tenant of the request of ``scope``.
+
+        Args:
+            scope: The current connection's scope.
+
+        Returns:
+            The tenant, or ``None`` if none of the sources carries one.
+        """
+        if self.resolver is not None and (tenant := self.resolver(scope)):
+            return tenant
+        if self.header is not None:
+            name = self.header.lower().encode("latin-1")
+            for key, value in scope.get("headers", ()):
+                if key.lower() == name and value:
+                    return value.decode("latin-1")
+        if self.path_param is not None and (tenant := scope.get("path_params", {}).get(self.path_param)):
+            return str(tenant)
+        if self.auth_attribute is not None and (user := scope.get("user")) is not None:
+            tenant = (
+                user.get(self.auth_attribute) if isinstance(user, Mapping) else getattr(user, self.auth_attribute, None)
+            )
+            if tenant:
+                return str(tenant)
+        return None
+
+    def tag_of(self, tenant: str) -> str:
+        """Return the tag of the sessions set up for ``tenant``."""
+        return self.tag_format.format(tenant=tenant)
+
+    def acquire_kwargs(self, scope: Scope | None) -> dict[str, Any]:
+        """Return the keyword arguments of ``pool.acquire()`` for a connection of ``scope``."""
+        if scope is None or (tenant := self.tenant_of(scope)) is None:
+            return {}
+        kwargs: dict[str, Any] = {"tag": self.tag_of(tenant), "matchanytag": True}
+        if self.proxy_user is not None:
+            kwargs["user"] = self.proxy_user.format(tenant=tenant)
+        return kwargs
+
+    def prepare(self, connection: Any, scope: Scope) -> Any:
+        """Set up ``connection`` for the tenant of ``scope`` with ``set_context``, unless its tag shows it already is.
+
+        A session of a tenant handed to a request without a tenant is cleared with ``set_context(connection, None)``.
+        The connection is tagged before ``set_context`` runs, so it must be dropped from the pool if that fails.
+
+        Args:
+            connection: The connection acquired for ``scope``.
+            scope: The current connection's scope.
+
+        Returns:
+            The return value of ``set_context``, to be awaited by the async config, or ``None`` if nothing was set up.
+        """
+        if self.set_context is None:
+            return None
+        tenant = self.tenant_of(scope)
+        tag = self.tag_of(tenant) if tenant is not None else None
+        if (getattr(connection, "tag", None) or None) == tag:
+            return None
+        connection.tag = tag or ""
+        return self.set_context(connection, tenant)
@@ -0,0 +1,938 @@
+"""In-process stand-ins for python-oracledb pools and connections.
+
+The fakes implement the parts of the python-oracledb API the plugin relies on and can be passed as the
+``pool_instance`` of a config, so that plugin wiring, transaction handling and pool pressure can be tested without a
+database::
+
+    pool = FakeAsyncConnectionPool(max=2, getmode=oracledb.POOL_GETMODE_TIMEDWAIT, wait_timeout=100)
+    pool.script("select name from users where id = :id", [("Ada",)], columns=("NAME",))
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), before_send_handler="autocommit")
+    ...
+    assert pool.count("commit") == 1
+
+Statements return the rows scripted for them, or no rows. Every round trip sleeps for ``latency`` and opening a
+session for ``connect_latency``. Acquires wait for a free session once ``max`` sessions are busy, following
+``getmode`` and ``wait_timeout`` like a real pool. Calls are recorded in :attr:`calls <FakeConnectionPool.calls>`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Union, cast
+
+import oracledb
+from oracledb import AsyncConnection, AsyncConnectionPool, AsyncCursor, Connection, ConnectionPool, Cursor
+
+from litestar_oracledb.breaker import is_connection_error
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import AsyncIterator, Iterator, Sequence
+
+    from typing_extensions import Self
+
+__all__ = (
+    "Call",
+    "FakeAsyncConnection",
+    "FakeAsyncConnectionPool",
+    "FakeAsyncCursor",
+    "FakeConnection",
+    "FakeConnectionPool",
+    "FakeCursor",
+    "oracle_error",
+)
+
+Rows = Union["Sequence[Any]", Callable[[Any], "Sequence[Any]"]]
+"""Rows of a scripted statement, or a callable returning them from the bind parameters."""
+
+_QUERY_PREFIXES = ("select", "with")
+_session_ids = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class _ErrorInfo:
+    """The error object python-oracledb passes as the first argument of its exceptions."""
+
+    full_code: str
+    message: str
+    code: int = 0
+    offset: int = 0
+    context: str | None = None
+    isrecoverable: bool = False
+    iswarning: bool = False
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def oracle_error(
+    full_code: str, message: str | None = None, exc_type: type[oracledb.Error] | None = None
+) -> oracledb.Error:
+    """Return an exception like the ones python-oracledb raises for ``full_code``.
+
+    Args:
+        full_code: The error code, such as ``"ORA-00001"`` or ``"DPY-6005"``.
+        message: The error message, defaults to the code.
+        exc_type: The exception class, by default :class:`OperationalError <oracledb.OperationalError>` for
+            connection errors and :class:`DatabaseError <oracledb.DatabaseError>` otherwise.
+
+    Returns:
+        The exception, with ``args[0].full_code`` set.
+    """
+    info = _ErrorInfo(
+        full_code=full_code,
+        message=f"{full_code}: {message}" if message else full_code,
+        code=int(full_code.rpartition("-")[2] or 0) if full_code.startswith("ORA-") else 0,
+    )
+    if exc_type is None:
+        exc_type = oracledb.DatabaseError
+        if is_connection_error(exc_type(info)):
+            exc_type = oracledb.OperationalError
+    return exc_type(info)
+
+
+@dataclass(frozen=True)
+class Call:
+    """A call recorded by a fake pool."""
+
+    name: str
+    """``acquire``, ``release``, ``drop``, ``close``, ``commit``, ``rollback``, ``ping``, ``execute``,
+    ``executemany``, ``callproc``, ``callfunc`` or ``session_callback``."""
+    session: int
+    """Identifier of the session the call ran on, stable across acquires of the same pooled session."""
+    statement: str | None = None
+    """The statement or procedure name, for the calls running one."""
+    parameters: Any = None
+    """The bind parameters, or the arguments of ``acquire``."""
+
+
+@dataclass
+class _Script:
+    pattern: str | re.Pattern[str]
+    rows: Rows
+    columns: tuple[str, ...]
+    rowcount: int | None
+    error: BaseException | None
+    remaining: int | None
+    latency: float | None
+
+    def matches(self, statement: str) -> bool:
+        if isinstance(self.pattern, str):
+            return self.pattern == statement
+        return self.pattern.search(statement) is not None
+
+
+@dataclass
+class _Session:
+    id: int
+    user: str | None
+    attributes: dict[str, Any]
+    tag: str | None = None
+    error: BaseException | None = None
+
+
+def _sleep(seconds: float) -> None:
+    if seconds > 0:
+        time.sleep(seconds)
+
+
+async def _asleep(seconds: float) -> None:
+    if seconds > 0:
+        await asyncio.sleep(seconds)
+
+
+def _normalize(statement: str) -> str:
+    return " ".join(statement.split()).rstrip(";")
+
+
+@dataclass
+class _Result:
+    rows: list[Any]
+    description: list[tuple[Any, ...]] | None
+    rowcount: int
+
+
+class _FakePoolBase:
+    """State shared by the sync and async fake pools: sessions, scripts, injected failures and recorded calls."""
+
+    _spec: type = ConnectionPool
+
+    def __init__(
+        self,
+        min: int = 0,  # noqa: A002
+        max: int = 4,  # noqa: A002
+        increment: int = 1,
+        getmode: int = oracledb.POOL_GETMODE_WAIT,
+        wait_timeout: int = 0,
+        latency: float = 0.0,
+        connect_latency: float = 0.0,
+        stmtcachesize: int = 20,
+        version: str = "19.0.0.0.0",
+        user: str | None = "fake",
+        session_callback: Callable[..., Any] | None = None,
+        record_calls: bool = True,
+        dsn: str = "fake",
+    ) -> None:
+        """Initialize the pool, opening ``min`` sessions.
+
+        Args:
+            min: Sessions opened with the pool, and kept open when dropping connections.
+            max: Sessions the pool opens at most; further acquires wait for a release.
+            increment: Kept for parity with python-oracledb, sessions are opened one at a time.
+            getmode: ``POOL_GETMODE_WAIT`` waits for a free session, ``POOL_GETMODE_NOWAIT`` fails right away and
+                ``POOL_GETMODE_TIMEDWAIT`` waits for ``wait_timeout`` milliseconds. ``POOL_GETMODE_FORCEGET`` opens
+                sessions beyond ``max``.
+            wait_timeout: Milliseconds an acquire waits with ``POOL_GETMODE_TIMEDWAIT``.
+            latency: Seconds every round trip takes.
+            connect_latency: Seconds opening a session takes.
+            stmtcachesize: Initial statement cache size of the sessions.
+            version: Database version reported by the connections.
+            user: User of the sessions acquired without one.
+            session_callback: Called with the connection and the requested tag when a session is used for the first
+                time or its tag differs from the requested one.
+            record_calls: Record calls in :attr:`calls`, disable to keep memory flat in benchmarks.
+            dsn: DSN reported by the pool, e.g. ``dbhost/orclpdb:pooled`` to test DRCP settings.
+        """
+        if not 0 <= min <= max:
+            msg = f"Expected 0 <= min <= max, got {min} and {max}"
+            raise ValueError(msg)
+        self.min = min
+        self.max = max
+        self.increment = increment
+        self.getmode = getmode
+        self.wait_timeout = wait_timeout
+        self.timeout = 0
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.stmtcachesize = stmtcachesize
+        self.version = version
+        self.username = user
+        self.session_callback = session_callback
+        self.record_calls = record_calls
+        self.calls: list[Call] = []
+        """Calls made on the pool and its connections, in order."""
+        self.peak_busy = 0
+        """Highest number of sessions checked out at once."""
+        self.dsn = dsn
+        self.homogeneous = True
+        self.thin = True
+        self._sessions: dict[int, _Session] = {}
+        self._idle: list[_Session] = []
+        self._busy = 0
+        self._open = True
+        self._scripts: list[_Script] = []
+        self._acquire_failures: list[BaseException] = []
+        self._acquire_error: BaseException | None = None
+        self._condition = threading.Condition()
+        for _ in range(min):
+            self._idle.append(self._new_session(user))
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        return self._spec
+
+    @property
+    def busy(self) -> int:
+        """Sessions checked out."""
+        return self._busy
+
+    @property
+    def opened(self) -> int:
+        """Sessions open, idle or busy."""
+        return len(self._sessions)
+
+    def script(
+        self,
+        statement: str | re.Pattern[str],
+        rows: Rows = (),
+        *,
+        columns: Sequence[str] = (),
+        rowcount: int | None = None,
+        error: BaseException | None = None,
+        times: int | None = None,
+        latency: float | None = None,
+    ) -> None:
+        """Script the outcome of a statement. The most recent script matching a statement wins.
+
+        Args:
+            statement: The statement, compared with whitespace collapsed, or a pattern searched in it.
+            rows: The rows returned by queries, or a callable returning them from the bind parameters.
+            columns: Column names of the result set, defaulting to ``COLUMN_1``, ``COLUMN_2``...
+            rowcount: Rows affected by DML, defaulting to the number of rows of parameters.
+            error: Raise this error instead, see :func:`oracle_error`.
+            times: Apply the script this many times, then fall back to earlier ones.
+            latency: Seconds the statement takes instead of ``latency``.
+        """
+        pattern = _normalize(statement) if isinstance(statement, str) else statement
+        self._scripts.append(_Script(pattern, rows, tuple(columns), rowcount, error, times, latency))
+
+    def fail_acquire(self, error: BaseException | None = None, times: int | None = 1) -> None:
+        """Make acquires fail.
+
+        Args:
+            error: The error, by default ``DPY-6005`` (cannot connect to the database).
+            times: Acquires to fail, or ``None`` to fail all of them until :meth:`recover` is called.
+        """
+        error = error or oracle_error("DPY-6005", "cannot connect to database")
+        if times is None:
+            self._acquire_error = error
+        else:
+            self._acquire_failures.extend([error] * times)
+
+    def recover(self) -> None:
+        """Clear the acquire failures injected by :meth:`fail_acquire`."""
+        with self._condition:
+            self._acquire_failures.clear()
+            self._acquire_error = None
+
+    def disconnect(self, error: BaseException | None = None) -> None:
+        """Cut every open session: later calls on their connections raise ``error``.
+
+        Idle sessions that were cut are replaced on acquire, as python-oracledb does after pinging them.
+
+        Args:
+            error: The error, by default ``DPY-4011`` (the database or network closed the connection).
+        """
+        error = error or oracle_error("DPY-4011", "the database or network closed the connection")
+        with self._condition:
+            for session in self._sessions.values():
+                session.error = error
+
+    def count(self, name: str) -> int:
+        """Return the number of recorded calls named ``name``."""
+        return sum(call.name == name for call in self.calls)
+
+    def _record(self, name: str, session: _Session, statement: str | None = None, parameters: Any = None) -> None:
+        if self.record_calls:
+            self.calls.append(Call(name, session.id, statement, parameters))
+
+    def _new_session(self, user: str | None) -> _Session:
+        session = _Session(
+            id=next(_session_ids),
+            user=user,
+            attributes={
+                "action": None,
+                "autocommit": False,
+                "call_timeout": 0,
+                "client_identifier": None,
+                "clientinfo": None,
+                "current_schema": None,
+                "dbop": None,
+                "module": None,
+                "stmtcachesize": self.stmtcachesize,
+            },
+        )
+        self._sessions[session.id] = session
+        return session
+
+    def _close_session(self, session: _Session) -> None:
+        self._sessions.pop(session.id, None)
+
+    def _check_acquire(self) -> None:
+        if not self._open:
+            error = oracle_error("DPY-1002", "connection pool is not open", oracledb.InterfaceError)
+            raise error
+        if self._acquire_failures:
+            raise self._acquire_failures.pop(0)
+        if self._acquire_error is not None:
+            raise self._acquire_error
+
+    def _checkout(self, user: str | None, tag: str | None, matchanytag: bool) -> tuple[_Session, bool] | None:
+        """Pick a session for an acquire, as python-oracledb does, or return ``None`` to wait for one.
+
+        Must be called holding ``_condition``. Returns the session and whether it was opened for the acquire.
+        """
+        user = user or self.username
+        for dead in [session for session in self._idle if session.error is not None]:
+            self._idle.remove(dead)
+            self._close_session(dead)
+        full = len(self._sessions) >= self.max and self.getmode != oracledb.POOL_GETMODE_FORCEGET
+        session = self._pick_idle(user, tag, matchanytag or full)
+        new = False
+        if session is not None:
+            self._idle.remove(session)
+        elif not full:
+            session, new = self._new_session(user), True
+        elif self._idle:
+            # every idle session belongs to another user: close one to make room
+            self._close_session(self._idle.pop(0))
+            session, new = self._new_session(user), True
+        else:
+            return None
+        self._busy += 1
+        self.peak_busy = max(self.peak_busy, self._busy)
+        return session, new
+
+    def _pick_idle(self, user: str | None, tag: str | None, anytag: bool) -> _Session | None:
+        """Return the idle session of ``user`` tagged with ``tag``, or with ``anytag`` one to retag, preferring
+        untagged sessions.
+        """
+        idle = [session for session in self._idle if session.user == user]
+        session = next((session for session in idle if session.tag == tag), None)
+        if session is None and (tag is None or anytag) and idle:
+            session = next((session for session in idle if session.tag is None), idle[0])
+        return session
+
+    def _wait_seconds(self) -> float | None:
+        """Return how long an acquire waits for a session, ``None`` for as long as it takes."""
+        if self.getmode == oracledb.POOL_GETMODE_NOWAIT:
+            return 0.0
+        if self.getmode == oracledb.POOL_GETMODE_TIMEDWAIT:
+            return self.wait_timeout / 1000
+        return None
+
+    def _acquire_timeout(self) -> oracledb.Error:
+        return oracle_error("DPY-4005", "timed out waiting for the connection pool to return a connection")
+
+    def _needs_callback(self, session: _Session, new: bool, tag: str | None) -> bool:
+        return self.session_callback is not None and (new or (tag is not None and session.tag != tag))
+
+    def _checkin(self, session: _Session, tag: str | None = None, drop: bool = False) -> None:
+        """Return a session to the pool, closing it if it was dropped or cut. Must be called holding ``_condition``."""
+        self._busy -= 1
+        if tag is not None:
+            session.tag = tag or None
+        if drop or session.error is not None or not self._open:
+            self._close_session(session)
+        else:
+            self._idle.append(session)
+
+    def _run(self, session: _Session, name: str, statement: str | None = None, parameters: Any = None) -> float:
+        """Record a round trip and return how long it takes, raising the error of a cut session."""
+        self._record(name, session, statement, parameters)
+        if session.error is not None:
+            raise session.error
+        return self.latency
+
+    def _statement(self, session: _Session, name: str, statement: str, parameters: Any) -> tuple[_Result, float]:
+        """Run ``statement`` against the scripts, returning its result and latency."""
+        latency = self._run(session, name, statement, parameters)
+        text = _normalize(statement)
+        script = next((s for s in reversed(self._scripts) if s.remaining != 0 and s.matches(text)), None)
+        if script is None:
+            script = _Script(text, (), (), None, None, None, None)
+        if script.remaining is not None:
+            script.remaining -= 1
+        if script.latency is not None:
+            latency = script.latency
+        if script.error is not None:
+            raise script.error
+        rows = list(script.rows(parameters) if callable(script.rows) else script.rows)
+        if name == "execute" and (rows or script.columns or text.lower().startswith(_QUERY_PREFIXES)):
+            width = len(script.columns) or (len(rows[0]) if rows and isinstance(rows[0], tuple) else 1)
+            columns = script.columns or tuple(f"COLUMN_{position}" for position in range(1, width + 1))
+            description = [(column, None, None, None, None, None, True) for column in columns]
+            return _Result(rows, description, 0), latency
+        if script.rowcount is not None:
+            rowcount = script.rowcount
+        elif name == "executemany":
+            rowcount = parameters if isinstance(parameters, int) else len(parameters or ())
+        else:
+            rowcount = 0
+        return _Result([], None, rowcount), latency
+
+
+class _FakeCursorBase:
+    _spec: type = Cursor
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.rowfactory: Callable[..., Any] | None = None
+        self.statement: str | None = None
+        self.rowcount = 0
+        self.description: list[tuple[Any, ...]] | None = None
+        self._rows: list[Any] = []
+        self._batch_errors: list[Any] = []
+        self._closed = False
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        return self._spec
+
+    def _session(self) -> _Session:
+        if self._closed:
+            error = oracle_error("DPY-1006", "cursor is not open", oracledb.InterfaceError)
+            raise error
+        return self.connection._session()  # noqa: SLF001
+
+    def _execute(self, name: str, statement: str, parameters: Any) -> float:
+        session = self._session()
+        self.statement = statement
+        result, latency = self.connection._pool._statement(session, name, statement, parameters)  # noqa: SLF001
+        self._rows, self.description, self.rowcount = result.rows, result.description, result.rowcount
+        return latency
+
+    def _fetch(self, size: int | None) -> list[Any]:
+        self._session()
+        rows, self._rows = (self._rows, []) if size is None else (self._rows[:size], self._rows[size:])
+        self.rowcount += len(rows)
+        if self.rowfactory is not None:
+            rows = [self.rowfactory(*row) for row in rows]
+        return rows
+
+    def getbatcherrors(self) -> list[Any]:
+        return self._batch_errors
+
+    def setinputsizes(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def setoutputsizes(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        self._closed = True
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class FakeCursor(_FakeCursorBase):
+    """A :class:`Cursor <oracledb.Cursor>` of a :class:`FakeConnection`."""
+
+    def execute(self, statement: str, parameters: Any = None, **keyword_parameters: Any) -> FakeCursor | None:
+        _sleep(self._execute("execute", statement, parameters or keyword_parameters or None))
+        return self if self.description is not None else None
+
+    def executemany(self, statement: str, parameters: Any, batcherrors: bool = False, **kwargs: Any) -> None:
+        _sleep(self._execute("executemany", statement, parameters))
+
+    def callproc(self, name: str, parameters: Sequence[Any] = (), keyword_parameters: Any = None) -> list[Any]:
+        _sleep(self._execute("callproc", name, parameters or keyword_parameters))
+        return list(parameters)
+
+    def callfunc(
+        self, name: str, return_type: Any, parameters: Sequence[Any] = (), keyword_parameters: Any = None
+    ) -> Any:
+        _sleep(self._execute("callfunc", name, parameters or keyword_parameters))
+        return self._rows[0][0] if self._rows else None
+
+    def fetchone(self) -> Any:
+        rows = self._fetch(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        return self._fetch(size or self.arraysize)
+
+    def fetchall(self) -> list[Any]:
+        return self._fetch(None)
+
+    def __iter__(self) -> Iterator[Any]:
+        while (row := self.fetchone()) is not None:
+            yield row
+
+
+class FakeAsyncCursor(_FakeCursorBase):
+    """An :class:`AsyncCursor <oracledb.AsyncCursor>` of a :class:`FakeAsyncConnection`."""
+
+    _spec = AsyncCursor
+
+    async def execute(self, statement: str, parameters: Any = None, **keyword_parameters: Any) -> None:
+        await _asleep(self._execute("execute", statement, parameters or keyword_parameters or None))
+
+    async def executemany(self, statement: str, parameters: Any, batcherrors: bool = False, **kwargs: Any) -> None:
+        await _asleep(self._execute("executemany", statement, parameters))
+
+    async def callproc(self, name: str, parameters: Sequence[Any] = (), keyword_parameters: Any = None) -> list[Any]:
+        await _asleep(self._execute("callproc", name, parameters or keyword_parameters))
+        return list(parameters)
+
+    async def callfunc(
+        self, name: str, return_type: Any, parameters: Sequence[Any] = (), keyword_parameters: Any = None
+    ) -> Any:
+        await _asleep(self._execute("callfunc", name, parameters or keyword_parameters))
+        return self._rows[0][0] if self._rows else None
+
+    async def fetchone(self) -> Any:
+        rows = self._fetch(1)
+        return rows[0] if rows else None
+
+    async def fetchmany(self, size: int | None = None) -> list[Any]:
+        return self._fetch(size or self.arraysize)
+
+    async def fetchall(self) -> list[Any]:
+        return self._fetch(None)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        while (row := await self.fetchone()) is not None:
+            yield row
+
+
+class _FakeConnectionBase:
+    """A checked out session. Attributes such as ``module`` or ``stmtcachesize`` are kept by the session, so they
+    carry over to the next acquire of it like on a real pooled connection.
+    """
+
+    _spec: type = Connection
+    _cursor_class: type[_FakeCursorBase] = FakeCursor
+
+    def __init__(self, pool: Any, session: _Session) -> None:
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_impl", session)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        return self._spec
+
+    @property
+    def session_id(self) -> int:
+        """Identifier of the pooled session, as recorded in :attr:`Call.session`."""
+        return self._session().id
+
+    @property
+    def tag(self) -> str | None:
+        return self._session().tag
+
+    @tag.setter
+    def tag(self, value: str | None) -> None:
+        self._session().tag = value
+
+    @property
+    def username(self) -> str | None:
+        return self._session().user
+
+    @property
+    def version(self) -> str:
+        return str(self._pool.version)
+
+    @property
+    def thin(self) -> bool:
+        return True
+
+    def _session(self) -> _Session:
+        session: _Session | None = self._impl
+        if session is None:
+            error = oracle_error("DPY-1001", "not connected to database", oracledb.InterfaceError)
+            raise error
+        return session
+
+    def cursor(self, scrollable: bool = False) -> Any:
+        self._session()
+        return self._cursor_class(self)  # type: ignore[arg-type]
+
+    def disconnect(self, error: BaseException | None = None) -> None:
+        """Cut the session: later calls raise ``error``, by default ``DPY-4011``."""
+        self._session().error = error or oracle_error("DPY-4011", "the database or network closed the connection")
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        attributes = self._session().attributes
+        if name not in attributes:
+            msg = f"{type(self).__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        return attributes[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(getattr(type(self), name, None), property):
+            object.__setattr__(self, name, value)
+        else:
+            self._session().attributes[name] = value
+
+
+class FakeConnection(_FakeConnectionBase):
+    """A :class:`Connection <oracledb.Connection>` acquired from a :class:`FakeConnectionPool`."""
+
+    _pool: FakeConnectionPool
+
+    def commit(self) -> None:
+        _sleep(self._pool._run(self._session(), "commit"))  # noqa: SLF001
+
+    def rollback(self) -> None:
+        _sleep(self._pool._run(self._session(), "rollback"))  # noqa: SLF001
+
+    def ping(self) -> None:
+        _sleep(self._pool._run(self._session(), "ping"))  # noqa: SLF001
+
+    def close(self) -> None:
+        self._pool._record("close", self._session())  # noqa: SLF001
+        self._pool._checkin_connection(self)  # noqa: SLF001
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._impl is not None:
+            self.close()
+
+
+class FakeAsyncConnection(_FakeConnectionBase):
+    """An :class:`AsyncConnection <oracledb.AsyncConnection>` acquired from a :class:`FakeAsyncConnectionPool`."""
+
+    _spec = AsyncConnection
+    _cursor_class = FakeAsyncCursor
+    _pool: FakeAsyncConnectionPool
+
+    async def commit(self) -> None:
+        await _asleep(self._pool._run(self._session(), "commit"))  # noqa: SLF001
+
+    async def rollback(self) -> None:
+        await _asleep(self._pool._run(self._session(), "rollback"))  # noqa: SLF001
+
+    async def ping(self) -> None:
+        await _asleep(self._pool._run(self._session(), "ping"))  # noqa: SLF001
+
+    async def close(self) -> None:
+        self._pool._record("close", self._session())  # noqa: SLF001
+        await self._pool._checkin_connection(self)  # noqa: SLF001
+
+    async def execute(self, statement: str, parameters: Any = None) -> None:
+        cursor = self.cursor()
+        await cursor.execute(statement, parameters)
+
+    async def executemany(self, statement: str, parameters: Any) -> None:
+        cursor = self.cursor()
+        await cursor.executemany(statement, parameters)
+
+    async def callproc(self, name: str, parameters: Sequence[Any] = (), keyword_parameters: Any = None) -> list[Any]:
+        return await self.cursor().callproc(name, parameters, keyword_parameters)  # type: ignore[no-any-return]
+
+    async def callfunc(
+        self, name: str, return_type: Any, parameters: Sequence[Any] = (), keyword_parameters: Any = None
+    ) -> Any:
+        return await self.cursor().callfunc(name, return_type, parameters, keyword_parameters)
+
+    async def fetchone(self, statement: str, parameters: Any = None) -> Any:
+        cursor = self.cursor()
+        await cursor.execute(statement, parameters)
+        return await cursor.fetchone()
+
+    async def fetchmany(self, statement: str, parameters: Any = None, num_rows: int | None = None) -> list[Any]:
+        cursor = self.cursor()
+        await cursor.execute(statement, parameters)
+        return await cursor.fetchmany(num_rows)  # type: ignore[no-any-return]
+
+    async def fetchall(self, statement: str, parameters: Any = None) -> list[Any]:
+        cursor = self.cursor()
+        await cursor.execute(statement, parameters)
+        return await cursor.fetchall()  # type: ignore[no-any-return]
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._impl is not None:
+            await self.close()
+
+
+class FakeConnectionPool(_FakePoolBase):
+    """A :class:`ConnectionPool <oracledb.ConnectionPool>` handing out :class:`FakeConnection` objects.
+
+    Acquires block the calling thread while they wait for a session, like python-oracledb.
+    """
+
+    def as_pool(self) -> ConnectionPool:
+        """Return the fake typed as the pool it stands in for, e.g. for the ``pool_instance`` of a config."""
+        return cast("ConnectionPool", self)
+
+    def acquire(
+        self,
+        user: str | None = None,
+        password: str | None = None,
+        cclass: str | None = None,
+        purity: int = oracledb.PURITY_DEFAULT,
+        tag: str | None = None,
+        matchanytag: bool = False,
+        **kwargs: Any,
+    ) -> FakeConnection:
+        with self._condition:
+            self._check_acquire()
+            deadline = None if (wait := self._wait_seconds()) is None else time.monotonic() + wait
+            while (checkout := self._checkout(user, tag, matchanytag)) is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise self._acquire_timeout()
+                self._condition.wait(remaining)
+        session, new = checkout
+        connection = FakeConnection(self, session)
+        self._record("acquire", session, parameters={"user": user, "cclass": cclass, "purity": purity, "tag": tag})
+        try:
+            if new:
+                _sleep(self.connect_latency)
+            if self._needs_callback(session, new, tag):
+                self._record("session_callback", session, parameters=tag)
+                cast("Callable[..., Any]", self.session_callback)(connection, tag)
+        except BaseException:
+            self.release(connection)
+            raise
+        return connection
+
+    def release(self, connection: Any, tag: str | None = None) -> None:
+        self._record("release", connection._session())  # noqa: SLF001
+        self._checkin_connection(connection, tag)
+
+    def drop(self, connection: Any) -> None:
+        self._record("drop", connection._session())  # noqa: SLF001
+        self._checkin_connection(connection, drop=True)
+
+    def _checkin_connection(self, connection: Any, tag: str | None = None, drop: bool = False) -> None:
+        session = connection._session()  # noqa: SLF001
+        object.__setattr__(connection, "_impl", None)
+        with self._condition:
+            self._checkin(session, tag, drop)
+            self._condition.notify()
+
+    def reconfigure(
+        self,
+        min: int | None = None,  # noqa: A002
+        max: int | None = None,  # noqa: A002
+        increment: int | None = None,
+        getmode: int | None = None,
+        wait_timeout: int | None = None,
+        stmtcachesize: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        with self._condition:
+            for name, value in (
+                ("min", min),
+                ("max", max),
+                ("increment", increment),
+                ("getmode", getmode),
+                ("wait_timeout", wait_timeout),
+                ("stmtcachesize", stmtcachesize),
+            ):
+                if value is not None:
+                    setattr(self, name, value)
+            while len(self._sessions) > self.max and self._idle:
+                self._close_session(self._idle.pop(0))
+            self._condition.notify_all()
+
+    def close(self, force: bool = False) -> None:
+        with self._condition:
+            if self._busy and not force:
+                error = oracle_error("DPY-1005", "connection pool cannot be closed because connections are busy")
+                raise error
+            self._open = False
+            for session in self._idle:
+                self._close_session(session)
+            self._idle.clear()
+
+
+class FakeAsyncConnectionPool(_FakePoolBase):
+    """An :class:`AsyncConnectionPool <oracledb.AsyncConnectionPool>` handing out :class:`FakeAsyncConnection`
+    objects.
+    """
+
+    _spec = AsyncConnectionPool
+    _waiters: asyncio.Condition | None = None
+
+    def as_pool(self) -> AsyncConnectionPool:
+        """Return the fake typed as the pool it stands in for, e.g. for the ``pool_instance`` of a config."""
+        return cast("AsyncConnectionPool", self)
+
+    def acquire(
+        self,
+        user: str | None = None,
+        password: str | None = None,
+        cclass: str | None = None,
+        purity: int = oracledb.PURITY_DEFAULT,
+        tag: str | None = None,
+        matchanytag: bool = False,
+        **kwargs: Any,
+    ) -> _AsyncAcquire:
+        return _AsyncAcquire(self._acquire(user=user, cclass=cclass, purity=purity, tag=tag, matchanytag=matchanytag))
+
+    def _condition_for_waiters(self) -> asyncio.Condition:
+        # created on first use, so that the pool can be built outside of the event loop
+        if self._waiters is None:
+            self._waiters = asyncio.Condition()
+        return self._waiters
+
+    async def _acquire(
+        self, user: str | None, cclass: str | None, purity: int, tag: str | None, matchanytag: bool
+    ) -> FakeAsyncConnection:
+        waiters = self._condition_for_waiters()
+        async with waiters:
+            self._check_acquire()
+            wait = self._wait_seconds()
+            deadline = None if wait is None else time.monotonic() + wait
+            while True:
+                with self._condition:
+                    checkout = self._checkout(user, tag, matchanytag)
+                if checkout is not None:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise self._acquire_timeout()
+                try:
+                    await asyncio.wait_for(waiters.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise self._acquire_timeout() from None
+        session, new = checkout
+        connection = FakeAsyncConnection(self, session)
+        self._record("acquire", session, parameters={"user": user, "cclass": cclass, "purity": purity, "tag": tag})
+        try:
+            if new:
+                await _asleep(self.connect_latency)
+            if self._needs_callback(session, new, tag):
+                self._record("session_callback", session, parameters=tag)
+                result = cast("Callable[..., Any]", self.session_callback)(connection, tag)
+                if inspect.isawaitable(result):
+                    await result
+        except BaseException:
+            await self.release(connection)
+            raise
+        return connection
+
+    async def release(self, connection: Any, tag: str | None = None) -> None:
+        self._record("release", connection._session())  # noqa: SLF001
+        await self._checkin_connection(connection, tag)
+
+    async def drop(self, connection: Any) -> None:
+        self._record("drop", connection._session())  # noqa: SLF001
+        await self._checkin_connection(connection, drop=True)
+
+    async def _checkin_connection(self, connection: Any, tag: str | None = None, drop: bool = False) -> None:
+        session = connection._session()  # noqa: SLF001
+        object.__setattr__(connection, "_impl", None)
+        with self._condition:
+            self._checkin(session, tag, drop)
+        waiters = self._condition_for_waiters()
+        async with waiters:
+            waiters.notify()
+
+    async def close(self, force: bool = False) -> None:
+        with self._condition:
+            if self._busy and not force:
+                error = oracle_error("DPY-1005", "connection pool cannot be closed because connections are busy")
+                raise error
+            self._open = False
+            for session in self._idle:
+                self._close_session(session)
+            self._idle.clear()
+
+
+class _AsyncAcquire:
+    """What :meth:`FakeAsyncConnectionPool.acquire` returns: awaitable, or usable as ``async with``."""
+
+    __slots__ = ("_connection", "_pending")
+
+    def __init__(self, pending: Any) -> None:
+        self._pending = pending
+        self._connection: FakeAsyncConnection | None = None
+
+    def __await__(self) -> Any:
+        return self._pending.__await__()
+
+    async def __aenter__(self) -> FakeAsyncConnection:
+        self._connection = await self._pending
+        return self._connection
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._connection is not None and self._connection._impl is not None:  # noqa: SLF001
+            await self._connection.close()
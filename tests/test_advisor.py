@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.advisor import StatementCacheAdvisor, UnboundStatement
+
+pytestmark = pytest.mark.anyio
+
+
+def test_models_the_lru_cache_of_each_session() -> None:
+    advisor = StatementCacheAdvisor(cache_size=2, min_size=1, headroom=1.0, coverage=1.0)
+    for sql in ("select a", "select b", "select a", "select c", "select b"):
+        advisor.observe(sql, "/items", session=1)
+    advisor.observe("select a", "/other", session=2)
+
+    report = advisor.report()
+    assert (report.hits, report.misses, report.executions) == (1, 5, 6)
+    assert report.distinct_statements == 3
+    assert report.recommended_size == 3
+    assert report.route_cardinality == {"/items": 3, "/other": 1}
+
+
+def test_flags_statements_built_with_literals(caplog: pytest.LogCaptureFixture) -> None:
+    advisor = StatementCacheAdvisor(literal_variants=3)
+    with caplog.at_level(logging.WARNING, logger="litestar_oracledb"):
+        for user_id in (1, 2, 3, 4, 1):
+            advisor.observe(f"select * from users where id = {user_id}", "/users/{user_id:int}")
+        advisor.observe("select * from users where id = :id", "/users/{user_id:int}")
+
+    assert advisor.report().unbound == (
+        UnboundStatement("select * from users where id = ?", 4, ("/users/{user_id:int}",)),
+    )
+    assert len(caplog.records) == 1
+
+
+async def test_auto_apply_resizes_acquired_connections() -> None:
+    connection = MagicMock(spec=AsyncConnection)
+    connection.stmtcachesize = 20
+    connection.fetchall = AsyncMock(return_value=[])
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=connection)
+    pool.close = AsyncMock()
+    advisor = StatementCacheAdvisor(auto_apply=True, min_size=8, update_interval=1)
+    config = AsyncOracleDatabaseConfig(pool_instance=pool, statement_cache_advisor=advisor)
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> list:
+        return await db_connection.fetchall("select 1 from dual")
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).status_code == 200
+        assert (await client.get("/")).status_code == 200
+
+    assert connection.stmtcachesize == 8
+    report = advisor.report()
+    assert (report.executions, report.hits, report.cache_size) == (2, 1, 8)
+    assert report.route_cardinality == {"/": 1}
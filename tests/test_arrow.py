@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import oracledb
+import pytest
+from litestar import get
+from litestar.response import Stream
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, AsyncCursor
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.arrow import encode_batches, fetch_record_batches
+from litestar_oracledb.config import LazyAsyncConnection
+from litestar_oracledb.exceptions import MissingDependencyError
+
+pytestmark = pytest.mark.anyio
+
+ROWS = [(1, "ada"), (2, "grace"), (3, "linus")]
+DESCRIPTION = [
+    ("ID", oracledb.DB_TYPE_NUMBER, 11, None, 10, 0, False),
+    ("NAME", oracledb.DB_TYPE_VARCHAR, 100, 100, None, None, True),
+]
+
+
+def _connection(*batches: list[Any]) -> MagicMock:
+    cursor = MagicMock(spec=AsyncCursor)
+    cursor.description = DESCRIPTION
+    cursor.execute = AsyncMock()
+    cursor.fetchmany = AsyncMock(side_effect=[*(batches or (ROWS[:2], ROWS[2:])), []])
+    connection = MagicMock(spec=AsyncConnection)
+    connection.cursor.return_value = cursor
+    del connection.fetch_df_batches
+    return connection
+
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+async def test_requires_pyarrow() -> None:
+    with pytest.raises(MissingDependencyError, match="litestar-oracledb\\[arrow\\]"):
+        await fetch_record_batches(_connection(), "select id, name from users").__anext__()
+
+
+async def test_builds_batches_from_rows() -> None:
+    pytest.importorskip("pyarrow")
+    batches = [batch async for batch in fetch_record_batches(_connection(), "select id, name from users", size=2)]
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert batches[0].schema.names == ["ID", "NAME"]
+    assert batches[1].column(1).to_pylist() == ["linus"]
+
+
+async def test_builds_batches_on_a_lazy_connection() -> None:
+    pytest.importorskip("pyarrow")
+    connection = _connection()
+    lazy = LazyAsyncConnection(AsyncMock(return_value=connection))
+    batches = [batch async for batch in fetch_record_batches(lazy, "select id, name from users", size=2)]  # type: ignore[arg-type]
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    connection.cursor.return_value.execute.assert_awaited_once_with("select id, name from users", None)
+
+
+async def test_keeps_the_schema_of_null_columns() -> None:
+    pa = pytest.importorskip("pyarrow")
+    connection = _connection([(1, None)], [(2, "grace")])
+    batches = [batch async for batch in fetch_record_batches(connection, "select id, name from users", size=1)]
+    assert [batch.schema for batch in batches] == [pa.schema([("ID", pa.int64()), ("NAME", pa.string())])] * 2
+
+    async def replay() -> Any:
+        for batch in batches:
+            yield batch
+
+    content = b"".join([chunk async for chunk in encode_batches(replay())])
+    assert pa.ipc.open_stream(content).read_all().column("NAME").to_pylist() == [None, "grace"]
+
+
+@pytest.mark.parametrize("arrow_format", ["arrow", "parquet"])
+async def test_encodes_empty_results(arrow_format: Any) -> None:
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    async def no_batches() -> Any:
+        return
+        yield
+
+    for batches in (no_batches(), fetch_record_batches(_connection([]), "select id, name from users")):
+        content = b"".join([chunk async for chunk in encode_batches(batches, arrow_format)])
+        if arrow_format == "arrow":
+            table = pa.ipc.open_stream(content).read_all()
+        else:
+            table = pq.read_table(pa.BufferReader(content))
+        assert table.num_rows == 0
+
+
+@pytest.mark.parametrize("arrow_format", ["arrow", "parquet"])
+async def test_stream_arrow(arrow_format: Any) -> None:
+    pa = pytest.importorskip("pyarrow")
+    connection = _connection()
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = connection
+    pool.close = AsyncMock()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool)
+
+    @get("/report")
+    async def report() -> Stream:
+        return config.stream_arrow("select id, name from users", arrow_format=arrow_format, batch_size=2)
+
+    async with create_async_test_client(route_handlers=[report], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/report")
+
+    if arrow_format == "arrow":
+        table = pa.ipc.open_stream(response.content).read_all()
+    else:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(pa.BufferReader(response.content))
+    assert table.to_pylist() == [{"ID": i, "NAME": name} for i, name in ROWS]
+    pool.acquire.return_value.__aexit__.assert_awaited_once()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import oracledb
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, Connection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.breaker import CircuitBreaker, is_connection_error
+from litestar_oracledb.exceptions import CircuitOpenError
+from litestar_oracledb.metrics import InMemoryPoolMetrics
+
+pytestmark = pytest.mark.anyio
+
+
+def _error(full_code: str) -> oracledb.Error:
+    return oracledb.OperationalError(SimpleNamespace(full_code=full_code, message=f"{full_code}: failed"))
+
+
+def test_only_connection_errors_count() -> None:
+    assert is_connection_error(_error("DPY-6005"))
+    assert is_connection_error(_error("ORA-03113"))
+    assert not is_connection_error(_error("ORA-00001"))
+    assert not is_connection_error(ValueError("DPY-6005"))
+
+
+async def test_breaker_opens_and_half_opens() -> None:
+    transitions: list[tuple[str, str]] = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05, listeners=[lambda *t: transitions.append(t)])
+
+    breaker.record_failure(_error("ORA-00942"))
+    breaker.record_failure(_error("DPY-6005"))
+    assert transitions == []
+    breaker.record_failure(_error("DPY-6005"))
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    await asyncio.sleep(0.06)
+    with pytest.raises(oracledb.Error), breaker.guard():
+        raise _error("DPY-6005")
+    assert breaker.state == "open"
+
+    await asyncio.sleep(0.06)
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()  # the only probe is in flight
+    breaker.record_success()
+    assert transitions == [
+        ("closed", "open"),
+        ("open", "half_open"),
+        ("half_open", "open"),
+        ("open", "half_open"),
+        ("half_open", "closed"),
+    ]
+
+
+async def test_async_config_short_circuits_requests() -> None:
+    pool = MagicMock()
+    pool.acquire = AsyncMock(side_effect=_error("DPY-6005"))
+    pool.close = AsyncMock()
+    metrics = InMemoryPoolMetrics()
+    config = AsyncOracleDatabaseConfig(
+        pool_instance=pool,
+        circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        metrics=metrics,
+    )
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> str:
+        return "ok"
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        statuses = [(await client.get("/")).status_code for _ in range(4)]
+        response = await client.get("/")
+
+    assert statuses == [500, 500, 503, 503]
+    assert response.headers["retry-after"] == "60"
+    assert pool.acquire.await_count == 2
+    assert metrics.circuit_states[config.pool_app_state_key] == ["open"]
+
+
+async def test_sync_config_counts_statement_errors() -> None:
+    connection = MagicMock(spec=Connection)
+    pool = MagicMock()
+    pool.acquire.return_value = connection
+    breaker = CircuitBreaker(failure_threshold=1)
+    config = SyncOracleDatabaseConfig(pool_instance=pool, circuit_breaker=breaker)
+
+    @get("/", sync_to_thread=False)
+    def handler(db_connection: Connection) -> str:
+        raise _error("ORA-03113")
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).status_code == 500
+        assert (await client.get("/")).status_code == 503
+
+    assert breaker.state == "open"
+    assert pool.acquire.call_count == 1
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from oracledb import AsyncConnection, AsyncCursor, Connection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, SyncOracleDatabaseConfig
+from litestar_oracledb.bulk import iter_batches, merge_statement
+
+pytestmark = pytest.mark.anyio
+
+
+def test_merge_statement() -> None:
+    assert merge_statement("users", ["id", "name"], ["id"]) == (
+        "merge into users t using (select :id as id, :name as name from dual) s on (t.id = s.id)"
+        " when matched then update set t.name = s.name"
+        " when not matched then insert (id, name) values (s.id, s.name)"
+    )
+    with pytest.raises(ValueError, match="Invalid identifier"):
+        merge_statement("users; drop table users", ["id"], ["id"])
+
+
+async def test_iter_batches_bounds_rows_and_bytes() -> None:
+    async def rows() -> AsyncGenerator[Any, None]:
+        for name in ["a" * 10, "b" * 10, "c" * 30, "d", "e", "f"]:
+            yield (name,)
+
+    batches = [batch async for batch in iter_batches(rows(), batch_size=2, max_batch_bytes=25)]
+    assert batches == [[("a" * 10,), ("b" * 10,)], [("c" * 30,)], [("d",), ("e",)], [("f",)]]
+
+
+async def test_async_bulk_insert_reports_batch_errors() -> None:
+    cursor = MagicMock(spec=AsyncCursor)
+    cursor.executemany = AsyncMock()
+    cursor.rowcount = 1
+    cursor.getbatcherrors.side_effect = [[], [SimpleNamespace(offset=0, code=1, message="ORA-00001: unique")]]
+    connection = MagicMock(spec=AsyncConnection)
+    connection.cursor.return_value = cursor
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = connection
+    config = AsyncOracleDatabaseConfig(pool_instance=pool)
+
+    rows = [{"id": 1, "name": "ada"}, {"id": 2, "name": "grace"}, {"id": 1, "name": "linus"}]
+    result = await config.bulk_insert("users", iter(rows), batch_size=2, batcherrors=True)
+
+    assert (result.submitted, result.affected, result.batches) == (3, 2, 2)
+    assert [(error.offset, error.row, error.code) for error in result.errors] == [(2, rows[2], 1)]
+    sql = "insert into users (id, name) values (:id, :name)"
+    cursor.executemany.assert_any_await(sql, rows[:2], batcherrors=True)
+    cursor.executemany.assert_any_await(sql, rows[2:], batcherrors=True)
+    connection.commit.assert_awaited_once()
+    cursor.close.assert_called_once()
+
+
+async def test_sync_bulk_upsert_on_request_connection() -> None:
+    connection = MagicMock(spec=Connection)
+    cursor = connection.cursor.return_value
+    cursor.rowcount = 2
+    config = SyncOracleDatabaseConfig(pool_instance=MagicMock())
+
+    result = await config.bulk_insert(
+        "users", [(1, "ada"), (2, "grace")], columns=["id", "name"], upsert_keys=["id"], connection=connection
+    )
+
+    assert (result.submitted, result.affected, result.batches) == (2, 2, 1)
+    sql = cursor.executemany.call_args.args[0]
+    assert sql.startswith("merge into users t using (select :1 as id, :2 as name from dual)")
+    cursor.getbatcherrors.assert_not_called()
+    connection.commit.assert_not_called()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import oracledb
+import pytest
+from litestar import get
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, AsyncOraclePoolConfig, OracleDatabasePlugin
+from litestar_oracledb.drcp import DRCP, is_pooled_dsn
+from litestar_oracledb.testing import FakeAsyncConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+def test_is_pooled_dsn() -> None:
+    assert is_pooled_dsn("dbhost:1521/orclpdb:pooled")
+    assert is_pooled_dsn(
+        "(DESCRIPTION=(ADDRESS=(PROTOCOL=tcp)(HOST=dbhost)(PORT=1521))"
+        "(CONNECT_DATA=(SERVICE_NAME=orclpdb)(SERVER=POOLED)))"
+    )
+    assert is_pooled_dsn("dbhost:1521/orclpdb") is False
+
+
+def test_configures_the_pool() -> None:
+    pool_config = AsyncOraclePoolConfig(dsn="dbhost/orclpdb:pooled", purity=oracledb.PURITY_NEW)
+    AsyncOracleDatabaseConfig(pool_config=pool_config, drcp=DRCP(cclass="APP", pool_boundary="transaction"))
+    assert (pool_config.cclass, pool_config.purity, pool_config.pool_boundary) == (
+        "APP",
+        oracledb.PURITY_NEW,
+        "transaction",
+    )
+
+    pool_config = AsyncOraclePoolConfig(host="dbhost", service_name="orclpdb")
+    AsyncOracleDatabaseConfig(pool_config=pool_config, drcp=DRCP(cclass="APP"))
+    assert pool_config.server_type == "pooled"
+
+    with pytest.raises(ImproperlyConfiguredException, match=":pooled"):
+        AsyncOracleDatabaseConfig(pool_config=AsyncOraclePoolConfig(dsn="dbhost/orclpdb"), drcp=DRCP(cclass="APP"))
+    with pytest.raises(ImproperlyConfiguredException, match=":pooled"):
+        AsyncOracleDatabaseConfig(
+            pool_instance=FakeAsyncConnectionPool(dsn="dbhost/orclpdb").as_pool(),
+            drcp=DRCP(cclass="APP"),
+        )
+
+
+async def test_acquires_with_the_connection_class_of_the_route() -> None:
+    pool = FakeAsyncConnectionPool(dsn="dbhost/orclpdb:pooled")
+    drcp = DRCP(cclass="APP", route_cclasses={"/reports/{report_id}": "REPORTS"})
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), drcp=drcp)
+
+    @get("/")
+    async def index(db_connection: AsyncConnection) -> None: ...
+
+    @get("/reports/{report_id:int}")
+    async def report(db_connection: AsyncConnection, report_id: int) -> None: ...
+
+    @get("/admin", opt={"db_cclass": "ADMIN"})
+    async def admin(db_connection: AsyncConnection) -> None: ...
+
+    async with create_async_test_client(
+        route_handlers=[index, report, admin], plugins=[OracleDatabasePlugin(config)]
+    ) as client:
+        for path in ("/", "/reports/1", "/admin", "/"):
+            assert (await client.get(path)).status_code == 200
+
+    acquires = [call.parameters for call in pool.calls if call.name == "acquire"]
+    assert [(acquire["cclass"], acquire["purity"]) for acquire in acquires] == [
+        ("APP", oracledb.PURITY_SELF),
+        ("REPORTS", oracledb.PURITY_SELF),
+        ("ADMIN", oracledb.PURITY_SELF),
+        ("APP", oracledb.PURITY_SELF),
+    ]
+    assert pool.count("close") == 4  # the pooled server is released when each response starts
+    report_ = drcp.report()
+    assert (report_.acquires, report_.server_sessions, report_.peak_server_sessions) == (4, 1, 1)
+    assert report_.sessions_saved == report_.peak_client_sessions - 1
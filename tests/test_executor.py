@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import oracledb
+import pytest
+from litestar import get
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.testing import create_async_test_client
+from oracledb import Connection
+
+from litestar_oracledb import OracleDatabasePlugin, SyncOracleDatabaseConfig, SyncOraclePoolConfig
+from litestar_oracledb.executor import PoolExecutor
+from litestar_oracledb.limits import ConnectionLimiter
+from litestar_oracledb.tenancy import TenantRouting
+from litestar_oracledb.testing import FakeConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_pool_executor_statistics() -> None:
+    executor = PoolExecutor(max_workers=1)
+    release = threading.Event()
+
+    first = asyncio.ensure_future(executor.run(release.wait))
+    second = asyncio.ensure_future(executor.run(lambda: "done"))
+    await asyncio.sleep(0.05)
+    statistics = executor.statistics()
+    assert statistics.active == 1
+    assert statistics.queue_depth == 1
+    release.set()
+    assert await second == "done"
+    assert await first is True
+
+    statistics = executor.statistics()
+    assert (statistics.active, statistics.queue_depth, statistics.peak_queue_depth) == (0, 0, 1)
+    assert statistics.completed == 2
+    executor.shutdown()
+
+
+def test_executor_sized_to_pool_max() -> None:
+    pool_config = SyncOraclePoolConfig(max=7)
+    config = SyncOracleDatabaseConfig(pool_config=pool_config, use_executor=True)
+    assert config.executor is not None
+    assert config.executor.max_workers == config.executor.release_workers == 7
+    assert (pool_config.getmode, pool_config.wait_timeout) == (oracledb.POOL_GETMODE_TIMEDWAIT, 30_000)
+
+
+async def test_sync_config_acquires_off_the_event_loop() -> None:
+    threads: list[str] = []
+    connection = MagicMock(spec=Connection)
+    connection.commit.side_effect = lambda: threads.append(threading.current_thread().name)
+    pool = MagicMock()
+    pool.max = 4
+
+    def acquire() -> MagicMock:
+        threads.append(threading.current_thread().name)
+        return connection
+
+    pool.acquire.side_effect = acquire
+    config = SyncOracleDatabaseConfig(pool_instance=pool, use_executor=True, before_send_handler="autocommit")
+
+    @get("/")
+    async def handler(db_connection: Connection) -> str:
+        return "ok"
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).status_code == 200
+
+    assert len(threads) == 2
+    assert all(name.startswith("oracledb") for name in threads)
+    connection.close.assert_called_once()
+    pool.close.assert_called_once_with(force=True)
+
+
+async def test_more_concurrent_requests_than_connections() -> None:
+    pool = FakeConnectionPool(max=2)
+    config = SyncOracleDatabaseConfig(
+        pool_instance=pool.as_pool(),
+        use_executor=True,
+        before_send_handler="autocommit",
+    )
+
+    @get("/")
+    async def handler(db_connection: Connection) -> str:
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async with create_async_test_client(
+        route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]
+    ) as test_client, httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=test_client.app), base_url="http://testserver"
+    ) as client:
+        responses = await asyncio.wait_for(asyncio.gather(*(client.get("/") for _ in range(6))), timeout=5)
+
+    assert [response.status_code for response in responses] == [200] * 6
+    assert (pool.peak_busy, pool.busy) == (2, 0)
+    assert pool.count("commit") == 6
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"use_executor": True},
+        {"connection_limiter": ConnectionLimiter(max_connections=1)},
+        {"tenancy": TenantRouting(header="X-Tenant-ID", max_connections=1)},
+    ],
+)
+def test_lazy_connection_is_rejected_off_the_event_loop(kwargs: dict[str, Any]) -> None:
+    # an async handler would acquire the lazy connection on the event loop
+    with pytest.raises(ImproperlyConfiguredException, match="lazy_connection"):
+        SyncOracleDatabaseConfig(pool_instance=FakeConnectionPool().as_pool(), lazy_connection=True, **kwargs)
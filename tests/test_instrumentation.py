@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, AsyncCursor, Connection, Cursor
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.instrumentation import InstrumentedConnection, StatementRecorder, fingerprint
+from litestar_oracledb.metrics import InMemoryPoolMetrics
+
+pytestmark = pytest.mark.anyio
+
+
+def test_fingerprint() -> None:
+    assert fingerprint("SELECT *\n  FROM users -- all of them\n WHERE id = 42 AND name = 'O''Neil'") == (
+        "select * from users where id = ? and name = ?"
+    )
+    assert fingerprint("select * from t where id in (1, 2, 3) and x = :x") == (
+        "select * from t where id in (?+) and x = :x"
+    )
+
+
+def test_sync_cursor_records_query_once_exhausted() -> None:
+    cursor = MagicMock(spec=Cursor)
+    cursor.description = [("ID",)]
+    cursor.rowcount = 3
+    connection = MagicMock(spec=Connection)
+    connection.cursor.return_value = cursor
+    metrics = InMemoryPoolMetrics()
+    instrumented = InstrumentedConnection(connection, StatementRecorder("db_pool", metrics), route="/users")
+
+    with instrumented.cursor() as instrumented_cursor:
+        assert isinstance(instrumented_cursor, Cursor)
+        instrumented_cursor.execute("select id from users where id > 1")
+        assert not metrics.statements["db_pool"]
+        instrumented_cursor.fetchall()
+
+    (statistics,) = metrics.statements["db_pool"]
+    assert statistics.fingerprint == "select id from users where id > ?"
+    assert (statistics.operation, statistics.rows, statistics.route) == ("execute", 3, "/users")
+    assert statistics.round_trips is None
+    cursor.close.assert_called_once()
+
+
+async def test_slow_queries_are_logged_with_route(caplog: pytest.LogCaptureFixture) -> None:
+    cursor = MagicMock(spec=AsyncCursor)
+    cursor.description = None
+    cursor.rowcount = 2
+    cursor.execute = AsyncMock()
+    connection = MagicMock(spec=AsyncConnection)
+    connection.cursor.return_value = cursor
+    connection.commit = AsyncMock()
+    connection.close = AsyncMock()
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=connection)
+    pool.close = AsyncMock()
+    metrics = InMemoryPoolMetrics()
+    config = AsyncOracleDatabaseConfig(
+        pool_instance=pool, before_send_handler="autocommit", metrics=metrics, slow_query_threshold=0
+    )
+
+    @get("/users/{user_id:int}")
+    async def handler(db_connection: AsyncConnection, user_id: int) -> str:
+        with db_connection.cursor() as cursor:
+            await cursor.execute("update users set seen = sysdate where id = :id", id=user_id)
+        return "ok"
+
+    with caplog.at_level(logging.WARNING, logger="litestar_oracledb.slow_query"):
+        async with create_async_test_client(
+            route_handlers=[handler], plugins=[OracleDatabasePlugin(config)], logging_config=None
+        ) as client:
+            assert (await client.get("/users/1")).status_code == 200
+
+    (statistics,) = metrics.statements[config.pool_app_state_key]
+    assert (statistics.operation, statistics.rows, statistics.route) == ("execute", 2, "/users/{user_id}")
+    assert "/users/{user_id}" in caplog.text
+    connection.commit.assert_awaited_once()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, Connection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.testing import FakeAsyncConnectionPool, FakeConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_async_lazy_connection_not_acquired() -> None:
+    pool = FakeAsyncConnectionPool()
+    config = AsyncOracleDatabaseConfig(
+        pool_instance=pool.as_pool(), lazy_connection=True, before_send_handler="autocommit"
+    )
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> str:
+        return "cached"
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/")
+        assert response.status_code == 200
+
+    assert pool.calls == []
+
+
+async def test_async_lazy_connection_acquired_on_first_statement() -> None:
+    pool = FakeAsyncConnectionPool()
+    pool.script("select 1 from dual", [(1,)])
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), lazy_connection=True)
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> list[int]:
+        with db_connection.cursor() as cursor:
+            cursor.arraysize = 500
+            await cursor.execute("select 1 from dual")
+            rows = await cursor.fetchall()
+            return [rows[0][0], cursor.arraysize]
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/")
+        assert response.status_code == 200
+        assert response.json() == [1, 500]
+
+    assert [call.name for call in pool.calls] == ["acquire", "execute", "close"]
+
+
+async def test_sync_lazy_connection() -> None:
+    pool = FakeConnectionPool()
+    config = SyncOracleDatabaseConfig(pool_instance=pool.as_pool(), lazy_connection=True)
+
+    @get("/skip", sync_to_thread=False)
+    def skip(db_connection: Connection) -> str:
+        return "skipped"
+
+    @get("/query", sync_to_thread=False)
+    def query(db_connection: Connection) -> str:
+        with db_connection.cursor() as cursor:
+            cursor.execute("select 1 from dual")
+        return "queried"
+
+    async with create_async_test_client(route_handlers=[skip, query], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/skip")).status_code == 200
+        assert pool.calls == []
+        assert (await client.get("/query")).status_code == 200
+        assert [call.name for call in pool.calls] == ["acquire", "execute", "close"]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator
+
+import httpx
+import oracledb
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, Connection
+
+from litestar_oracledb import (
+    AsyncOracleDatabaseConfig,
+    OracleDatabasePlugin,
+    SyncOracleDatabaseConfig,
+    SyncOraclePoolConfig,
+)
+from litestar_oracledb.limits import ConnectionLimiter
+from litestar_oracledb.metrics import InMemoryPoolMetrics
+from litestar_oracledb.testing import FakeAsyncConnectionPool, FakeConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+@asynccontextmanager
+async def _concurrent_client(**kwargs: Any) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Run the app lifespan with the test client, but send requests through httpx so they can overlap."""
+    async with create_async_test_client(**kwargs) as test_client, httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=test_client.app), base_url="http://testserver"
+    ) as client:
+        yield client
+
+
+async def test_sheds_requests_over_the_route_limit() -> None:
+    release = asyncio.Event()
+    metrics = InMemoryPoolMetrics()
+    limiter = ConnectionLimiter(max_connections=1, max_wait=0.05, retry_after=3)
+    config = AsyncOracleDatabaseConfig(
+        pool_instance=FakeAsyncConnectionPool().as_pool(), connection_limiter=limiter, metrics=metrics
+    )
+
+    @get("/slow")
+    async def slow(db_connection: AsyncConnection) -> str:
+        await release.wait()
+        return "ok"
+
+    @get("/wide", opt={"db_max_connections": 2})
+    async def wide(db_connection: AsyncConnection) -> str:
+        await release.wait()
+        return "ok"
+
+    async with _concurrent_client(route_handlers=[slow, wide], plugins=[OracleDatabasePlugin(config)]) as client:
+        first = asyncio.ensure_future(client.get("/slow"))
+        wide_requests = [asyncio.ensure_future(client.get("/wide")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        rejected = await client.get("/slow")
+        release.set()
+        responses = await asyncio.gather(first, *wide_requests)
+        assert (await client.get("/slow")).status_code == 200
+
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "3"
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert metrics.rejections[config.pool_app_state_key]["/slow"] == 1
+    assert metrics.wait_queues[config.pool_app_state_key]["/slow"] == 0
+    assert limiter.queue_depth("/slow") == 0
+
+
+async def test_acquire_timeout_fails_fast() -> None:
+    pool = FakeAsyncConnectionPool(connect_latency=1)
+    config = AsyncOracleDatabaseConfig(
+        pool_instance=pool.as_pool(), connection_limiter=ConnectionLimiter(max_wait=0.01)
+    )
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> str:
+        return "ok"
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert pool.busy == 0
+
+
+async def test_sync_config_shares_a_dependency_limit() -> None:
+    limiter = ConnectionLimiter(max_connections=1, key="dependency", max_wait=0)
+    config = SyncOracleDatabaseConfig(pool_instance=FakeConnectionPool().as_pool(), connection_limiter=limiter)
+    release = asyncio.Event()
+
+    @get("/a")
+    async def a(db_connection: Connection) -> str:
+        await release.wait()
+        return "ok"
+
+    @get("/b")
+    async def b(db_connection: Connection) -> str:
+        return "ok"
+
+    async with _concurrent_client(route_handlers=[a, b], plugins=[OracleDatabasePlugin(config)]) as client:
+        pending = asyncio.ensure_future(client.get("/a"))
+        await asyncio.sleep(0.05)
+        assert (await client.get("/b")).status_code == 503
+        release.set()
+        assert (await pending).status_code == 200
+        assert (await client.get("/b")).status_code == 200
+
+
+def test_sync_config_bounds_the_pool_wait() -> None:
+    pool_config = SyncOraclePoolConfig(dsn="dbhost/orclpdb")
+    SyncOracleDatabaseConfig(
+        pool_config=pool_config, connection_limiter=ConnectionLimiter(max_wait=0.25), use_executor=True
+    )
+    assert (pool_config.getmode, pool_config.wait_timeout) == (oracledb.POOL_GETMODE_TIMEDWAIT, 250)
+
+
+async def test_sync_acquire_timeout_fails_fast() -> None:
+    metrics = InMemoryPoolMetrics()
+    pool = FakeConnectionPool(max=1, getmode=oracledb.POOL_GETMODE_TIMEDWAIT, wait_timeout=50)
+    limiter = ConnectionLimiter(max_wait=0.05, retry_after=2)
+    config = SyncOracleDatabaseConfig(pool_instance=pool.as_pool(), connection_limiter=limiter, metrics=metrics)
+    release = threading.Event()
+
+    @get("/", sync_to_thread=True)
+    def handler(db_connection: Connection) -> str:
+        release.wait(5)
+        return "ok"
+
+    async with _concurrent_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        pending = asyncio.ensure_future(client.get("/"))
+        await asyncio.sleep(0.05)
+        rejected = await client.get("/")
+        release.set()
+        assert (await pending).status_code == 200
+
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "2"
+    assert metrics.rejections[config.pool_app_state_key]["/"] == 1
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar import Request, Response, get, route
+from litestar.exceptions import HTTPException
+from litestar.response import Stream
+from litestar.testing import create_async_test_client
+from oracledb import DB_TYPE_BLOB, DB_TYPE_CLOB, AsyncConnection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.lob import parse_range
+from litestar_oracledb.testing import FakeAsyncConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+DATA = b"0123456789"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=2-5", (2, 6)),
+        ("bytes=7-", (7, 10)),
+        ("bytes=-3", (7, 10)),
+        ("bytes=4-100", (4, 10)),
+        ("bytes=0-1,4-5", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range(header: str | None, expected: tuple[int, int] | None) -> None:
+    assert parse_range(header, len(DATA)) == expected
+
+
+def test_parse_range_not_satisfiable() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        parse_range("bytes=10-", len(DATA))
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers == {"Content-Range": "bytes */10"}
+
+
+async def test_stream_lob_range_keeps_request_connection() -> None:
+    lob = MagicMock()
+    lob.type = DB_TYPE_BLOB
+    lob.size = AsyncMock(return_value=len(DATA))
+    lob.read = AsyncMock(side_effect=lambda offset, amount: DATA[offset - 1 : offset - 1 + amount])
+    connection = MagicMock(spec=AsyncConnection)
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=connection)
+    pool.close = AsyncMock()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool)
+
+    @get("/document")
+    async def document(request: Request, db_connection: AsyncConnection) -> Stream:
+        return await config.stream_lob(request.scope, lob, filename="doc.bin", chunk_size=3)
+
+    async with create_async_test_client(route_handlers=[document], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/document", headers={"Range": "bytes=2-6"})
+
+    assert response.status_code == 206
+    assert response.content == DATA[2:7]
+    assert response.headers["content-range"] == "bytes 2-6/10"
+    assert response.headers["content-length"] == "5"
+    assert [call.args for call in lob.read.await_args_list] == [(3, 3), (6, 2)]
+    connection.close.assert_awaited_once()
+    connection.commit.assert_not_called()
+
+
+def _blob() -> MagicMock:
+    lob = MagicMock()
+    lob.type = DB_TYPE_BLOB
+    lob.size = AsyncMock(return_value=len(DATA))
+    lob.read = AsyncMock(side_effect=lambda offset, amount: DATA[offset - 1 : offset - 1 + amount])
+    return lob
+
+
+async def test_stream_lob_returns_the_connection_without_streaming() -> None:
+    pool = FakeAsyncConnectionPool()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), before_send_handler="autocommit")
+
+    async def fail(response: Response) -> Response:
+        if response.headers.get("x-fail"):
+            raise HTTPException(status_code=409)
+        return response
+
+    @route("/document", http_method=["GET", "HEAD"], after_request=fail)
+    async def document(request: Request, db_connection: AsyncConnection) -> Stream:
+        await db_connection.execute("update documents set downloads = downloads + 1")
+        headers = {"x-fail": "1"} if "fail" in request.query_params else None
+        return await config.stream_lob(request.scope, _blob(), headers=headers)
+
+    async with create_async_test_client(route_handlers=[document], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.head("/document")
+        assert response.status_code == 200
+        assert pool.busy == 0
+        assert (await client.get("/document", params={"fail": "1"})).status_code == 409
+        assert pool.busy == 0
+        assert (await client.get("/document")).content == DATA
+
+    # the update is committed before the connection is handed over to the response
+    assert [call.name for call in pool.calls if call.name in {"commit", "rollback", "close"}] == [
+        "commit",
+        "close",
+    ] * 3
+
+
+async def test_sync_write_lob_decodes_split_characters() -> None:
+    lob = MagicMock()
+    lob.type = DB_TYPE_CLOB
+    config = SyncOracleDatabaseConfig(pool_instance=MagicMock())
+    encoded = "héllo wörld".encode()
+
+    async def body() -> AsyncGenerator[bytes, None]:
+        for i in range(0, len(encoded), 2):
+            yield encoded[i : i + 2]
+
+    assert await config.write_lob(lob, body(), buffer_size=4) == 11
+    assert "".join(call.args[0] for call in lob.write.call_args_list) == "héllo wörld"
+    assert [call.args[1] for call in lob.write.call_args_list] == [1, 4, 8, 11]
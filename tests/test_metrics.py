@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.metrics import InMemoryPoolMetrics, PoolUsageSample, PrometheusPoolMetrics
+from litestar_oracledb.testing import FakeAsyncConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_in_memory_metrics() -> None:
+    metrics = InMemoryPoolMetrics()
+    pool = FakeAsyncConnectionPool(min=2, max=4)
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), before_send_handler="autocommit", metrics=metrics)
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> str:
+        return "ok"
+
+    @get("/fail")
+    async def fail(db_connection: AsyncConnection) -> None:
+        raise ValueError
+
+    async with create_async_test_client(
+        route_handlers=[handler, fail], plugins=[OracleDatabasePlugin(config)]
+    ) as client:
+        assert (await client.get("/")).status_code == 200
+        assert (await client.get("/fail")).status_code == 500
+
+    pool_name = config.pool_app_state_key
+    assert len(metrics.acquire_times[pool_name]) == 2
+    assert len(metrics.checkout_times[pool_name]) == 2
+    assert metrics.commits[pool_name] == 1
+    assert metrics.rollbacks[pool_name] == 1
+    assert metrics.pool_usage[pool_name][0] == PoolUsageSample(busy=0, opened=2, max_size=4)
+
+
+def test_prometheus_metrics() -> None:
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    metrics = PrometheusPoolMetrics(registry=registry)
+
+    metrics.record_acquire("db_pool", 0.25)
+    metrics.record_commit("db_pool")
+    metrics.record_pool_usage("db_pool", busy=1, opened=2, max_size=4)
+
+    assert registry.get_sample_value("litestar_oracledb_pool_acquire_seconds_sum", {"pool": "db_pool"}) == 0.25
+    assert (
+        registry.get_sample_value("litestar_oracledb_transactions_total", {"pool": "db_pool", "outcome": "commit"}) == 1
+    )
+    assert registry.get_sample_value("litestar_oracledb_pool_busy", {"pool": "db_pool"}) == 1
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar import Request, get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, DatabaseError
+from oracledb.errors import _Error
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.cache import CachingAsyncConnection, RequestCache
+from litestar_oracledb.instrumentation import InstrumentedAsyncConnection, StatementRecorder
+from litestar_oracledb.limits import ConnectionLimiter
+from litestar_oracledb.metrics import InMemoryPoolMetrics
+from litestar_oracledb.pipeline import run_pipelined
+from litestar_oracledb.testing import FakeAsyncConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_pipelines_on_the_given_connection() -> None:
+    connection = MagicMock(spec=AsyncConnection)
+    connection.version = "23.5.0.24.7"
+    connection.run_pipeline = AsyncMock(
+        return_value=[
+            SimpleNamespace(rows=[(1,)], error=None),
+            SimpleNamespace(rows=None, error=_Error("ORA-00942: table or view does not exist", code=942)),
+            SimpleNamespace(rows=None, error=None),
+        ]
+    )
+    config = AsyncOracleDatabaseConfig(pool_instance=MagicMock())
+
+    results = await config.run_statements(
+        ["select 1 from dual", ("select * from missing where id = :1", [1]), "update t set x = 1"],
+        connection=connection,
+    )
+
+    assert [result.rows for result in results] == [[(1,)], None, None]
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, DatabaseError)
+    with pytest.raises(DatabaseError, match="ORA-00942"):
+        results[1].unwrap()
+    pipeline = connection.run_pipeline.await_args.args[0]
+    assert [op.statement for op in pipeline.operations] == [
+        "select 1 from dual",
+        "select * from missing where id = :1",
+        "update t set x = 1",
+    ]
+    connection.commit.assert_not_called()
+
+
+async def test_fans_out_when_the_database_cannot_pipeline() -> None:
+    active = peak = 0
+
+    async def fetchall(sql: str, parameters: Any) -> list[Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if sql == "select boom from dual":
+            raise DatabaseError("ORA-00904: invalid identifier")
+        return [(parameters,)]
+
+    connection = MagicMock(spec=AsyncConnection)
+    connection.version = "19.24.0.0.0"
+    connection.fetchall = AsyncMock(side_effect=fetchall)
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = connection
+    config = AsyncOracleDatabaseConfig(pool_instance=pool)
+
+    statements = [("select :1 from dual", [i]) for i in range(5)] + ["select boom from dual"]
+    results = await config.run_statements(statements, max_concurrency=2)
+
+    assert [result.rows for result in results[:5]] == [[([i],)] for i in range(5)]
+    assert isinstance(results[5].error, DatabaseError)
+    assert peak == 2
+    connection.run_pipeline.assert_not_called()
+
+
+async def test_auto_keeps_the_transaction_of_other_statements() -> None:
+    pool = FakeAsyncConnectionPool(version="19.24.0.0.0")
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool())
+    statements = ["update t set x = 1", "select 1 from dual"]
+
+    results = await config.run_statements(statements)
+
+    assert [result.ok for result in results] == [True, True]
+    assert [call.name for call in pool.calls] == ["acquire", "execute", "execute", "commit", "close"]
+    with pytest.raises(ValueError, match="commit_each"):
+        await config.run_statements(statements, mode="fan-out")
+    await config.run_statements(statements, mode="fan-out", commit_each=True)
+    assert pool.count("acquire") == 3
+    assert pool.count("commit") == 2
+
+
+async def test_auto_reads_the_writes_of_the_given_connection() -> None:
+    pool = FakeAsyncConnectionPool(version="19.24.0.0.0")
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool())
+    connection = await pool.as_pool().acquire()
+    await connection.execute("insert into t values (1)")
+
+    results = await config.run_statements(["select count(*) from t", "select 1 from dual"], connection=connection)
+
+    assert [result.ok for result in results] == [True, True]
+    assert pool.count("acquire") == 1
+    assert [call.name for call in pool.calls] == ["acquire", "execute", "execute", "execute"]
+    assert {call.session for call in pool.calls} == {pool.calls[0].session}
+
+
+async def test_fans_out_within_the_limits_of_the_request() -> None:
+    metrics = InMemoryPoolMetrics()
+    limiter = ConnectionLimiter(max_connections=2, max_wait=0.01, key="dependency")
+    pool = FakeAsyncConnectionPool()
+    pool.script(re.compile("select"), [(1,)], latency=0.05)
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), connection_limiter=limiter, metrics=metrics)
+
+    @get("/")
+    async def handler(request: Request, db_connection: AsyncConnection, fan_out: int) -> int:
+        statements = [("select :1 from dual", [i]) for i in range(3)]
+        return len(
+            await config.run_statements(statements, scope=request.scope, mode="fan-out", max_concurrency=fan_out)
+        )
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/", params={"fan_out": 1})).text == "3"
+        # the request connection and three fanned out connections
+        assert len(metrics.acquire_times[config.pool_app_state_key]) == 4
+        assert len(metrics.checkout_times[config.pool_app_state_key]) == 4
+        # two fanned out connections do not fit next to the request connection
+        assert (await client.get("/", params={"fan_out": 2})).status_code == 503
+
+    assert metrics.rejections[config.pool_app_state_key]["*"] == 1
+
+
+async def test_proxies_see_pipelined_statements() -> None:
+    connection = MagicMock(spec=AsyncConnection)
+    connection.run_pipeline = AsyncMock(
+        return_value=[SimpleNamespace(rows=[(1,)], error=None), SimpleNamespace(rows=None, error=None)]
+    )
+    metrics = InMemoryPoolMetrics()
+    cache = RequestCache()
+    cache.set("key", None, [(0,)])
+    proxy = InstrumentedAsyncConnection(
+        cast("AsyncConnection", CachingAsyncConnection(connection, cache)), StatementRecorder("db_pool", metrics)
+    )
+
+    await run_pipelined(cast("AsyncConnection", proxy), ["select 1 from dual", "update t set x = 1"])
+
+    assert len(cache) == 0
+    assert [(statement.sql, statement.operation, statement.rows) for statement in metrics.statements["db_pool"]] == [
+        ("select 1 from dual", "pipeline", 1),
+        ("update t set x = 1", "pipeline", 0),
+    ]
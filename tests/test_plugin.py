@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from contextlib import asynccontextmanager
 from functools import partial
 from typing import Any, AsyncGenerator
@@ -8,7 +10,8 @@ from litestar.exceptions import HTTPException
 from litestar.testing import create_async_test_client
 from oracledb import AsyncConnection, Connection
 
-from litestar_oracledb import OracleDatabasePlugin
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.testing import FakeAsyncConnectionPool
 
 pytestmark = pytest.mark.anyio
 
@@ -45,3 +48,44 @@ async def test_lifespan(plugin: OracleDatabasePlugin, oracle_service: None) -> N
         # assert async_r.status_code == 200
         sync_r = await client.get("/sync/")
         assert sync_r.status_code == 200
+
+
+async def test_before_send_dispatches_to_configs_with_a_connection() -> None:
+    primary_pool, reporting_pool = FakeAsyncConnectionPool(), FakeAsyncConnectionPool()
+    primary = AsyncOracleDatabaseConfig(pool_instance=primary_pool.as_pool(), before_send_handler="autocommit")
+    reporting = AsyncOracleDatabaseConfig(
+        pool_instance=reporting_pool.as_pool(),
+        pool_app_state_key="reporting_pool",
+        pool_dependency_key="reporting_pool",
+        connection_dependency_key="reporting_connection",
+        connection_scope_key="reporting_connection",
+    )
+    seen: list[str] = []
+    custom = AsyncOracleDatabaseConfig(
+        pool_instance=FakeAsyncConnectionPool().as_pool(),
+        pool_app_state_key="custom_pool",
+        pool_dependency_key="custom_pool",
+        connection_dependency_key="custom_connection",
+        connection_scope_key="custom_connection",
+        before_send_handler=lambda message, scope: seen.append(message["type"]),
+    )
+    assert custom.before_send_scope_keys is None
+
+    @get("/primary")
+    async def use_primary(db_connection: AsyncConnection) -> str:
+        return "ok"
+
+    @get("/none", sync_to_thread=False)
+    def use_none() -> str:
+        return "ok"
+
+    async with create_async_test_client(
+        route_handlers=[use_primary, use_none], plugins=[OracleDatabasePlugin([primary, reporting, custom])]
+    ) as client:
+        assert len(client.app.before_send) == 1
+        assert (await client.get("/primary")).status_code == 200
+        assert (await client.get("/none")).status_code == 200
+
+    assert [call.name for call in primary_pool.calls] == ["acquire", "commit", "close"]
+    assert reporting_pool.calls == []
+    assert seen == ["http.response.start", "http.response.body"] * 2
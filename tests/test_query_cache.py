@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import oracledb
+import pytest
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.stores.memory import MemoryStore
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, Connection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.cache import CacheBackend, MemoryCacheBackend, QueryCache, StoreCacheBackend, referenced_tables
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_memory_backend_lru_and_ttl() -> None:
+    backend = MemoryCacheBackend(max_bytes=10)
+    await backend.set("a", b"12345", None)
+    await backend.set("b", b"12345", None)
+    assert await backend.get("a") == b"12345"
+    await backend.set("c", b"12345", None)
+    assert await backend.get("b") is None
+    assert backend.size == 10
+
+    await backend.set("d", b"1", -1)
+    assert await backend.get("d") is None
+
+
+def test_referenced_tables() -> None:
+    sql = 'select * from hr.countries c join "HR"."regions" r on r.id = c.region_id'
+    assert referenced_tables(sql) == {"COUNTRIES", "REGIONS"}
+
+
+@pytest.mark.parametrize("backend", [None, StoreCacheBackend(MemoryStore())])
+async def test_query_cache_invalidate(backend: StoreCacheBackend | None) -> None:
+    cache = QueryCache(backend=backend)
+    load = AsyncMock(side_effect=[[(1, "FR")], [(1, "FR"), (2, "DE")]])
+    sql = "select id, code from countries where active = :active"
+
+    assert await cache.fetch(sql, {"active": 1}, load) == [(1, "FR")]
+    assert await cache.fetch(sql, {"active": 1}, load) == [(1, "FR")]
+    await cache.invalidate(["HR.COUNTRIES"])
+    assert await cache.fetch(sql, {"active": 1}, load) == [(1, "FR"), (2, "DE")]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_query_cache_forgets_evicted_entries() -> None:
+    backend = MemoryCacheBackend()
+    cache = QueryCache(backend=backend, ttl=60)
+    load = AsyncMock(return_value=[(1, "FR")])
+
+    await cache.fetch("select * from countries where id = 1", None, load)
+    backend.max_bytes = backend.size * 2
+    await cache.fetch("select * from regions", None, load, ttl=-1)
+    await cache.fetch("select * from countries where id = 2", None, load)
+    await cache.fetch("select * from currencies", None, load)
+
+    # the first entry was evicted to make room and the regions entry has expired
+    assert cache._tables == {
+        "COUNTRIES": {QueryCache.key("select * from countries where id = 2")},
+        "CURRENCIES": {QueryCache.key("select * from currencies")},
+    }
+
+
+async def test_query_cache_skips_results_invalidated_while_loading() -> None:
+    cache = QueryCache()
+    sql = "select code from countries"
+
+    async def load() -> list[Any]:
+        await cache.invalidate(["COUNTRIES"])
+        return [("FR",)]
+
+    assert await cache.fetch(sql, None, load) == [("FR",)]
+    assert await cache.backend.get(QueryCache.key(sql)) is None
+    assert await cache.fetch(sql, None, AsyncMock(return_value=[("DE",)])) == [("DE",)]
+    assert await cache.fetch(sql, None, load) == [("DE",)]
+
+
+async def test_query_cache_bypasses_unhashable_binds() -> None:
+    cache = QueryCache()
+    load = AsyncMock(return_value=[(1,)])
+    sql = "select id from files where digest = :digest"
+
+    assert await cache.fetch(sql, {"digest": bytearray(b"ab")}, load) == [(1,)]
+    assert await cache.fetch(sql, {"digest": bytearray(b"ab")}, load) == [(1,)]
+    assert load.await_count == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_cache_backend_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        CacheBackend()  # type: ignore[abstract]
+
+
+async def test_cached_fetchall_uses_pool_on_miss() -> None:
+    connection = MagicMock(spec=AsyncConnection)
+    connection.fetchall = AsyncMock(return_value=[("FR",)])
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = connection
+    config = AsyncOracleDatabaseConfig(pool_instance=pool, query_cache=QueryCache())
+
+    assert await config.cached_fetchall("select code from countries") == [("FR",)]
+    assert await config.cached_fetchall("select code from countries") == [("FR",)]
+    connection.fetchall.assert_awaited_once_with("select code from countries", None)
+
+    with pytest.raises(ImproperlyConfiguredException):
+        AsyncOracleDatabaseConfig(query_cache=QueryCache(), query_cache_tables=["countries"])
+
+
+async def test_sync_lifespan_subscribes_to_table_changes() -> None:
+    subscription = MagicMock()
+    connection = MagicMock(spec=Connection)
+    connection.subscribe.return_value = subscription
+    pool = MagicMock()
+    pool.max = 2
+    pool.acquire.return_value = connection
+    query_cache = QueryCache()
+    await query_cache.fetch("select * from countries", None, AsyncMock(return_value=[("FR",)]))
+    config = SyncOracleDatabaseConfig(pool_instance=pool, query_cache=query_cache, query_cache_tables=["countries"])
+
+    async with create_async_test_client(route_handlers=[], plugins=[OracleDatabasePlugin(config)]):
+        subscription.registerquery.assert_called_once_with("select * from countries")
+        callback = connection.subscribe.call_args.kwargs["callback"]
+        message = SimpleNamespace(type=oracledb.EVENT_OBJCHANGE, tables=[SimpleNamespace(name="HR.COUNTRIES")])
+        await asyncio.get_running_loop().run_in_executor(None, callback, message)
+        await asyncio.sleep(0.01)
+        assert await query_cache.backend.get(QueryCache.key("select * from countries")) is None
+
+    connection.unsubscribe.assert_called_once_with(subscription)
+    pool.release.assert_called_once_with(connection)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import AsyncGenerator
+
+import pytest
+from litestar import Request, get
+from litestar.response import Stream
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.testing import FakeAsyncConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+
+def _names(pool: FakeAsyncConnectionPool) -> list[str]:
+    return [call.name for call in pool.calls]
+
+
+async def test_autocommit_on_response_start() -> None:
+    pool = FakeAsyncConnectionPool()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), before_send_handler="autocommit")
+    seen: list[list[str]] = []
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> str:
+        seen.append(_names(pool))
+        return "ok"
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).status_code == 200
+
+    assert seen == [["acquire"]]
+    assert _names(pool) == ["acquire", "commit", "close"]
+
+
+async def test_release_on_handler_return() -> None:
+    pool = FakeAsyncConnectionPool()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), release_mode="handler")
+    seen: list[list[str]] = []
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> Stream:
+        async def body() -> AsyncGenerator[str, None]:
+            seen.append(_names(pool))
+            yield "chunk"
+
+        return Stream(body())
+
+    @get("/error")
+    async def error(db_connection: AsyncConnection) -> None:
+        raise ValueError
+
+    async with create_async_test_client(
+        route_handlers=[handler, error], plugins=[OracleDatabasePlugin(config)]
+    ) as client:
+        assert (await client.get("/")).status_code == 200
+        assert seen == [["acquire", "commit", "close"]]
+        pool.calls.clear()
+        assert (await client.get("/error")).status_code == 500
+        assert _names(pool) == ["acquire", "rollback", "close"]
+
+
+async def test_release_connection_detaches_from_scope() -> None:
+    pool = FakeAsyncConnectionPool()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), before_send_handler="autocommit")
+
+    @get("/")
+    async def handler(request: Request, db_connection: AsyncConnection) -> str:
+        await config.release_connection(request.scope, commit=False)
+        return "ok"
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).status_code == 200
+
+    assert _names(pool) == ["acquire", "rollback", "close"]
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar import Request, get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, AsyncCursor, Connection, Cursor
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.cache import CachingConnection, RequestCache, is_cacheable_query
+from litestar_oracledb.metrics import InMemoryPoolMetrics
+
+pytestmark = pytest.mark.anyio
+
+
+def test_is_cacheable_query() -> None:
+    assert is_cacheable_query("/* lookup */ select * from users")
+    assert is_cacheable_query("WITH t AS (SELECT 1 FROM dual) SELECT * FROM t")
+    assert not is_cacheable_query("select * from users for update")
+    assert not is_cacheable_query("update users set name = :name")
+
+
+def test_sync_cursor_replays_cached_rows() -> None:
+    cursor = MagicMock(spec=Cursor)
+    cursor.rowfactory = None
+    cursor.arraysize = 2
+    cursor.description = [("ID",)]
+    cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)]]
+    connection = MagicMock(spec=Connection)
+    connection.cursor.return_value = cursor
+    cache = RequestCache()
+    cached = CachingConnection(connection, cache)
+
+    first = cached.cursor()
+    first.execute("select id from users where team = :team", team=1)
+    assert [*first.fetchmany(), *first.fetchmany()] == [(1,), (2,), (3,)]
+
+    second = cached.cursor()
+    second.execute("select id from users where team = :team", team=1)
+    assert list(second) == [(1,), (2,), (3,)]
+    assert second.description == [("ID",)]
+    assert cursor.execute.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    second.execute("select id from users where team = :team", team=2)
+    assert cursor.execute.call_count == 2
+
+
+async def test_request_cache_invalidated_by_dml() -> None:
+    cursor = MagicMock(spec=AsyncCursor)
+    cursor.rowfactory = None
+    cursor.description = [("NAME",)]
+    cursor.execute = AsyncMock()
+    cursor.fetchall = AsyncMock(return_value=[("ada",)])
+    connection = MagicMock(spec=AsyncConnection)
+    connection.cursor.return_value = cursor
+    connection.close = AsyncMock()
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=connection)
+    pool.close = AsyncMock()
+    metrics = InMemoryPoolMetrics()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool, request_cache=True, metrics=metrics)
+
+    async def lookup(db_connection: AsyncConnection) -> list[tuple[str]]:
+        with db_connection.cursor() as cursor:
+            await cursor.execute("select name from users where id = :id", [1])
+            rows: list[tuple[str]] = await cursor.fetchall()
+            return rows
+
+    @get("/")
+    async def handler(request: Request, db_connection: AsyncConnection) -> dict[str, int]:
+        assert await lookup(db_connection) == await lookup(db_connection) == [("ada",)]
+        with db_connection.cursor() as cursor:
+            await cursor.execute("update users set seen = sysdate where id = :id", [1])
+        await lookup(db_connection)
+        cache = config.get_request_cache(request.scope)
+        assert cache is not None
+        return {"hits": cache.hits, "misses": cache.misses}
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).json() == {"hits": 1, "misses": 2}
+
+    assert cursor.execute.await_count == 3
+    assert (metrics.cache_hits[config.pool_app_state_key], metrics.cache_misses[config.pool_app_state_key]) == (1, 2)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import oracledb
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, Connection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.retry import RetryingConnection, RetryPolicy, is_idempotent
+
+pytestmark = pytest.mark.anyio
+
+
+def _lost() -> oracledb.Error:
+    return oracledb.OperationalError(SimpleNamespace(full_code="DPY-4011", message="DPY-4011: connection closed"))
+
+
+def test_idempotent_statements() -> None:
+    assert is_idempotent("select * from t")
+    assert not is_idempotent("select * from t for update")
+    assert not is_idempotent("update t set x = 1")
+    assert is_idempotent("/* idempotent */ merge into t using dual on (1 = 1) when matched then update set x = 1")
+
+
+def _async_pool(*connections: MagicMock) -> MagicMock:
+    pool = MagicMock()
+    pool.acquire = AsyncMock(side_effect=connections)
+    pool.drop = AsyncMock()
+    pool.close = AsyncMock()
+    return pool
+
+
+def _async_connection(**methods: AsyncMock) -> MagicMock:
+    connection = MagicMock(spec=AsyncConnection)
+    for name, method in methods.items():
+        setattr(connection, name, method)
+    return connection
+
+
+async def test_replays_reads_on_a_new_connection() -> None:
+    lost = _async_connection(fetchall=AsyncMock(side_effect=_lost()))
+    replacement = _async_connection(fetchall=AsyncMock(return_value=[(1,)]))
+    pool = _async_pool(lost, replacement)
+    config = AsyncOracleDatabaseConfig(pool_instance=pool, retry_policy=RetryPolicy(backoff=0))
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> list:
+        db_connection.module = "reports"
+        return await db_connection.fetchall("select 1 from dual")
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/")
+
+    assert response.json() == [[1]]
+    pool.drop.assert_awaited_once_with(lost)
+    assert replacement.module == "reports"
+    replacement.close.assert_awaited_once()
+    lost.close.assert_not_awaited()
+
+
+async def test_does_not_replay_after_a_write() -> None:
+    lost = _async_connection(fetchall=AsyncMock(side_effect=_lost()))
+    pool = _async_pool(lost, _async_connection())
+    config = AsyncOracleDatabaseConfig(pool_instance=pool, retry_policy=RetryPolicy(backoff=0))
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> list:
+        await db_connection.execute("update t set x = 1")
+        return await db_connection.fetchall("select x from t")
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).status_code == 500
+
+    pool.drop.assert_not_awaited()
+
+
+def test_sync_cursor_is_reopened_with_its_settings() -> None:
+    lost = MagicMock(spec=Connection)
+    lost.cursor.return_value.execute.side_effect = _lost()
+    replacement = MagicMock(spec=Connection)
+    replacement.cursor.return_value.fetchall.return_value = [(1,)]
+    reconnect = MagicMock(return_value=replacement)
+    connection = RetryingConnection(lost, RetryPolicy(backoff=0), reconnect)
+
+    with connection.cursor() as cursor:
+        cursor.arraysize = 500
+        cursor.execute("select 1 from dual")
+        assert cursor.fetchall() == [(1,)]
+
+    reconnect.assert_called_once_with(lost)
+    assert replacement.cursor.return_value.arraysize == 500
+
+
+def test_gives_up_after_the_last_attempt() -> None:
+    lost = MagicMock(spec=Connection)
+    lost.cursor.return_value.execute.side_effect = _lost()
+    reconnect = MagicMock(return_value=lost)
+    connection = RetryingConnection(lost, RetryPolicy(attempts=2, backoff=0), reconnect)
+
+    with pytest.raises(oracledb.OperationalError):
+        connection.cursor().execute("select 1 from dual")
+    assert reconnect.call_count == 1
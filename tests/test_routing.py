@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+from litestar import get, post
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, AsyncRoutingDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.breaker import CircuitBreaker
+from litestar_oracledb.metrics import InMemoryPoolMetrics
+from litestar_oracledb.testing import FakeAsyncConnectionPool, oracle_error
+
+pytestmark = pytest.mark.anyio
+
+
+@get("/read")
+async def read(db_connection: AsyncConnection) -> str:
+    return "ok"
+
+
+@get("/read-own-writes", opt={"db": "write"})
+async def read_own_writes(db_connection: AsyncConnection) -> str:
+    return "ok"
+
+
+@post("/write")
+async def write(db_connection: AsyncConnection) -> str:
+    return "ok"
+
+
+async def test_routes_reads_to_replica() -> None:
+    primary_pool, replica_pool = FakeAsyncConnectionPool(), FakeAsyncConnectionPool()
+    primary = AsyncOracleDatabaseConfig(pool_instance=primary_pool.as_pool())
+    replica = AsyncOracleDatabaseConfig(pool_instance=replica_pool.as_pool())
+    config = AsyncRoutingDatabaseConfig(primary=primary, replicas=[replica], pool_header="X-Database-Pool")
+
+    async with create_async_test_client(
+        route_handlers=[read, read_own_writes, write], plugins=[OracleDatabasePlugin(config)]
+    ) as client:
+        assert (await client.get("/read")).headers["x-database-pool"] == replica.pool_app_state_key
+        assert (await client.get("/read-own-writes")).headers["x-database-pool"] == primary.pool_app_state_key
+        assert (await client.post("/write")).headers["x-database-pool"] == primary.pool_app_state_key
+
+    assert replica_pool.count("acquire") == 1
+    assert primary_pool.count("acquire") == 2
+
+
+async def test_falls_back_to_primary_when_replica_fails() -> None:
+    metrics = InMemoryPoolMetrics()
+    primary = AsyncOracleDatabaseConfig(pool_instance=FakeAsyncConnectionPool().as_pool(), metrics=metrics)
+    replica_pool = FakeAsyncConnectionPool()
+    replica_pool.fail_acquire()  # only the first acquire fails: the replica must not be tried again
+    replica = AsyncOracleDatabaseConfig(pool_instance=replica_pool.as_pool())
+    config = AsyncRoutingDatabaseConfig(primary=primary, replicas=[replica], pool_header="X-Database-Pool")
+
+    async with create_async_test_client(route_handlers=[read], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/read")).headers["x-database-pool"] == primary.pool_app_state_key
+        assert (await client.get("/read")).headers["x-database-pool"] == primary.pool_app_state_key
+
+    assert replica_pool.count("acquire") == 0
+    assert metrics.fallbacks[primary.pool_app_state_key] == 2
+
+
+async def test_falls_back_to_primary_when_replica_circuit_is_open() -> None:
+    primary = AsyncOracleDatabaseConfig(pool_instance=FakeAsyncConnectionPool().as_pool())
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(oracle_error("DPY-6005", "cannot connect to database"))
+    replica_pool = FakeAsyncConnectionPool()
+    replica = AsyncOracleDatabaseConfig(pool_instance=replica_pool.as_pool(), circuit_breaker=breaker)
+    config = AsyncRoutingDatabaseConfig(primary=primary, replicas=[replica], pool_header="X-Database-Pool")
+
+    async with create_async_test_client(route_handlers=[read], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/read")
+
+    assert response.status_code == 200
+    assert response.headers["x-database-pool"] == primary.pool_app_state_key
+    assert replica_pool.count("acquire") == 0
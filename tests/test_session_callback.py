@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, Connection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+
+if TYPE_CHECKING:
+    from litestar.types import Scope
+
+pytestmark = pytest.mark.anyio
+
+
+def test_session_callback_installed_on_pool() -> None:
+    calls: list[tuple[Connection, str | None]] = []
+    pool = MagicMock()
+    pool.max = 2
+    SyncOracleDatabaseConfig(pool_instance=pool, session_callback=lambda c, tag: calls.append((c, tag)))
+
+    connection = MagicMock(spec=Connection)
+    pool.session_callback(connection, "NLS_DATE_FORMAT=ISO")
+
+    assert calls == [(connection, "NLS_DATE_FORMAT=ISO")]
+    assert connection.tag == "NLS_DATE_FORMAT=ISO"
+
+
+async def test_session_tag_per_route() -> None:
+    connection = MagicMock(spec=AsyncConnection)
+    connection.close = AsyncMock()
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=connection)
+    pool.close = AsyncMock()
+
+    def tag_for(scope: Scope) -> str | None:
+        return "REPORTS=1" if scope["path"].startswith("/reports") else None
+
+    config = AsyncOracleDatabaseConfig(pool_instance=pool, session_tag=tag_for, session_matchanytag=True)
+
+    @get("/reports")
+    async def reports(db_connection: AsyncConnection) -> str:
+        return "ok"
+
+    @get("/users")
+    async def users(db_connection: AsyncConnection) -> str:
+        return "ok"
+
+    async with create_async_test_client(
+        route_handlers=[reports, users], plugins=[OracleDatabasePlugin(config)]
+    ) as client:
+        assert (await client.get("/reports")).status_code == 200
+        pool.acquire.assert_awaited_with(tag="REPORTS=1", matchanytag=True)
+        assert (await client.get("/users")).status_code == 200
+        pool.acquire.assert_awaited_with()
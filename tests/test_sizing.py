@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.testing import create_async_test_client
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.metrics import InMemoryPoolMetrics
+from litestar_oracledb.sizing import PoolResize, PoolSizer
+
+pytestmark = pytest.mark.anyio
+
+
+def test_sizer_waits_for_a_stable_signal() -> None:
+    sizer = PoolSizer(min_size=2, max_size=8, step=2, stable_intervals=2, cooldown_intervals=1)
+
+    assert sizer.decide(busy=4, size=4) is None
+    assert sizer.decide(busy=4, size=4) == PoolResize(4, 6, "busy")
+    sizer.observe_acquire(0.5)
+    assert sizer.decide(busy=1, size=6) is None  # cooldown
+    assert sizer.decide(busy=1, size=6) is None
+    assert sizer.decide(busy=1, size=6) == PoolResize(6, 4, "idle")
+
+
+def test_sizer_grows_on_slow_acquires_and_holds_on_errors() -> None:
+    sizer = PoolSizer(min_size=2, max_size=5, step=2, stable_intervals=1)
+    for _ in range(10):
+        sizer.observe_acquire(0.2)
+    assert sizer.decide(busy=2, size=4) == PoolResize(4, 5, "wait")
+
+    sizer = PoolSizer(stable_intervals=1)
+    sizer.observe_acquire(0.2)
+    sizer.observe_error()
+    assert sizer.decide(busy=4, size=4) is None
+
+
+async def test_sync_config_reconfigures_the_pool() -> None:
+    pool = MagicMock()
+    pool.min, pool.max, pool.busy = 1, 4, 4
+    metrics = InMemoryPoolMetrics()
+    sizer = PoolSizer(interval=0.01, stable_intervals=1, max_size=6)
+    config = SyncOracleDatabaseConfig(pool_instance=pool, pool_sizer=sizer, metrics=metrics)
+
+    async with create_async_test_client(route_handlers=[], plugins=[OracleDatabasePlugin(config)]):
+        for _ in range(100):
+            if metrics.resizes:
+                break
+            await asyncio.sleep(0.01)
+
+    pool.reconfigure.assert_any_call(min=1, max=6)
+    assert metrics.resizes[config.pool_app_state_key][0] == PoolResize(4, 6, "busy")
+
+
+def test_async_config_rejects_pool_sizer() -> None:
+    with pytest.raises(ImproperlyConfiguredException, match="pool_sizer"):
+        AsyncOracleDatabaseConfig(pool_instance=MagicMock(), pool_sizer=PoolSizer())
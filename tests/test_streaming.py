@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from litestar import get
+from litestar.response import Stream
+from litestar.testing import create_async_test_client
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin
+from litestar_oracledb.streaming import RowEncoder, stream_rows
+from litestar_oracledb.testing import FakeAsyncConnectionPool
+
+pytestmark = pytest.mark.anyio
+
+ROWS = [(1, "ada"), (2, "grace"), (3, "linus")]
+SQL = "select id, name from users where id > :id"
+
+
+def _pool() -> FakeAsyncConnectionPool:
+    pool = FakeAsyncConnectionPool()
+    pool.script(SQL, ROWS, columns=("ID", "NAME"))
+    return pool
+
+
+def test_json_encoder_produces_a_single_array() -> None:
+    encoder = RowEncoder("json", ["ID", "NAME"])
+    body = encoder.start() + encoder.encode(ROWS[:2]) + encoder.encode([]) + encoder.encode(ROWS[2:]) + encoder.end()
+    assert json.loads(body) == [{"ID": 1, "NAME": "ada"}, {"ID": 2, "NAME": "grace"}, {"ID": 3, "NAME": "linus"}]
+
+
+@pytest.mark.parametrize(
+    ("stream_format", "media_type", "expected"),
+    [
+        ("ndjson", "application/x-ndjson", '{"ID":1,"NAME":"ada"}\n{"ID":2,"NAME":"grace"}\n{"ID":3,"NAME":"linus"}\n'),
+        ("csv", "text/csv; charset=utf-8", "ID,NAME\r\n1,ada\r\n2,grace\r\n3,linus\r\n"),
+    ],
+)
+async def test_stream_query(stream_format: str, media_type: str, expected: str) -> None:
+    pool = _pool()
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool())
+
+    @get("/export")
+    async def export() -> Stream:
+        return config.stream_query(
+            SQL,
+            {"id": 0},
+            stream_format=stream_format,  # type: ignore[arg-type]
+            arraysize=2,
+            filename="users",
+        )
+
+    async with create_async_test_client(route_handlers=[export], plugins=[OracleDatabasePlugin(config)]) as client:
+        response = await client.get("/export")
+
+    assert response.status_code == 200
+    assert response.text == expected
+    assert response.headers["content-type"] == media_type
+    assert response.headers["content-disposition"] == 'attachment; filename="users"'
+    assert [(call.name, call.statement, call.parameters) for call in pool.calls[1:]] == [
+        ("execute", SQL, {"id": 0}),
+        ("close", None, None),
+    ]
+
+
+async def test_stream_rows_fetches_arraysize_rows_per_chunk() -> None:
+    async with _pool().as_pool().acquire() as connection:
+        chunks = [chunk async for chunk in stream_rows(connection, SQL, {"id": 0}, "ndjson", arraysize=2)]
+
+    assert chunks == [b"", b'{"ID":1,"NAME":"ada"}\n{"ID":2,"NAME":"grace"}\n', b'{"ID":3,"NAME":"linus"}\n', b""]
+
+
+def test_stream_query_rejects_unknown_format() -> None:
+    config = AsyncOracleDatabaseConfig(pool_instance=FakeAsyncConnectionPool().as_pool())
+    with pytest.raises(ValueError, match="Unsupported stream format"):
+        config.stream_query("select 1 from dual", stream_format="xml")  # type: ignore[arg-type]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, cast
+
+import httpx
+import pytest
+from litestar import get
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, Connection
+
+from litestar_oracledb import (
+    AsyncOracleDatabaseConfig,
+    AsyncOraclePoolConfig,
+    OracleDatabasePlugin,
+    SyncOracleDatabaseConfig,
+)
+from litestar_oracledb.tenancy import TenantRouting
+from litestar_oracledb.testing import FakeAsyncConnectionPool, FakeConnectionPool
+
+if TYPE_CHECKING:
+    from litestar.types import Scope
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_reuses_the_sessions_of_a_tenant() -> None:
+    contexts: list[tuple[int, str | None]] = []
+
+    async def set_context(connection: AsyncConnection, tenant: str | None) -> None:
+        contexts.append((connection.session_id, tenant))
+
+    pool = FakeAsyncConnectionPool(max=2)
+    tenancy = TenantRouting(header="X-Tenant-ID", path_param="tenant", set_context=set_context)
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), tenancy=tenancy)
+
+    @get("/")
+    async def index(db_connection: AsyncConnection) -> int:
+        return db_connection.session_id
+
+    @get("/tenants/{tenant:str}")
+    async def tenant_index(db_connection: AsyncConnection, tenant: str) -> int:
+        return db_connection.session_id
+
+    async with create_async_test_client(
+        route_handlers=[index, tenant_index], plugins=[OracleDatabasePlugin(config)]
+    ) as client:
+        first = int((await client.get("/", headers={"X-Tenant-ID": "acme"})).text)
+        assert int((await client.get("/tenants/acme")).text) == first
+        second = int((await client.get("/", headers={"X-Tenant-ID": "globex"})).text)
+        assert int((await client.get("/")).text) == second
+
+    assert contexts == [(first, "acme"), (second, "globex"), (second, None)]
+    tags = [call.parameters["tag"] for call in pool.calls if call.name == "acquire"]
+    assert tags == ["TENANT=acme", "TENANT=acme", "TENANT=globex", None]
+
+
+async def test_tenant_quota() -> None:
+    release = asyncio.Event()
+    tenancy = TenantRouting(header="X-Tenant-ID", max_connections=1, tenant_limits={"globex": 2}, max_wait=0.05)
+    config = AsyncOracleDatabaseConfig(pool_instance=FakeAsyncConnectionPool(max=4).as_pool(), tenancy=tenancy)
+
+    @get("/")
+    async def handler(db_connection: AsyncConnection) -> None:
+        await release.wait()
+
+    async def request(client: httpx.AsyncClient, tenant: str) -> Any:
+        return await client.get("/", headers={"X-Tenant-ID": tenant})
+
+    async with create_async_test_client(
+        route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]
+    ) as test_client:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=test_client.app), base_url="http://testserver"
+        ) as client:
+            held = [asyncio.ensure_future(request(client, tenant)) for tenant in ("acme", "globex", "globex")]
+            await asyncio.sleep(0.01)
+            rejected = await request(client, "acme")
+            release.set()
+            responses = await asyncio.gather(*held)
+
+    assert rejected.status_code == 503
+    assert "tenant acme" in rejected.text
+    assert [response.status_code for response in responses] == [200, 200, 200]
+
+
+async def test_sync_tenant_quota() -> None:
+    release = threading.Event()
+    tenancy = TenantRouting(header="X-Tenant-ID", max_connections=1, max_wait=0.05)
+    config = SyncOracleDatabaseConfig(pool_instance=FakeConnectionPool(max=4).as_pool(), tenancy=tenancy)
+
+    @get("/", sync_to_thread=True)
+    def handler(db_connection: Connection) -> None:
+        release.wait(5)
+
+    async with create_async_test_client(
+        route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]
+    ) as test_client, httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=test_client.app), base_url="http://testserver"
+    ) as client:
+        held = asyncio.ensure_future(client.get("/", headers={"X-Tenant-ID": "acme"}))
+        await asyncio.sleep(0.05)
+        rejected = await client.get("/", headers={"X-Tenant-ID": "acme"})
+        other = asyncio.ensure_future(client.get("/", headers={"X-Tenant-ID": "globex"}))
+        await asyncio.sleep(0.05)
+        release.set()
+        responses = await asyncio.gather(held, other)
+
+    assert rejected.status_code == 503
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+def test_configuration() -> None:
+    pool_config = AsyncOraclePoolConfig(dsn="dbhost/orclpdb", user="app_proxy")
+    config = AsyncOracleDatabaseConfig(
+        pool_config=pool_config, tenancy=TenantRouting(header="X-Tenant-ID", proxy_user="app_proxy[{tenant}]")
+    )
+    assert pool_config.homogeneous is False
+    scope = cast("Scope", {"type": "http", "headers": [(b"x-tenant-id", b"acme")]})
+    assert config._acquire_kwargs(scope) == {
+        "tag": "TENANT=acme",
+        "matchanytag": True,
+        "user": "app_proxy[acme]",
+    }
+
+    with pytest.raises(ImproperlyConfiguredException, match="homogeneous"):
+        AsyncOracleDatabaseConfig(
+            pool_config=AsyncOraclePoolConfig(dsn="dbhost/orclpdb", homogeneous=True),
+            tenancy=TenantRouting(proxy_user="app_proxy[{tenant}]"),
+        )
+    with pytest.raises(ImproperlyConfiguredException, match="session_tag"):
+        AsyncOracleDatabaseConfig(session_tag="NLS=ISO", tenancy=TenantRouting(header="X-Tenant-ID"))
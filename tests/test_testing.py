@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import re
+
+import oracledb
+import pytest
+from litestar import get, post
+from litestar.testing import create_async_test_client
+from oracledb import AsyncConnection, AsyncConnectionPool, Connection
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.breaker import is_connection_error
+from litestar_oracledb.testing import FakeAsyncConnectionPool, FakeConnectionPool, oracle_error
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_async_pool_with_plugin() -> None:
+    pool = FakeAsyncConnectionPool()
+    pool.script("select name from users where id = :id", lambda parameters: [(f"user {parameters['id']}",)])
+    pool.script(re.compile(r"^insert into users"), error=oracle_error("ORA-00001", "unique constraint violated"))
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), before_send_handler="autocommit")
+
+    @get("/{user_id:int}")
+    async def read(db_connection: AsyncConnection, db_pool: AsyncConnectionPool, user_id: int) -> str:
+        rows = await db_connection.fetchall("select name\n  from users where id = :id", {"id": user_id})
+        return str(rows[0][0])
+
+    @post("/")
+    async def create(db_connection: AsyncConnection) -> None:
+        await db_connection.execute("insert into users (name) values ('Ada')")
+
+    async with create_async_test_client(
+        route_handlers=[read, create], plugins=[OracleDatabasePlugin(config)]
+    ) as client:
+        assert (await client.get("/7")).text == "user 7"
+        assert (await client.post("/")).status_code == 500
+
+    assert [call.name for call in pool.calls if call.name != "execute"] == [
+        "acquire",
+        "commit",
+        "close",
+        "acquire",
+        "rollback",
+        "close",
+    ]
+    assert pool.calls[1].parameters == {"id": 7}
+    assert len({call.session for call in pool.calls}) == 1
+    assert pool.busy == 0
+
+
+async def test_sync_pool_with_plugin() -> None:
+    pool = FakeConnectionPool(min=1)
+    pool.script("select 1 from dual", [(1,)])
+    config = SyncOracleDatabaseConfig(pool_instance=pool.as_pool(), before_send_handler="autocommit")
+
+    @get("/", sync_to_thread=False)
+    def handler(db_connection: Connection) -> int:
+        with db_connection.cursor() as cursor:
+            cursor.execute("select 1 from dual")
+            return int(cursor.fetchone()[0])
+
+    async with create_async_test_client(route_handlers=[handler], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert (await client.get("/")).text == "1"
+
+    assert pool.count("commit") == pool.count("close") == 1
+    assert pool.opened == 0  # closed with the application
+
+
+async def test_acquire_contention() -> None:
+    pool = FakeAsyncConnectionPool(max=1, getmode=oracledb.POOL_GETMODE_TIMEDWAIT, wait_timeout=20)
+    connection = await pool.acquire()
+    session = connection.session_id
+    with pytest.raises(oracledb.DatabaseError, match="DPY-4005"):
+        await pool.acquire()
+
+    waiting = asyncio.ensure_future(pool.acquire())
+    await pool.release(connection)
+    assert (await waiting).session_id == session
+    assert pool.peak_busy == 1
+
+    sync_pool = FakeConnectionPool(max=1, getmode=oracledb.POOL_GETMODE_NOWAIT)
+    with sync_pool.acquire():
+        with pytest.raises(oracledb.DatabaseError, match="DPY-4005"):
+            sync_pool.acquire()
+    assert sync_pool.busy == 0
+
+
+async def test_failure_injection_and_session_callback() -> None:
+    seen: list[str | None] = []
+    pool = FakeConnectionPool(max=1, session_callback=lambda connection, tag: seen.append(tag))
+
+    pool.fail_acquire(times=1)
+    with pytest.raises(oracledb.Error) as exc_info:
+        pool.acquire()
+    assert is_connection_error(exc_info.value)
+
+    with pool.acquire(tag="tenant=a") as connection:
+        connection.module = "reports"
+        connection.tag = "tenant=a"
+    with pool.acquire(tag="tenant=a") as connection:
+        assert connection.module == "reports"
+        first = connection.session_id
+    with pool.acquire(tag="tenant=b") as connection:
+        connection.tag = "tenant=b"
+    assert seen == ["tenant=a", "tenant=b"]
+
+    pool.disconnect()
+    with pool.acquire(tag="tenant=b") as connection:
+        assert connection.session_id != first
+        connection.disconnect()
+        with pytest.raises(oracledb.OperationalError, match="DPY-4011"):
+            connection.commit()
+    assert pool.opened == 0
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+from litestar import get
+from litestar.testing import create_async_test_client
+
+from litestar_oracledb import AsyncOracleDatabaseConfig, OracleDatabasePlugin, SyncOracleDatabaseConfig
+from litestar_oracledb.testing import FakeAsyncConnectionPool, FakeConnectionPool, oracle_error
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_warmup_holds_startup() -> None:
+    pool = FakeAsyncConnectionPool(min=3)
+    config = AsyncOracleDatabaseConfig(pool_instance=pool.as_pool(), warmup=True, warmup_statement="select 1 from dual")
+
+    @get("/ready")
+    async def ready() -> bool:
+        return config.pool_ready
+
+    async with create_async_test_client(route_handlers=[ready], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert pool.count("acquire") == pool.count("release") == 3
+        assert len({call.session for call in pool.calls}) == 3
+        assert [call.statement for call in pool.calls if call.name == "execute"] == ["select 1 from dual"] * 3
+        assert (await client.get("/ready")).json() is True
+
+    assert config.pool_ready is False
+
+
+async def test_background_warmup() -> None:
+    # the lifespan runs on the event loop of the portal thread of the test client, where ``release`` is set
+    started = threading.Event()
+    release = asyncio.Event()
+
+    async def connect(connection: Any, tag: str | None) -> None:
+        started.set()
+        await release.wait()
+
+    pool = FakeAsyncConnectionPool(session_callback=connect)
+    config = AsyncOracleDatabaseConfig(
+        pool_instance=pool.as_pool(), warmup=True, warmup_connections=2, warmup_blocking=False
+    )
+
+    def ready() -> bool:
+        return config.pool_ready
+
+    async with create_async_test_client(route_handlers=[], plugins=[OracleDatabasePlugin(config)]) as client:
+        assert started.wait(1)
+        assert not ready()
+        client.blocking_portal.call(release.set)
+        for _ in range(100):
+            if ready():
+                break
+            await asyncio.sleep(0.01)
+        assert ready()
+        assert pool.count("release") == 2
+
+
+async def test_sync_warmup_releases_failed_connections() -> None:
+    pool = FakeConnectionPool(max=2)
+    pool.script("x", error=oracle_error("ORA-00942", "table or view does not exist"), times=1)
+    config = SyncOracleDatabaseConfig(
+        pool_instance=pool.as_pool(), warmup=True, warmup_connections=2, warmup_statement="x"
+    )
+
+    async with create_async_test_client(route_handlers=[], plugins=[OracleDatabasePlugin(config)]):
+        assert pool.count("acquire") == pool.count("release") == 2
+        assert config.pool_ready is True